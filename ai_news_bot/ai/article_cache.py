@@ -0,0 +1,104 @@
+"""Full article text cached by link, prefetched for relevant news."""
+import json
+import logging
+import zlib
+from functools import partial
+
+from pydantic import BaseModel
+
+from ai_news_bot.ai.articles import article_extractor
+from ai_news_bot.ai.links import normalize_link
+from ai_news_bot.db.crud.article_cache import crud_article_cache
+from ai_news_bot.db.dependencies import get_standalone_session
+from ai_news_bot.db.writer import db_writer
+from ai_news_bot.services.cache import LRUCache
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CachedArticle(BaseModel):
+    """The parts of an extracted article needed for translation."""
+
+    url: str
+    title: str
+    text: str
+
+
+# Extracted articles by normalized link.
+articles: LRUCache[str, CachedArticle] = LRUCache(
+    maxsize=settings.article_cache_size,
+)
+
+
+def compress(value: str) -> bytes:
+    """Compress text for storage."""
+    return zlib.compress(value.encode())
+
+
+def decompress(value: bytes) -> str:
+    """Decompress text stored with ``compress``."""
+    return zlib.decompress(value).decode()
+
+
+async def get_article(link: str) -> CachedArticle | None:
+    """
+    Get the full text of an article.
+
+    Looks in memory first, then in the database, and extracts the page
+    only when neither has it.
+
+    :param link: article URL.
+    :return: the article, or None if it couldn't be extracted.
+    """
+    key = normalize_link(link)
+    cached = articles.get(key)
+    if cached is not None:
+        return cached
+    async with get_standalone_session() as session:
+        row = await crud_article_cache.get_object_by_id(session, key)
+    if row is not None:
+        article = CachedArticle.model_validate_json(decompress(row.content))
+        articles.set(key, article)
+        return article
+
+    extracted = await article_extractor.extract(link)
+    if extracted is None or not extracted.text:
+        return None
+    article = CachedArticle(
+        url=link,
+        title=extracted.title or "",
+        text=extracted.text,
+    )
+    articles.set(key, article)
+    await db_writer.submit(
+        partial(
+            crud_article_cache.save_content,
+            link=key,
+            content=compress(json.dumps(article.model_dump())),
+        ),
+    )
+    return article
+
+
+async def get_stored_translation(link: str) -> str | None:
+    """Get a translation stored with a cached article."""
+    async with get_standalone_session() as session:
+        row = await crud_article_cache.get_object_by_id(
+            session,
+            normalize_link(link),
+        )
+    if row is None or row.translation is None:
+        return None
+    return decompress(row.translation)
+
+
+async def save_translation(link: str, translation: str) -> None:
+    """Store the translation of a cached article."""
+    await db_writer.submit(
+        partial(
+            crud_article_cache.save_translation,
+            link=normalize_link(link),
+            translation=compress(translation),
+        ),
+    )
@@ -0,0 +1,138 @@
+"""Article extraction off the event loop."""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+import httpx
+from newspaper import Article
+
+from ai_news_bot.ai.utils import get_full_text
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleExtractor:
+    """
+    Downloads and parses articles without blocking the event loop.
+
+    Pages are downloaded with a shared pooled HTTP client. Parsing is
+    CPU-bound and runs in a bounded thread pool. Concurrent requests to
+    one domain are capped, and both stages have a timeout.
+
+    :param max_workers: size of the parsing thread pool.
+    :param per_domain: concurrent extractions allowed per domain.
+    :param timeout: timeout in seconds for each of download and parsing.
+    :param client: HTTP client to use instead of the default one.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        per_domain: int = 2,
+        timeout: float = 15.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.per_domain = per_domain
+        self.timeout = timeout
+        self._client = client
+        self._executor: ThreadPoolExecutor | None = None
+        self._domain_limits: dict[str, asyncio.Semaphore] = {}
+        self._domain_users: dict[str, int] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_workers * self.per_domain,
+                    max_keepalive_connections=self.max_workers,
+                ),
+                headers={"User-Agent": "Mozilla/5.0 (compatible)"},
+            )
+        return self._client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Parsing thread pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="article-parser",
+            )
+        return self._executor
+
+    @asynccontextmanager
+    async def _domain_limit(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold one of the slots of the URL's domain.
+
+        The semaphore of a domain is dropped when nothing holds or waits
+        on it, so domains seen once don't stay in memory.
+        """
+        domain = urlsplit(url).hostname or ""
+        limit = self._domain_limits.get(domain)
+        if limit is None:
+            limit = asyncio.Semaphore(self.per_domain)
+            self._domain_limits[domain] = limit
+        self._domain_users[domain] = self._domain_users.get(domain, 0) + 1
+        try:
+            async with limit:
+                yield
+        finally:
+            self._domain_users[domain] -= 1
+            if not self._domain_users[domain]:
+                del self._domain_users[domain]
+                del self._domain_limits[domain]
+
+    async def extract(self, url: str) -> Article | None:
+        """
+        Fetch and parse an article.
+
+        :param url: article URL.
+        :return: parsed article, or None if it couldn't be extracted.
+        """
+        async with self._domain_limit(url):
+            try:
+                response = await self.client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"Error downloading article {url}: {e}")
+                return None
+            loop = asyncio.get_running_loop()
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(
+                        self.executor,
+                        get_full_text,
+                        url,
+                        response.text,
+                    ),
+                    timeout=self.timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Timed out parsing article {url}")
+                return None
+
+    async def close(self) -> None:
+        """Close the HTTP client and shut the thread pool down."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+article_extractor = ArticleExtractor(
+    max_workers=settings.article_workers,
+    per_domain=settings.article_domain_concurrency,
+    timeout=settings.article_timeout,
+)
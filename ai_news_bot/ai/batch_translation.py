@@ -0,0 +1,125 @@
+"""Translation of several texts per AI request."""
+import asyncio
+import logging
+
+from ai_news_bot.ai.utils import (
+    TranslateResponseSchema,
+    get_ai_api_key,
+    request_batch_translation,
+    request_translation,
+)
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in a text."""
+    return len(text) // 4 + 1
+
+
+class TranslationBatcher:
+    """
+    Collects texts to translate and sends them in one request.
+
+    A batch is sent once the window since its first text has passed or
+    once it reaches the token budget or the item limit. Texts missing
+    from the batch response, or all of them if the request failed, are
+    translated one by one instead.
+
+    :param window: seconds to wait for more texts after the first one.
+    :param token_budget: estimated tokens of a batch that trigger sending.
+    :param max_items: texts of a batch that trigger sending.
+    """
+
+    def __init__(
+        self,
+        window: float = 2.0,
+        token_budget: int = 3000,
+        max_items: int = 20,
+    ) -> None:
+        self.window = window
+        self.token_budget = token_budget
+        self.max_items = max_items
+        self._batch: list[tuple[str, asyncio.Future]] = []
+        self._tokens = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def translate(self, text: str) -> TranslateResponseSchema | None:
+        """
+        Translate a text as part of the next batch.
+
+        :param text: text to translate.
+        :return: the translation, or None if it failed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((text, future))
+        self._tokens += estimate_tokens(text)
+        if (
+            self._tokens >= self.token_budget
+            or len(self._batch) >= self.max_items
+        ):
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch, self._tokens = self._batch, [], 0
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            results = await self._translate_batch([text for text, _ in batch])
+        except Exception as e:
+            logger.error(f"Error translating batch: {e}")
+            results = [None] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _translate_batch(
+        self,
+        texts: list[str],
+    ) -> list[TranslateResponseSchema | None]:
+        api_key = await get_ai_api_key()
+        if api_key is None:
+            return [None] * len(texts)
+        translated = {}
+        if len(texts) > 1:
+            translated = await request_batch_translation(
+                {str(index): text for index, text in enumerate(texts)},
+                api_key,
+            ) or {}
+            if len(translated) < len(texts):
+                logger.warning(
+                    f"Batch translation returned {len(translated)} of "
+                    f"{len(texts)} items, translating the rest one by one."
+                )
+        missing = [
+            index for index in range(len(texts))
+            if str(index) not in translated
+        ]
+        singles = await asyncio.gather(
+            *(request_translation(texts[index], api_key) for index in missing),
+        )
+        translated.update(
+            (str(index), result) for index, result in zip(missing, singles)
+        )
+        return [translated[str(index)] for index in range(len(texts))]
+
+
+translation_batcher = TranslationBatcher(
+    window=settings.translation_batch_window,
+    token_budget=settings.translation_batch_token_budget,
+    max_items=settings.translation_batch_max_items,
+)
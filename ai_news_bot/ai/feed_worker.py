@@ -0,0 +1,36 @@
+"""
+Feed parsing as run by the feed parser's worker processes.
+
+Workers import only this module, so it stays free of the application's
+settings, database and logging.
+"""
+from datetime import datetime
+
+from dateutil.parser import parse as parse_date
+from rss_parser import RSSParser
+
+# Title, link, description and publication date of a feed item.
+FeedItem = tuple[str, str | None, str, datetime]
+
+
+def parse_feed(content: bytes, encoding: str = "utf-8") -> list[FeedItem]:
+    """
+    Parse an RSS feed into compact items.
+
+    Tuples are much cheaper to send back from a worker process than
+    schema objects.
+
+    :param content: raw feed.
+    :param encoding: encoding of the feed.
+    :return: items of the feed.
+    """
+    feed = RSSParser.parse(content.decode(encoding, errors="replace"))
+    return [
+        (
+            item.title.content,
+            item.links[0].content,
+            item.description.content if item.description else "",
+            parse_date(item.pub_date.content),
+        )
+        for item in feed.channel.items
+    ]
@@ -0,0 +1,92 @@
+"""Feed parsing off the event loop."""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from ai_news_bot.ai.feed_worker import FeedItem, parse_feed
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FeedParser:
+    """
+    Parses feeds without blocking the event loop.
+
+    Parsing XML and the dates of every item is CPU-bound and holds the
+    GIL, so large feeds go to a process pool. Small feeds are parsed
+    inline, where they cost less than the round trip to a worker. If
+    the pool breaks, e.g. because a worker was killed, feeds are parsed
+    inline until a new pool is created for the next feed.
+
+    Workers are started by a fork server, as forking the application
+    with its running threads isn't safe.
+
+    :param max_workers: size of the process pool, 0 parses every feed
+        inline.
+    :param inline_max_bytes: feeds smaller than this are parsed inline.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        inline_max_bytes: int = 64 * 1024,
+    ) -> None:
+        self.max_workers = max_workers
+        self.inline_max_bytes = inline_max_bytes
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Parsing process pool, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return self._executor
+
+    async def parse(
+        self,
+        content: bytes,
+        encoding: str = "utf-8",
+    ) -> list[FeedItem]:
+        """
+        Parse an RSS feed.
+
+        :param content: raw feed.
+        :param encoding: encoding of the feed.
+        :return: title, link, description and publication date of the
+            items.
+        """
+        if self.max_workers < 1 or len(content) < self.inline_max_bytes:
+            return parse_feed(content, encoding)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self.executor,
+                parse_feed,
+                content,
+                encoding,
+            )
+        except BrokenProcessPool as e:
+            logger.warning(f"Feed parser pool broke, parsing inline: {e}")
+            self._shutdown()
+            return parse_feed(content, encoding)
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def close(self) -> None:
+        """Shut the process pool down."""
+        self._shutdown()
+
+
+feed_parser = FeedParser(
+    max_workers=settings.feed_parse_workers,
+    inline_max_bytes=settings.feed_parse_inline_max_bytes,
+)
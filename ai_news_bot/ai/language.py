@@ -0,0 +1,186 @@
+"""Language detection for incoming news."""
+import logging
+import re
+from collections import Counter, defaultdict
+
+from langdetect import DetectorFactory, LangDetectException, detect
+from langdetect.detector_factory import init_factory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Make langdetect return the same language for the same text.
+DetectorFactory.seed = 0
+
+# Languages written in Cyrillic; everything else is treated as Latin.
+CYRILLIC_LANGUAGES = {"ru", "uk", "be", "bg", "mk", "sr"}
+# Letters only found in the Ukrainian and Belarusian alphabets. Other
+# Cyrillic text is taken for Russian: langdetect often mistakes short
+# Russian texts for Bulgarian or Macedonian.
+UKRAINIAN_LETTERS = set("іїєґІЇЄҐ")
+BELARUSIAN_LETTERS = set("ўЎ")
+# Frequent English words that are rare in other Latin-script languages.
+ENGLISH_WORDS = {
+    "the", "and", "of", "to", "is", "for", "with", "at", "by", "from",
+    "that", "this", "are", "was", "has", "have", "after", "over", "new",
+    "says", "will", "its", "how", "why", "what", "who",
+}
+WORD_RE = re.compile(r"[a-z']+")
+TAG_RE = re.compile(r"<.*?>")
+# Characters of a text looked at by langdetect.
+DETECT_CHARS = 300
+
+
+def text_script(text: str) -> str | None:
+    """
+    Tell whether a text is mostly Cyrillic or Latin.
+
+    :param text: text to look at.
+    :return: "cyrillic", "latin" or None if there are no letters.
+    """
+    cyrillic = latin = 0
+    for char in text:
+        if "Ѐ" <= char <= "ӿ":
+            cyrillic += 1
+        elif char.isascii() and char.isalpha():
+            latin += 1
+    if not cyrillic and not latin:
+        return None
+    return "cyrillic" if cyrillic >= latin else "latin"
+
+
+def language_script(language: str) -> str:
+    """Get the script a language is written in."""
+    return "cyrillic" if language in CYRILLIC_LANGUAGES else "latin"
+
+
+def guess_language(text: str, script: str | None) -> str | None:
+    """
+    Recognize a language from its letters and common words.
+
+    Handles the common Russian, Ukrainian, Belarusian and English cases
+    without running the statistical detector.
+
+    :return: language code, or None if the text needs proper detection.
+    """
+    if script == "cyrillic":
+        letters = set(text)
+        if letters & UKRAINIAN_LETTERS:
+            return "uk"
+        if letters & BELARUSIAN_LETTERS:
+            return "be"
+        return "ru"
+    if script == "latin" and text.isascii():
+        words = WORD_RE.findall(text.lower())
+        hits = sum(word in ENGLISH_WORDS for word in words)
+        if hits >= 2 or (words and hits / len(words) >= 0.2):
+            return "en"
+    return None
+
+
+def detect_text_language(text: str) -> str | None:
+    """
+    Detect the language of a text.
+
+    :param text: text to look at.
+    :return: language code, or None if it couldn't be detected.
+    """
+    script = text_script(text)
+    if script is None:
+        return None
+    language = guess_language(text, script)
+    if language is not None:
+        return language
+    try:
+        return detect(text[:DETECT_CHARS])
+    except LangDetectException:
+        return None
+
+
+class LanguageProfiles:
+    """
+    Dominant language of every news source.
+
+    Once enough items of a source were detected in one language, new
+    items of that source are assumed to be in it too, as long as they
+    are written in that language's script.
+
+    :param min_samples: detected items needed before a source is trusted.
+    :param threshold: share of items the dominant language must have.
+    """
+
+    def __init__(self, min_samples: int = 20, threshold: float = 0.9) -> None:
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self._counts: defaultdict[str, Counter] = defaultdict(Counter)
+        self._warm = False
+
+    async def warm(self, session: AsyncSession) -> None:
+        """Load language counts of stored news and the detector profiles."""
+        rows = await crud_news.get_language_counts(session)
+        self._counts.clear()
+        for source_name, language, count in rows:
+            self._counts[source_name][language] += count
+        # langdetect reads its profiles from disk on first use.
+        init_factory()
+        self._warm = True
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether stored counts were loaded."""
+        return self._warm
+
+    def dominant(self, source_name: str) -> str | None:
+        """
+        Get the dominant language of a source.
+
+        :param source_name: news source name.
+        :return: language code, or None if the source has no clear one.
+        """
+        counts = self._counts.get(source_name)
+        if not counts:
+            return None
+        total = sum(counts.values())
+        if total < self.min_samples:
+            return None
+        language, count = counts.most_common(1)[0]
+        if count / total < self.threshold:
+            return None
+        return language
+
+    def observe(self, source_name: str, language: str) -> None:
+        """Count a detected language for a source."""
+        self._counts[source_name][language] += 1
+
+    def detect(
+        self,
+        title: str,
+        description: str | None,
+        source_name: str,
+    ) -> str | None:
+        """
+        Get the language of a news item, detecting it only when needed.
+
+        :param title: news title.
+        :param description: news description, may contain HTML.
+        :param source_name: news source name.
+        :return: language code, or None if it couldn't be detected.
+        """
+        text = f"{title}\n{TAG_RE.sub('', description or '')}"
+        script = text_script(text)
+        dominant = self.dominant(source_name)
+        if dominant is not None and language_script(dominant) == script:
+            return dominant
+        language = detect_text_language(text)
+        if language is not None:
+            self.observe(source_name, language)
+        return language
+
+
+language_profiles = LanguageProfiles(
+    min_samples=settings.language_profile_min_samples,
+    threshold=settings.language_profile_threshold,
+)
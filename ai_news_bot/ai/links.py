@@ -0,0 +1,31 @@
+"""Normalization of article links."""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from.
+TRACKING_PARAMS = {"fbclid", "gclid", "yclid", "ref", "ref_src"}
+
+
+def normalize_link(link: str) -> str:
+    """
+    Normalize an article link for use as a cache key.
+
+    Lowercases the scheme and host, drops the fragment, tracking query
+    parameters and a trailing slash, and sorts the remaining parameters.
+    """
+    parts = urlsplit(link.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+        and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            path,
+            urlencode(query),
+            "",
+        ),
+    )
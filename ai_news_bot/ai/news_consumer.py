@@ -1,31 +1,58 @@
 import logging
+import time
+from datetime import datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Union
 
 from google.genai import Client as GeminiClient
 from google.genai import types as genai_types
 
-
+from ai_news_bot.ai.language import detect_text_language
+from ai_news_bot.ai.prefetch import article_prefetcher
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.ai.translation import translation_key
 from ai_news_bot.db.dependencies import get_standalone_session
 from ai_news_bot.db.crud.news_task import news_task_crud
 from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.crud.news_stage import crud_news_stage
 from ai_news_bot.db.crud.prompt import crud_prompt
 from ai_news_bot.db.crud.telegram import telegram_user_crud
 from ai_news_bot.db.crud.settings import settings_crud
-from ai_news_bot.web.api.news_task.schema import RSSItemSchema
-from ai_news_bot.telegram.bot import queue_task_message
+from ai_news_bot.db.writer import db_writer
+from ai_news_bot.services import metrics, timeline
+from ai_news_bot.services.redis.publisher import verdict_publisher
+from ai_news_bot.services.timeline import Stage
+from ai_news_bot.telegram.bot import (
+    deferred_translator,
+    outbox,
+    queue_task_message,
+)
 from ai_news_bot.telegram.utils import clear_html_tags
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from ai_news_bot.db.models.news_task import NewsTask
     from ai_news_bot.db.models.news import News
 
 
 logger = logging.getLogger(__name__)
 
+# News claimed per run, and how long a claim keeps other consumers away.
+CLAIM_BATCH = 200
+CLAIM_TIMEOUT = timedelta(minutes=10)
+# Model deciding whether news is relevant for a task.
+FILTER_MODEL = "gemini-2.5-flash-lite"
+
 
-async def send_news_to_telegram(news: "News", task_id: int) -> None:
+async def send_news_to_telegram(news: "News", task_id: int) -> int:
+    """
+    Queue news for the chats subscribed to a task.
+
+    :return: number of queued messages.
+    """
     async with get_standalone_session() as session:
-        chat_ids = await telegram_user_crud.get_all_chat_ids(
+        chat_ids = await telegram_user_crud.get_subscribed_chat_ids(
             session=session,
             task_id=task_id
         )
@@ -36,18 +63,30 @@ async def send_news_to_telegram(news: "News", task_id: int) -> None:
     text = (
         f"<a href=\"{news.link}\">{news.title}</a>\n\n{description_text}"
     )
+    if not chat_ids:
+        return 0
+    # Older rows were stored before languages were detected at ingest.
+    language = news.language or detect_text_language(news.title)
+    translatable = language == "en"
+    key = None
+    # Telegram posts are sent as bare links, there is nothing to edit.
+    if translatable and "https://t.me" not in news.link:
+        # Sent in the original language now, edited once translated.
+        key = translation_key(news)
+        deferred_translator.submit(key, news)
+    news_item = NewsItem.from_news(news)
+    news_item.language = language
     for chat_id in chat_ids:
         await queue_task_message(
             chat_id=chat_id,
             text=text,
             task_id=str(task_id),
-            news=RSSItemSchema(
-                title=news.title,
-                description=news.description,
-                link=news.link,
-                pub_date=news.pub_date,
-                source_name=news.source_name,),
+            news=news_item,
+            translatable=translatable,
+            translation_key=key,
+            news_id=news.id,
         )
+    return len(chat_ids)
 
 
 # TODO: Untie from NewsTask and News models.
@@ -79,22 +118,37 @@ async def process_news(
             news_item = f"{news.title} \n {description}."
         else:
             news_item = news
+        task_label = str(news_task.id)
         try:
             system_instruction = (
                 f"{initial_prompt} \n\n"
                 f"Filter: {news_task.title} \n"
                 f"{news_task.description} \n\n"
             )
+            started = time.perf_counter()
             response = await client.models.generate_content(
-                model="gemini-2.5-flash-lite",
+                model=FILTER_MODEL,
                 config=genai_types.GenerateContentConfig(
                     system_instruction=system_instruction,
                 ),
                 contents=(f"News: {news_item} \n\n")
             )
+            metrics.llm_request_seconds.labels(
+                FILTER_MODEL,
+                task_label,
+            ).observe(time.perf_counter() - started)
+            metrics.llm_tokens.labels(FILTER_MODEL, task_label).inc(
+                response.usage_metadata.total_token_count or 0,
+            )
             logger.info(
-                f"Token count for {news_item[:50]}: "
-                f"{response.usage_metadata.total_token_count}."
+                "Token count for %s: %s.",
+                news_item[:50],
+                response.usage_metadata.total_token_count,
+                extra={
+                    "model": FILTER_MODEL,
+                    "task": task_label,
+                    "tokens": response.usage_metadata.total_token_count,
+                },
             )
             if (
                 response.text.lower() == "true"
@@ -111,6 +165,7 @@ async def process_news(
                 )
                 return False
         except Exception as e:
+            metrics.llm_errors.labels(FILTER_MODEL, task_label).inc()
             logger.error(f"Error processing news: {e}")
             return False
 
@@ -127,28 +182,21 @@ async def add_positive_news(
         news_task_id: The ID of the news task to which the news item
         should be added.
     """
-    async with get_standalone_session() as session:
+    async def add_positive(session: "AsyncSession") -> None:
         news: "News" = await crud_news.get_object_by_id(
             session=session,
             obj_id=news_id
         )
-        news_task: "NewsTask" = await news_task_crud.get_object_by_id(
-            session=session,
-            obj_id=news_task_id
-        )
-        rss_news_item = RSSItemSchema(
-            title=news.title,
-            link=news.link,
-            description=news.description,
-            pub_date=news.pub_date,
-            source_name=news.source_name,
-        )
+        # add_positive loads the task with its lists. A partial load
+        # here would be reused from the identity map and raise there.
         await news_task_crud.add_positive(
-            news=rss_news_item,
-            news_task_id=news_task.id,
+            news=NewsItem.from_news(news),
+            news_task_id=news_task_id,
             session=session,
         )
 
+    await db_writer.submit(add_positive)
+
 
 def check_news_source_in_task(
     news: "News",
@@ -164,21 +212,49 @@ def check_news_source_in_task(
 async def news_consumer() -> None:
     """Background task to process unprocessed news items."""
 
-    async with get_standalone_session() as session:
-        unprocessed_news = await crud_news.get_unprocessed_news(
-            session=session
+    unprocessed_news = await db_writer.submit(
+        partial(
+            crud_news.claim_unprocessed_news,
+            limit=CLAIM_BATCH,
+            claim_timeout=CLAIM_TIMEOUT,
         )
+    )
+    async with get_standalone_session() as session:
         tasks: list["NewsTask"] = await news_task_crud.get_active_tasks(
             session=session,
+            load_profile="sources",
         )
         prompt = await crud_prompt.get_or_create(
             session=session,
         )
         settings = await settings_crud.get_all_objects(session=session)
-        if settings:
-            deepseek_api_key = settings[0].deepseek
+        deepseek_api_key = settings[0].deepseek if settings else None
+        metrics.news_backlog.set(
+            await crud_news.count_unprocessed(session=session),
+        )
+        inserted_at = await crud_news_stage.get_first_times(
+            session=session,
+            news_ids=[news.id for news in unprocessed_news],
+            stage=Stage.INSERTED.value,
+        )
     if unprocessed_news:
-        for news in unprocessed_news:
+        for index, news in enumerate(unprocessed_news):
+            if outbox.is_full:
+                # Leave the rest unprocessed until delivery catches up.
+                logger.warning(
+                    f"Telegram outbox is full ({outbox.depth} messages), "
+                    f"postponing news processing."
+                )
+                await db_writer.submit(
+                    partial(
+                        crud_news.release_claims,
+                        news_ids=[
+                            item.id for item in unprocessed_news[index:]
+                        ],
+                    ),
+                )
+                break
+            stages = []
             try:
                 no_faults = True
                 for news_task in tasks:
@@ -198,29 +274,79 @@ async def news_consumer() -> None:
                         )
                         no_faults = False
                         continue
+                    classified_at = datetime.now()
+                    if news.id in inserted_at:
+                        timeline.observe(
+                            Stage.CLASSIFIED,
+                            inserted_at[news.id],
+                            classified_at,
+                        )
+                    stages.append(
+                        timeline.stage_row(
+                            news.id,
+                            Stage.CLASSIFIED,
+                            classified_at,
+                            news_task.id,
+                        ),
+                    )
+                    verdict_publisher.add(news, news_task, is_relevant)
                     if is_relevant:
                         logger.info(
-                            f"News '{news.title}' is relevant for task "
-                            f"'{news_task.title}'",
+                            "News '%s' is relevant for task '%s'",
+                            news.title,
+                            news_task.title,
+                            extra={
+                                "news_id": news.id,
+                                "task_id": news_task.id,
+                                "relevant": True,
+                            },
                         )
                         await add_positive_news(
                             news_id=news.id,
                             news_task_id=news_task.id,
                         )
-                        await send_news_to_telegram(
+                        # Have the full text ready for the translate button.
+                        article_prefetcher.schedule(news.link)
+                        queued = await send_news_to_telegram(
                             news=news,
                             task_id=news_task.id,
                         )
+                        if queued:
+                            queued_at = datetime.now()
+                            timeline.observe(
+                                Stage.QUEUED,
+                                classified_at,
+                                queued_at,
+                            )
+                            stages.append(
+                                timeline.stage_row(
+                                    news.id,
+                                    Stage.QUEUED,
+                                    queued_at,
+                                    news_task.id,
+                                ),
+                            )
                     else:
                         logger.info(
-                            f"News '{news.title}' is not relevant for task "
-                            f"'{news_task.title}'",
+                            "News '%s' is not relevant for task '%s'",
+                            news.title,
+                            news_task.title,
+                            extra={
+                                "news_id": news.id,
+                                "task_id": news_task.id,
+                                "relevant": False,
+                            },
                         )
                 # Mark news as processed after checking against all tasks
                 if no_faults:
-                    async with get_standalone_session() as session:
-                        await crud_news.mark_news_as_processed(
-                            session, news.id
-                        )
+                    await db_writer.submit(
+                        partial(
+                            crud_news.mark_news_as_processed,
+                            news_id=news.id,
+                        ),
+                    )
             except Exception as e:
                 logger.error(f"Error processing news {news.title}: {e}")
+            await timeline.record(stages)
+            await verdict_publisher.flush(force=False)
+        await verdict_publisher.flush()
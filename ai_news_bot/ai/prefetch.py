@@ -0,0 +1,65 @@
+"""Background prefetch of full article text for relevant news."""
+import asyncio
+import logging
+
+from ai_news_bot.ai.article_cache import articles, get_article, normalize_link
+from ai_news_bot.ai.translation import translate_article
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ArticlePrefetcher:
+    """
+    Fetches articles in the background before anybody asks for them.
+
+    Prefetching is best effort: errors are logged, and links already
+    being prefetched are skipped.
+
+    :param concurrency: prefetches running at once.
+    :param translate: whether to translate the prefetched articles too.
+    """
+
+    def __init__(self, concurrency: int = 2, translate: bool = False) -> None:
+        self.translate = translate
+        self._limit = asyncio.Semaphore(concurrency)
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def schedule(self, link: str | None) -> None:
+        """
+        Start prefetching an article without waiting for it.
+
+        Telegram posts aren't articles and are skipped.
+
+        :param link: article URL.
+        """
+        if not link or "https://t.me" in link:
+            return
+        key = normalize_link(link)
+        if key in self._tasks or key in articles:
+            return
+        task = asyncio.create_task(self._prefetch(link))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    async def _prefetch(self, link: str) -> None:
+        async with self._limit:
+            try:
+                article = await get_article(link)
+                if article is not None and self.translate:
+                    await translate_article(link)
+            except Exception as e:
+                logger.error(f"Error prefetching article {link}: {e}")
+
+    async def close(self) -> None:
+        """Cancel prefetches still running."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+article_prefetcher = ArticlePrefetcher(
+    concurrency=settings.article_prefetch_concurrency,
+    translate=settings.article_prefetch_translate,
+)
@@ -0,0 +1,63 @@
+"""Compact records of news on its way through the pipeline."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(slots=True)
+class NewsItem:
+    """
+    News on its way from a producer to the database and to chats.
+
+    The values are checked once, where the producers parse them, and
+    passed on as is afterwards. RSSItemSchema stays the schema of news
+    at the API, where input has to be validated.
+    """
+
+    title: str
+    link: str | None
+    description: str | None
+    pub_date: datetime
+    source_name: str = "unknown"
+    language: str | None = None
+
+    @classmethod
+    def from_news(cls, news: Any) -> "NewsItem":
+        """Copy the fields of a news row, or of anything having them."""
+        return cls(
+            news.title,
+            news.link,
+            news.description,
+            news.pub_date,
+            news.source_name,
+            news.language,
+        )
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "NewsItem":
+        """Read fields stored with ``as_json``."""
+        return cls(
+            data["title"],
+            data["link"],
+            data["description"],
+            datetime.fromisoformat(data["pub_date"]),
+            data.get("source_name") or "unknown",
+            data.get("language"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the fields, e.g. as column values of a news row."""
+        return {
+            "title": self.title,
+            "link": self.link,
+            "description": self.description,
+            "pub_date": self.pub_date,
+            "source_name": self.source_name,
+            "language": self.language,
+        }
+
+    def as_json(self) -> dict[str, Any]:
+        """Get the fields as JSON values, in RSSItemSchema's format."""
+        fields = self.as_dict()
+        fields["pub_date"] = self.pub_date.isoformat()
+        return fields
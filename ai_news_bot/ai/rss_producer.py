@@ -1,5 +1,7 @@
 import logging
 import asyncio
+from datetime import datetime
+
 import httpx
 
 from ai_news_bot.ai.utils import (
@@ -26,6 +28,7 @@ async def rss_producer():
         responses = await asyncio.gather(
             *tasks, return_exceptions=True
         )
+        fetched_at = datetime.now()
         messages = []
         for rss_response, source_name in responses:
             if isinstance(rss_response, Exception):
@@ -34,11 +37,11 @@ async def rss_producer():
                 )
                 continue
             else:
-                messages.extend(parse_rss_feed(
+                messages.extend(await parse_rss_feed(
                     rss_response,
                     source_name
                 ))
-        await add_news_to_db(messages)
+        await add_news_to_db(messages, fetched_at=fetched_at)
         logger.info("RSS producer finished.")
     except httpx.HTTPError as e:
         logger.error(f"HTTP error while fetching RSS feed: {e}")
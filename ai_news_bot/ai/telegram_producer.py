@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 import logging
 import asyncio
 
@@ -6,7 +7,7 @@ from telethon import TelegramClient
 from telethon.sessions import StringSession
 from telethon.tl.custom.message import Message
 
-from ai_news_bot.web.api.news_task.schema import RSSItemSchema
+from ai_news_bot.ai.records import NewsItem
 from ai_news_bot.ai.utils import (
     get_sources,
     add_news_to_db,
@@ -60,7 +61,7 @@ async def get_messages_from_telegram_channel(
     source_name: str,
     source_url: str,
     limit: int = 10
-) -> list[RSSItemSchema]:
+) -> list[NewsItem]:
     """
     Fetches messages from a Telegram channel using Telethon.
 
@@ -68,11 +69,11 @@ async def get_messages_from_telegram_channel(
     :param source_url: The URL of the Telegram channel.
     :param limit: The maximum number of messages to fetch.
 
-    :return: A list of RSSItemSchema containing the messages.
+    :return: A list of NewsItem containing the messages.
     """
     channel_name = source_url.replace("https://t.me/", "").rstrip("/")
     client: TelegramClient = get_tg_client()
-    messages: list[RSSItemSchema] = []
+    messages: list[NewsItem] = []
     async with client:
         message: Message
         async for message in client.iter_messages(
@@ -81,7 +82,7 @@ async def get_messages_from_telegram_channel(
         ):
             if message.text:
                 messages.append(
-                    RSSItemSchema(
+                    NewsItem(
                         title=(
                             message.raw_text[:50] if message.text
                             else "No Title"
@@ -101,7 +102,7 @@ async def telegram_producer() -> None:
         logger.info("No Telegram channels configured.")
         return
     task_list = []
-    news_items: list[RSSItemSchema] = []
+    news_items: list[NewsItem] = []
     for source_name, source_url in channel_urls.items():
         task_list.append(get_messages_from_telegram_channel(
                 source_name,
@@ -109,6 +110,7 @@ async def telegram_producer() -> None:
             )
         )
     results = await asyncio.gather(*task_list, return_exceptions=True)
+    fetched_at = datetime.now()
     for result in results:
         if isinstance(result, Exception):
             # TODO: there's obviously not enough data in logging
@@ -116,4 +118,4 @@ async def telegram_producer() -> None:
             continue
         else:
             news_items.extend(result)
-    await add_news_to_db(news_items)
+    await add_news_to_db(news_items, fetched_at=fetched_at)
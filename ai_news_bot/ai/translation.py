@@ -0,0 +1,108 @@
+import hashlib
+import logging
+from functools import partial
+from typing import TYPE_CHECKING
+
+from ai_news_bot.ai.article_cache import (
+    get_article,
+    get_stored_translation,
+    normalize_link,
+    save_translation,
+)
+from ai_news_bot.ai.batch_translation import translation_batcher
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.ai.utils import (
+    get_ai_api_key,
+    prepare_translated_response,
+    request_translation,
+    text_for_translation,
+)
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.writer import db_writer
+from ai_news_bot.services.cache import LRUCache
+
+if TYPE_CHECKING:
+    from ai_news_bot.db.models.news import News
+
+
+logger = logging.getLogger(__name__)
+
+# Translated message text by translation_key().
+news_translations: LRUCache[str, str] = LRUCache(maxsize=1024)
+# Translated full article text by normalized article link.
+article_translations: LRUCache[str, str] = LRUCache(maxsize=256)
+
+
+def translation_key(news: "News | NewsItem") -> str:
+    """Key a translation by the news link and a hash of its content."""
+    content = f"{news.link}\n{news.title}\n{news.description or ''}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+async def translate_news(news: "News") -> str | None:
+    """
+    Translate a news item once, however many chats it is delivered to.
+
+    The result is memoized in memory and stored with the news row.
+
+    :param news: News item to translate.
+    :return: translated message text, or None if translation failed.
+    """
+    key = translation_key(news)
+    cached = news_translations.get(key)
+    if cached is not None:
+        return cached
+    if news.translation and news.translation_key == key:
+        news_translations.set(key, news.translation)
+        return news.translation
+
+    item = NewsItem.from_news(news)
+    # Items translated around the same time share one AI request.
+    response = await translation_batcher.translate(text_for_translation(item))
+    if response is None:
+        return None
+    text = prepare_translated_response(response=response, origin_text=item)
+    news_translations.set(key, text)
+    await db_writer.submit(
+        partial(
+            crud_news.save_translation,
+            news_id=news.id,
+            translation_key=key,
+            translation=text,
+        ),
+    )
+    return text
+
+
+async def translate_article(link: str) -> str | None:
+    """
+    Translate the full article behind a link, for the translate button.
+
+    The article text and its translation are served from the article
+    cache when prefetched, so only the first request for a link waits
+    for the page download and the AI.
+
+    :param link: article URL.
+    :return: translated text, or None if the article couldn't be fetched.
+    """
+    key = normalize_link(link)
+    cached = article_translations.get(key)
+    if cached is not None:
+        return cached
+    stored = await get_stored_translation(link)
+    if stored is not None:
+        article_translations.set(key, stored)
+        return stored
+    article = await get_article(link)
+    if article is None:
+        return None
+    api_key = await get_ai_api_key()
+    response = (
+        await request_translation(text_for_translation(article), api_key)
+        if api_key else None
+    )
+    text = prepare_translated_response(response=response, origin_text=article)
+    if response is not None:
+        article_translations.set(key, text)
+        await save_translation(link, text)
+    return text
@@ -1,33 +1,56 @@
+import asyncio
 import httpx
+import json
 import logging
-from typing import Union
-from dateutil.parser import parse as parse_date
+import time
+from collections import Counter
+from datetime import datetime
+from functools import partial
+from typing import Any, Union
 from pydantic import BaseModel
 
 from newspaper import Article
 from openai import AsyncOpenAI
-from rss_parser import RSSParser
 
+from ai_news_bot.ai.feeds import feed_parser
+from ai_news_bot.ai.language import language_profiles
+from ai_news_bot.ai.records import NewsItem
 from ai_news_bot.db.dependencies import get_standalone_session
-from ai_news_bot.web.api.news_task.schema import RSSItemSchema
+from ai_news_bot.db.writer import db_writer
 from ai_news_bot.db.crud.news import crud_news
 from ai_news_bot.db.crud.news_task import news_task_crud
 from ai_news_bot.db.crud.settings import settings_crud
+from ai_news_bot.services import metrics, timeline
+from ai_news_bot.services.timeline import Stage
 
 
 logger = logging.getLogger(__name__)
 
+TRANSLATION_MODEL = "gemini-2.5-flash-lite"
+
 
 class TranslateResponseSchema(BaseModel):
     title: str
     description: str | None
 
 
-def get_full_text(url: str) -> Article | None:
-    """Fetch the full text of an article from a URL."""
+class BatchTranslateItemSchema(TranslateResponseSchema):
+    id: str
+
+
+class BatchTranslateResponseSchema(BaseModel):
+    items: list[BatchTranslateItemSchema]
+
+
+def get_full_text(url: str, html: str | None = None) -> Article | None:
+    """Fetch the full text of an article from a URL.
+
+    Blocks while downloading and parsing. If the page HTML is given,
+    only parsing is done.
+    """
     article = Article(url, fetch_images=False)
     try:
-        article.download()
+        article.download(input_html=html)
         article.parse()
         return article
     except Exception as e:
@@ -37,7 +60,7 @@ def get_full_text(url: str) -> Article | None:
 
 def prepare_translated_response(
     response: TranslateResponseSchema | None,
-    origin_text: Union[RSSItemSchema, Article],
+    origin_text: Union[NewsItem, Article],
 ) -> str:
     """Prepare translated text from TranslateResponseSchema."""
     link = (
@@ -60,25 +83,44 @@ def prepare_translated_response(
     return translated_text
 
 
-async def translate_with_ai(
-    text: Union[RSSItemSchema | Article],
-) -> str:
-    """Translate text to Russian using AI API.
-
-    Args:
-        text: RSSItemSchema or Newspaper3k Article object.
-    """
+async def get_ai_api_key() -> str | None:
+    """Read the AI API key from the Settings table."""
     async with get_standalone_session() as session:
         settings = await settings_crud.get_all_objects(session=session)
-        if settings:
-            api_key = settings[0].deepseek
-        else:
-            logger.warning("AI API key not found in settings.")
-            return text
-    if type(text) is RSSItemSchema:
-        text_str = f"{text.title}\n\n{text.description}"
-    else:
-        text_str = f"{text.title}\n\n{text.text}"
+    if settings:
+        return settings[0].deepseek
+    logger.warning("AI API key not found in settings.")
+    return None
+
+
+def text_for_translation(text: Union[NewsItem | Article]) -> str:
+    """Build the text sent to the AI for translation."""
+    if isinstance(text, NewsItem):
+        return f"{text.title}\n\n{text.description}"
+    return f"{text.title}\n\n{text.text}"
+
+
+def observe_translation(response: Any, started: float) -> None:
+    """Record the latency and token usage of a translation request."""
+    metrics.llm_request_seconds.labels(
+        TRANSLATION_MODEL,
+        "translation",
+    ).observe(time.perf_counter() - started)
+    if response.usage is not None:
+        metrics.llm_tokens.labels(TRANSLATION_MODEL, "translation").inc(
+            response.usage.total_tokens,
+        )
+
+
+async def request_translation(
+    text_str: str,
+    api_key: str | None,
+) -> TranslateResponseSchema | None:
+    """Ask the AI API for a Russian translation.
+
+    Returns None if the request or response parsing failed.
+    """
+    started = time.perf_counter()
     try:
         async with AsyncOpenAI(
             api_key=api_key,
@@ -87,7 +129,7 @@ async def translate_with_ai(
             base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
         ) as client:
             response = await client.beta.chat.completions.parse(
-                model="gemini-2.5-flash-lite",
+                model=TRANSLATION_MODEL,
                 messages=[
                     {
                         "role": "system",
@@ -105,47 +147,128 @@ async def translate_with_ai(
                 ],
                 response_format=TranslateResponseSchema
             )
-            return prepare_translated_response(
-                response=response.choices[0].message.parsed,
-                origin_text=text,
-            )
+            observe_translation(response, started)
+            return response.choices[0].message.parsed
     except Exception as e:
+        metrics.llm_errors.labels(TRANSLATION_MODEL, "translation").inc()
         logger.error(f"AI translation error: {e}")
-        return prepare_translated_response(response=None, origin_text=text)
+        return None
+
 
+async def request_batch_translation(
+    texts: dict[str, str],
+    api_key: str | None,
+) -> dict[str, TranslateResponseSchema] | None:
+    """Ask the AI API for Russian translations of several texts at once.
 
-def parse_rss_feed(
+    Args:
+        texts: Texts to translate by ID.
+        api_key: AI API key.
+
+    Returns:
+        Translations by ID, possibly missing some of the IDs, or None if
+        the request or response parsing failed.
+    """
+    items = json.dumps(
+        [{"id": text_id, "text": text} for text_id, text in texts.items()],
+        ensure_ascii=False,
+    )
+    started = time.perf_counter()
+    try:
+        async with AsyncOpenAI(
+            api_key=api_key,
+            timeout=120.0,
+            max_retries=5,
+            base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+        ) as client:
+            response = await client.beta.chat.completions.parse(
+                model=TRANSLATION_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "Translate every item to Russian and extract "
+                            "translated text. Return one result per item "
+                            "with the item's id."
+                        ),
+                    },
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Translate the following items to Russian: \n\n"
+                            f"{items}"
+                        ),
+                    },
+                ],
+                response_format=BatchTranslateResponseSchema
+            )
+            observe_translation(response, started)
+            parsed = response.choices[0].message.parsed
+    except Exception as e:
+        metrics.llm_errors.labels(TRANSLATION_MODEL, "translation").inc()
+        logger.error(f"AI batch translation error: {e}")
+        return None
+    if parsed is None:
+        return None
+    return {
+        item.id: TranslateResponseSchema(
+            title=item.title,
+            description=item.description,
+        )
+        for item in parsed.items
+        if item.id in texts
+    }
+
+
+async def translate_with_ai(
+    text: Union[NewsItem | Article],
+    api_key: str | None = None,
+) -> str:
+    """Translate text to Russian using AI API.
+
+    Args:
+        text: NewsItem or Newspaper3k Article object.
+        api_key: AI API key. Read from Settings when not given.
+    """
+    if api_key is None:
+        api_key = await get_ai_api_key()
+        if api_key is None:
+            return text
+    response = await request_translation(text_for_translation(text), api_key)
+    return prepare_translated_response(response=response, origin_text=text)
+
+
+async def parse_rss_feed(
     response: httpx.Response,
     source_name: str,
-) -> list[RSSItemSchema]:
+) -> list[NewsItem]:
     """
-    Parse RSS feed response and return list of RSSItemSchema.
+    Parse RSS feed response and return list of NewsItem.
+
+    Large feeds are parsed in the feed parser's worker processes. A
+    feed that can't be parsed gives no items.
 
     Args:
         response: httpx.Response object containing RSS feed XML.
+        source_name: The name of the RSS source.
     """
-    if response.status_code == 200:
-        try:
-            feed = RSSParser.parse(response.text)
-        except Exception as e:
-            logger.warning(f"Failed to parse RSS feed: {e}, {response.url}")
-    else:
+    if response.status_code != 200:
         logger.warning(
             f"Bad response status: {response.status_code}, {response.url}"
         )
-    messages = [
-        RSSItemSchema(
-            title=item.title.content,
-            link=item.links[0].content,
-            description=(
-                item.description.content if item.description else ""
-            ),
-            pub_date=parse_date(item.pub_date.content),
-            source_name=source_name,
+        return []
+    try:
+        items = await feed_parser.parse(
+            response.content,
+            response.encoding or "utf-8",
         )
-        for item in feed.channel.items
+    except Exception as e:
+        logger.warning(f"Failed to parse RSS feed: {e}, {response.url}")
+        return []
+    return [
+        NewsItem(title, link, description, pub_date, source_name)
+        for title, link, description, pub_date in items
     ]
-    return messages
 
 
 async def get_rss_feed(
@@ -160,28 +283,90 @@ async def get_rss_feed(
     Returns:
         A tuple containing the httpx.Response object and source name.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(source_url)
-        response.raise_for_status()
-        return response, source_name
+    started = time.perf_counter()
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(source_url)
+            response.raise_for_status()
+    except Exception:
+        metrics.feed_fetch_errors.labels(source_name).inc()
+        raise
+    metrics.feed_fetch_seconds.labels(source_name).observe(
+        time.perf_counter() - started,
+    )
+    metrics.feed_fetch_bytes.labels(source_name).inc(len(response.content))
+    return response, source_name
 
 
 async def add_news_to_db(
-    news_items: list[RSSItemSchema],
+    news_items: list[NewsItem],
+    fetched_at: datetime | None = None,
 ) -> None:
     """
     Add news items to the database if they don't already exist.
+
+    The language of new items is detected here, once per item.
+
+    :param news_items: parsed news items.
+    :param fetched_at: when the items were fetched, now by default.
     """
+    if fetched_at is None:
+        fetched_at = datetime.now()
+    for source_name, count in Counter(
+        item.source_name for item in news_items
+    ).items():
+        metrics.news_items_parsed.labels(source_name).inc(count)
     async with get_standalone_session() as session:
-        for item in news_items:
-            existing_news = await crud_news.get_object_by_field(
-                session=session, field_name="link", field_value=item.link
-            )
-            if not existing_news:
-                await crud_news.create(session=session, obj_in=item)
-                logger.info(
-                    f"Added news: {item.title} from source {item.source_name}"
-                )
+        if not language_profiles.is_warm:
+            await language_profiles.warm(session)
+        existing_links = await crud_news.get_existing_links(
+            session=session,
+            links=[item.link for item in news_items],
+        )
+    new_items = [
+        item for item in news_items if item.link not in existing_links
+    ]
+    for item in new_items:
+        item.language = language_profiles.detect(
+            item.title,
+            item.description,
+            item.source_name,
+        )
+    added = await asyncio.gather(
+        *(
+            db_writer.submit(partial(crud_news.add_if_new, item=item))
+            for item in new_items
+        ),
+        # One item failing mustn't lose the bookkeeping of the others.
+        return_exceptions=True,
+    )
+    inserted_at = datetime.now()
+    stages = []
+    for item in news_items:
+        if item.link in existing_links:
+            metrics.news_items_duplicate.labels(item.source_name).inc()
+    for item, news in zip(new_items, added):
+        if isinstance(news, Exception):
+            logger.error(f"Error adding news {item.link}: {news}")
+            continue
+        if news is None:
+            # Added by another producer in the meantime.
+            metrics.news_items_duplicate.labels(item.source_name).inc()
+            continue
+        metrics.news_items_new.labels(item.source_name).inc()
+        timeline.observe(Stage.FETCHED, item.pub_date, fetched_at)
+        timeline.observe(Stage.INSERTED, fetched_at, inserted_at)
+        stages.append(timeline.stage_row(news.id, Stage.FETCHED, fetched_at))
+        stages.append(
+            timeline.stage_row(news.id, Stage.INSERTED, inserted_at),
+        )
+        logger.info(
+            "Added news: %s from source %s",
+            item.title,
+            item.source_name,
+            extra={"news_id": news.id, "source": item.source_name},
+        )
+    await timeline.record(stages)
 
 
 async def get_sources(
@@ -195,12 +380,10 @@ async def get_sources(
         rss: If True, retrieve RSS sources.
         telegram: If True, retrieve Telegram sources.
     """
+    field_name = "tg_urls" if telegram else "rss_urls"
     async with get_standalone_session() as session:
-        all_tasks = await news_task_crud.get_all_objects(session=session)
+        rows = await news_task_crud.get_field_values(session, field_name)
     result = {}
-    if not all_tasks:
-        return result
-    for task in all_tasks:
-        urls = task.tg_urls if telegram else task.rss_urls
-        result.update(urls)
+    for (urls,) in rows:
+        result.update(urls or {})
     return result
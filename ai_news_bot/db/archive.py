@@ -0,0 +1,44 @@
+"""Compressed archive files of news rows."""
+import gzip
+import json
+import os
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+
+def archive_path(archive_dir: Path, day: date) -> Path:
+    """Get the archive file of news published on a day."""
+    return archive_dir / f"news-{day.isoformat()}.jsonl.gz"
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Can't archive {type(value).__name__}")
+
+
+def write_archive(archive_dir: Path, rows: list[dict]) -> None:
+    """
+    Append news rows to their daily archive files.
+
+    Every call appends a gzip member to the file, which gzip readers
+    read as one stream. Files are synced before returning, so rows are
+    only deleted once they are on disk.
+
+    :param archive_dir: directory of the archive files.
+    :param rows: column values of the news rows.
+    """
+    by_day: defaultdict[date, list[str]] = defaultdict(list)
+    for row in rows:
+        by_day[row["pub_date"].date()].append(
+            json.dumps(row, default=_json_default, ensure_ascii=False),
+        )
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    for day, lines in by_day.items():
+        with open(archive_path(archive_dir, day), "ab") as file:
+            with gzip.GzipFile(fileobj=file, mode="wb") as archive:
+                archive.write(("\n".join(lines) + "\n").encode())
+            file.flush()
+            os.fsync(file.fileno())
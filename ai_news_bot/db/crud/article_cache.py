@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ai_news_bot.db.crud.base import BaseCRUD
+from ai_news_bot.db.models.article_cache import ArticleCache
+
+
+class CRUDArticleCache(BaseCRUD):
+    async def save_content(
+        self,
+        session: AsyncSession,
+        link: str,
+        content: bytes,
+    ) -> None:
+        """Store extracted article content, replacing older content."""
+        await session.merge(
+            self.model(link=link, content=content, translation=None),
+        )
+        await session.flush()
+
+    async def save_translation(
+        self,
+        session: AsyncSession,
+        link: str,
+        translation: bytes,
+    ) -> None:
+        """Store the translation of a cached article."""
+        stmt = update(self.model).where(
+            self.model.link == link,
+        ).values(translation=translation)
+        await session.execute(stmt)
+
+    async def get_links_older_than(
+        self,
+        session: AsyncSession,
+        before: datetime,
+        limit: int = 500,
+    ) -> list[str]:
+        """Get links of articles cached before a date."""
+        stmt = select(self.model.link).where(
+            self.model.created_at < before,
+        ).limit(limit)
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+    async def delete_by_links(
+        self,
+        session: AsyncSession,
+        links: list[str],
+    ) -> int:
+        """
+        Delete cached articles by normalized link.
+
+        :return: number of deleted articles.
+        """
+        if not links:
+            return 0
+        stmt = delete(self.model).where(self.model.link.in_(links))
+        result = await session.execute(stmt)
+        return result.rowcount
+
+
+crud_article_cache = CRUDArticleCache(ArticleCache)
@@ -2,19 +2,49 @@ import uuid
 from datetime import datetime
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import ORMOption
 
 from ai_news_bot.db.base import Base
 from ai_news_bot.db.models.users import User
 
 
 class BaseCRUD:
-    """Base CRUD class."""
+    """Base CRUD class.
+
+    Subclasses may declare ``load_profiles`` mapping a profile name to the
+    columns it loads. Any read method accepting ``load_profile`` then loads
+    only those columns; "full" (the default) always loads the whole row.
+    """
+
+    load_profiles: dict[str, tuple[str, ...]] = {}
 
     def __init__(self, model: type[Base]) -> None:
         self.model = model
 
+    def _load_options(self, load_profile: str) -> list[ORMOption]:
+        """Build loader options for the given load profile.
+
+        Columns outside the profile raise on access instead of issuing
+        a lazy load, which would fail under asyncio anyway.
+        """
+        if load_profile == "full":
+            return []
+        columns = self.load_profiles.get(load_profile)
+        if columns is None:
+            raise ValueError(
+                f"Unknown load profile '{load_profile}' "
+                f"for {self.model.__name__}"
+            )
+        return [
+            load_only(
+                *(getattr(self.model, column) for column in columns),
+                raiseload=True,
+            ),
+        ]
+
     async def create(
         self,
         session: AsyncSession,
@@ -57,16 +87,18 @@ class BaseCRUD:
         session: AsyncSession,
         obj_id: int | uuid.UUID,
         user: User | None = None,
+        load_profile: str = "full",
     ) -> Base | None:
         """Get object by ID."""
+        options = self._load_options(load_profile)
         if user:
             stmt = select(self.model).where(
                 self.model.id == obj_id,
                 self.model.user_id == user.id,
-            )
+            ).options(*options)
             object = await session.execute(stmt)
             return object.scalars().first()
-        return await session.get(self.model, obj_id)
+        return await session.get(self.model, obj_id, options=options)
 
     async def get_all_objects(
         self,
@@ -74,6 +106,7 @@ class BaseCRUD:
         limit: int = 1000,
         offset: int = 0,
         user: User | None = None,
+        load_profile: str = "full",
     ) -> list[Base]:
         """Get all objects."""
         if user:
@@ -85,9 +118,31 @@ class BaseCRUD:
             )
         else:
             stmt = select(self.model).limit(limit).offset(offset)
+        stmt = stmt.options(*self._load_options(load_profile))
         query = await session.execute(stmt)
         return query.scalars().all()
 
+    async def get_field_values(
+        self,
+        session: AsyncSession,
+        *field_names: str,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> list[Row]:
+        """Get plain column values for all objects, without building models.
+
+        :param session: SQLAlchemy async session.
+        :param field_names: names of the columns to select.
+        :return: rows with the requested columns, in the given order.
+        """
+        stmt = (
+            select(*(getattr(self.model, name) for name in field_names))
+            .limit(limit)
+            .offset(offset)
+        )
+        query = await session.execute(stmt)
+        return query.all()
+
     async def get_object_by_field(
         self,
         session: AsyncSession,
@@ -115,7 +170,11 @@ class BaseCRUD:
         await session.commit()
         return True
 
-    async def get_active_tasks(self, session: AsyncSession):
+    async def get_active_tasks(
+        self,
+        session: AsyncSession,
+        load_profile: str = "full",
+    ):
         """Get all active tasks.
 
         Works only with Task models.
@@ -123,7 +182,7 @@ class BaseCRUD:
         stmt = select(self.model).where(
             self.model.is_active.is_(True),
             self.model.end_date > datetime.now(),
-        )
+        ).options(*self._load_options(load_profile))
         tasks = await session.execute(stmt)
         return tasks.scalars().all()
 
@@ -1,23 +1,110 @@
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, false
+from sqlalchemy import delete, false, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_news_bot.db.crud.base import BaseCRUD
+from ai_news_bot.db.crud.news_stage import crud_news_stage
 from ai_news_bot.db.models.news import News
+from ai_news_bot.ai.records import NewsItem
 
 
 class CRUDNews(BaseCRUD):
-    async def get_unprocessed_news(self, session: AsyncSession) -> list[News]:
-        one_day_ago = datetime.now() - timedelta(days=1)
-        stmt = select(
-            self.model
+    async def claim_unprocessed_news(
+        self,
+        session: AsyncSession,
+        limit: int = 200,
+        claim_timeout: timedelta = timedelta(minutes=10),
+    ) -> list[News]:
+        """
+        Take unprocessed news for processing by this consumer.
+
+        On PostgreSQL rows claimed by a concurrent consumer are skipped
+        instead of waited on. Claims older than the timeout are treated
+        as abandoned, so a crashed consumer's news is processed again.
+
+        :param limit: maximum number of news to claim.
+        :param claim_timeout: age after which a claim expires.
+        :return: claimed news, oldest first.
+        """
+        now = datetime.now()
+        claimable = select(
+            self.model.id
         ).where(
             self.model.processed == false(),
-            self.model.pub_date >= one_day_ago
+            self.model.pub_date >= now - timedelta(days=1),
+            or_(
+                self.model.claimed_at.is_(None),
+                self.model.claimed_at < now - claim_timeout,
+            ),
+        ).order_by(
+            self.model.id
+        ).limit(
+            limit
+        ).with_for_update(
+            skip_locked=True
+        )
+        # One statement, so two consumers can't both see a row unclaimed.
+        stmt = update(self.model).where(
+            self.model.id.in_(claimable.scalar_subquery())
+        ).values(
+            claimed_at=now
+        ).returning(self.model)
+        result = await session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda news: news.id)
+
+    async def count_unprocessed(self, session: AsyncSession) -> int:
+        """Count the news still due for processing, claimed or not."""
+        stmt = select(func.count()).where(
+            self.model.processed == false(),
+            # Older news is never claimed, see claim_unprocessed_news.
+            self.model.pub_date >= datetime.now() - timedelta(days=1),
         )
         result = await session.execute(stmt)
-        return result.scalars().all()
+        return result.scalar_one()
+
+    async def release_claims(
+        self,
+        session: AsyncSession,
+        news_ids: list[int],
+    ) -> None:
+        """Let other consumers take claimed news right away."""
+        stmt = update(self.model).where(
+            self.model.id.in_(news_ids)
+        ).values(claimed_at=None)
+        await session.execute(stmt)
+
+    async def get_existing_links(
+        self,
+        session: AsyncSession,
+        links: list[str],
+    ) -> set[str]:
+        """Get which of the given links are already stored."""
+        if not links:
+            return set()
+        stmt = select(self.model.link).where(self.model.link.in_(links))
+        result = await session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def add_if_new(
+        self,
+        session: AsyncSession,
+        item: NewsItem,
+    ) -> News | None:
+        """Add a news item unless one with the same link exists."""
+        if session.get_bind().dialect.name == "postgresql":
+            insert = postgresql_insert
+        else:
+            insert = sqlite_insert
+        stmt = insert(self.model).values(
+            **item.as_dict()
+        ).on_conflict_do_nothing(
+            index_elements=[self.model.link]
+        ).returning(self.model)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def mark_news_as_processed(
         self,
@@ -33,5 +120,88 @@ class CRUDNews(BaseCRUD):
             return news
         return None
 
+    async def save_translation(
+        self,
+        session: AsyncSession,
+        news_id: int,
+        translation_key: str,
+        translation: str,
+    ) -> None:
+        """Store the delivered translation with the news row."""
+        stmt = update(self.model).where(
+            self.model.id == news_id
+        ).values(
+            translation=translation,
+            translation_key=translation_key,
+        )
+        await session.execute(stmt)
+
+    async def get_older_than(
+        self,
+        session: AsyncSession,
+        before: datetime,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[dict]:
+        """
+        Get raw rows of news published before a date, by ID.
+
+        :param before: publication date the news must be older than.
+        :param after_id: only return news with a greater ID.
+        :param limit: maximum number of rows.
+        :return: column values of every row, ordered by ID.
+        """
+        table = self.model.__table__
+        stmt = select(
+            table
+        ).where(
+            table.c.pub_date < before,
+            table.c.id > after_id,
+        ).order_by(
+            table.c.id
+        ).limit(
+            limit
+        )
+        result = await session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def delete_by_ids(
+        self,
+        session: AsyncSession,
+        news_ids: list[int],
+    ) -> int:
+        """
+        Delete news by ID with their stage timestamps.
+
+        :return: number of deleted news.
+        """
+        if not news_ids:
+            return 0
+        await crud_news_stage.delete_by_news_ids(session, news_ids)
+        stmt = delete(self.model).where(self.model.id.in_(news_ids))
+        result = await session.execute(stmt)
+        return result.rowcount
+
+    async def get_language_counts(
+        self,
+        session: AsyncSession,
+        days: int = 30,
+    ) -> list[tuple[str, str, int]]:
+        """Count recent news per source and detected language."""
+        since = datetime.now() - timedelta(days=days)
+        stmt = select(
+            self.model.source_name,
+            self.model.language,
+            func.count(),
+        ).where(
+            self.model.language.is_not(None),
+            self.model.pub_date >= since,
+        ).group_by(
+            self.model.source_name,
+            self.model.language,
+        )
+        result = await session.execute(stmt)
+        return result.all()
+
 
 crud_news = CRUDNews(News)
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ai_news_bot.db.crud.base import BaseCRUD
+from ai_news_bot.db.models.news_stage import NewsStage
+
+
+class CRUDNewsStage(BaseCRUD):
+    async def add_many(
+        self,
+        session: AsyncSession,
+        stages: list[dict],
+    ) -> None:
+        """
+        Record stage timestamps in one statement.
+
+        :param stages: column values with news_id, task_id, stage and at.
+        """
+        if stages:
+            await session.execute(insert(self.model), stages)
+
+    async def get_timeline(
+        self,
+        session: AsyncSession,
+        news_id: int,
+    ) -> list[NewsStage]:
+        """Get the stages of a news item in the order they happened."""
+        stmt = select(self.model).where(
+            self.model.news_id == news_id,
+        ).order_by(self.model.at, self.model.id)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_first_times(
+        self,
+        session: AsyncSession,
+        news_ids: list[int],
+        stage: str,
+    ) -> dict[int, datetime]:
+        """Get when news items first reached a stage, by news ID."""
+        stmt = select(
+            self.model.news_id,
+            func.min(self.model.at),
+        ).where(
+            self.model.news_id.in_(news_ids),
+            self.model.stage == stage,
+        ).group_by(self.model.news_id)
+        result = await session.execute(stmt)
+        return dict(result.all())
+
+    async def delete_by_news_ids(
+        self,
+        session: AsyncSession,
+        news_ids: list[int],
+    ) -> None:
+        """Delete the stages of news items."""
+        await session.execute(
+            delete(self.model).where(self.model.news_id.in_(news_ids)),
+        )
+
+
+crud_news_stage = CRUDNewsStage(NewsStage)
@@ -1,17 +1,36 @@
+import uuid
+
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
 from ai_news_bot.db.crud.base import BaseCRUD
 from ai_news_bot.db.models.news_task import NewsTask
+from ai_news_bot.ai.records import NewsItem
 from ai_news_bot.web.api.news_task.schema import RSSItemSchema
 
 
 class NewsTaskCRUD(BaseCRUD):
     """CRUD operations for NewsTask model."""
 
+    # The example and verdict lists grow with every processed news item,
+    # so hot paths should avoid loading them unless they need them.
+    load_profiles = {
+        "summary": ("id", "title", "is_active", "end_date"),
+        "sources": (
+            "id",
+            "title",
+            "description",
+            "is_active",
+            "end_date",
+            "rss_urls",
+            "tg_urls",
+        ),
+    }
+
     async def _add_item_to_list(
         self,
-        news: RSSItemSchema,
+        news: NewsItem,
         news_task_id,
         session: AsyncSession,
         list_attribute: str,
@@ -28,17 +47,18 @@ class NewsTaskCRUD(BaseCRUD):
         current_list = getattr(news_task, list_attribute)
         setattr(news_task, list_attribute, [
             *current_list,
-            news.model_dump(mode="json"),
+            news.as_json(),
         ])
         flag_modified(news_task, list_attribute)
         session.add(news_task)
-        await session.commit()
+        # Committed by the caller, so it can be part of a group commit.
+        await session.flush()
         await session.refresh(news_task)
         return news_task
 
     async def add_false_positive(
         self,
-        news: RSSItemSchema,
+        news: NewsItem,
         news_task_id,
         session: AsyncSession,
     ):
@@ -48,7 +68,7 @@ class NewsTaskCRUD(BaseCRUD):
 
     async def add_positive(
         self,
-        news: RSSItemSchema,
+        news: NewsItem,
         news_task_id: int,
         session: AsyncSession,
     ) -> NewsTask:
@@ -56,6 +76,27 @@ class NewsTaskCRUD(BaseCRUD):
             news, news_task_id, session, "positives",
         )
 
+    async def get_task_ids(
+        self,
+        session: AsyncSession,
+        user_id: uuid.UUID,
+    ) -> set[int]:
+        """Get the IDs of the tasks a user owns."""
+        result = await session.execute(
+            select(self.model.id).where(self.model.user_id == user_id),
+        )
+        return set(result.scalars())
+
+    async def get_positive_links(self, session: AsyncSession) -> set[str]:
+        """Get links of the news kept as positives by any task."""
+        result = await session.execute(select(self.model.positives))
+        return {
+            item["link"]
+            for positives in result.scalars().all()
+            for item in positives or ()
+            if item.get("link")
+        }
+
     async def get_false_positives(
         self,
         news_task_id: int,
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ai_news_bot.db.crud.base import BaseCRUD
+from ai_news_bot.db.models.outbox import OutboxMessage
+
+
+class CRUDOutbox(BaseCRUD):
+    async def enqueue(
+        self,
+        session: AsyncSession,
+        chat_id: int,
+        payload: dict,
+    ) -> OutboxMessage:
+        """Persist a message for delivery."""
+        message = self.model(chat_id=chat_id, payload=payload)
+        session.add(message)
+        await session.flush()
+        return message
+
+    async def get_due(
+        self,
+        session: AsyncSession,
+        limit: int,
+        exclude_ids: set[int],
+    ) -> list[OutboxMessage]:
+        """
+        Get pending messages whose next attempt is due, oldest first.
+
+        Messages of a chat whose older message waits for a retry are held
+        back, so a chat gets its messages in order.
+        """
+        now = datetime.now()
+        older = aliased(self.model)
+        retrying_older = exists().where(
+            older.chat_id == self.model.chat_id,
+            older.id < self.model.id,
+            older.status == "pending",
+            older.next_attempt_at > now,
+        )
+        stmt = select(self.model).where(
+            self.model.status == "pending",
+            self.model.next_attempt_at <= now,
+            ~retrying_older,
+        ).order_by(self.model.id).limit(limit + len(exclude_ids))
+        result = await session.execute(stmt)
+        return [
+            message for message in result.scalars().all()
+            if message.id not in exclude_ids
+        ][:limit]
+
+    async def count_pending(self, session: AsyncSession) -> int:
+        """Count messages not yet delivered nor dead."""
+        stmt = select(func.count()).select_from(self.model).where(
+            self.model.status == "pending",
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+    async def ack(self, session: AsyncSession, message_id: int) -> None:
+        """Remove a delivered message."""
+        await session.execute(
+            delete(self.model).where(self.model.id == message_id),
+        )
+
+    async def mark_failed(
+        self,
+        session: AsyncSession,
+        message_id: int,
+        error: str,
+        max_attempts: int,
+        retry_backoff: float,
+    ) -> OutboxMessage | None:
+        """
+        Record a failed attempt.
+
+        The message is retried with exponential backoff and moved to the
+        dead-letter list once it runs out of attempts.
+        """
+        message = await self.get_object_by_id(session, message_id)
+        if message is None:
+            return None
+        message.attempts += 1
+        message.last_error = error
+        if message.attempts >= max_attempts:
+            message.status = "dead"
+        else:
+            message.next_attempt_at = datetime.now() + timedelta(
+                seconds=retry_backoff * 2 ** (message.attempts - 1),
+            )
+        await session.flush()
+        return message
+
+    async def get_dead_letters(
+        self,
+        session: AsyncSession,
+        limit: int = 100,
+    ) -> list[OutboxMessage]:
+        """Get messages that ran out of delivery attempts."""
+        stmt = select(self.model).where(
+            self.model.status == "dead",
+        ).order_by(self.model.id.desc()).limit(limit)
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+
+crud_outbox = CRUDOutbox(OutboxMessage)
@@ -1,17 +1,41 @@
+import time
+from functools import partial
 from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+from ai_news_bot.db.base import Base
 from ai_news_bot.db.crud.base import BaseCRUD
-from ai_news_bot.db.models.telegram import TelegramUser
+from ai_news_bot.db.models.telegram import TelegramUser, tg_user_news_task
+from ai_news_bot.db.writer import after_commit
+from ai_news_bot.settings import settings
 
 if TYPE_CHECKING:
     from ai_news_bot.db.models.news_task import NewsTask
 
 
 class TelegramUserCRUD(BaseCRUD):
+    """
+    CRUD of Telegram users and their task subscriptions.
+
+    :param subscribers_ttl: seconds the in-memory subscriber map is used
+        before it is loaded again. Subscriptions made by other processes,
+        e.g. other API workers, show up after at most this long.
+    """
+
+    def __init__(
+        self,
+        model: type[Base],
+        subscribers_ttl: float = 60.0,
+    ) -> None:
+        super().__init__(model)
+        self.subscribers_ttl = subscribers_ttl
+        # NewsTask ID -> subscribed chat IDs, None until warmed.
+        self._subscribers: dict[int, set[int]] | None = None
+        self._warmed_at = 0.0
+
     async def get_all_chat_ids(
         self,
         session: AsyncSession,
@@ -24,12 +48,91 @@ class TelegramUserCRUD(BaseCRUD):
         :param task_id: NewsTask ID to filter users by.
         :return: List of Telegram chat IDs.
         """
-        stmt = select(self.model).where(
-            self.model.tasks.any(id=task_id)
+        stmt = select(self.model.tg_chat_id).join(
+            tg_user_news_task,
+            tg_user_news_task.c.tg_user_id == self.model.id,
+        ).where(
+            tg_user_news_task.c.news_task_id == task_id
+        )
+        query = await session.execute(stmt)
+        return list(query.scalars().all())
+
+    async def warm_subscribers(self, session: AsyncSession) -> None:
+        """
+        Load the whole task -> chat IDs subscriber map into memory.
+
+        :param session: SQLAlchemy async session.
+        """
+        stmt = select(
+            tg_user_news_task.c.news_task_id,
+            self.model.tg_chat_id,
+        ).join(
+            self.model,
+            tg_user_news_task.c.tg_user_id == self.model.id,
         )
         query = await session.execute(stmt)
-        query = query.scalars().all()
-        return [user.tg_chat_id for user in query]
+        subscribers: dict[int, set[int]] = {}
+        for task_id, chat_id in query.all():
+            subscribers.setdefault(task_id, set()).add(chat_id)
+        self._subscribers = subscribers
+        self._warmed_at = time.monotonic()
+
+    async def get_subscribed_chat_ids(
+        self,
+        session: AsyncSession,
+        task_id: int,
+    ) -> list[int]:
+        """
+        Get chat IDs subscribed to a task from the in-memory map.
+
+        The map is warmed on first use and kept up to date by the
+        subscription methods below once their writes are committed, so
+        this is a dict lookup. It is loaded again once it is older than
+        ``subscribers_ttl``, to pick up other processes' changes.
+
+        :param session: SQLAlchemy async session, used only for warming.
+        :param task_id: NewsTask ID.
+        :return: List of unique Telegram chat IDs.
+        """
+        if (
+            self._subscribers is None
+            or time.monotonic() - self._warmed_at >= self.subscribers_ttl
+        ):
+            await self.warm_subscribers(session)
+        return list(self._subscribers.get(task_id, ()))
+
+    async def _refresh_subscribers(
+        self,
+        session: AsyncSession,
+        task_ids: list[int],
+    ) -> None:
+        """Reload map entries once an unsubscribe is committed.
+
+        Several users of one group chat can share a subscription, so the
+        chat can only be dropped once the database says nobody is left.
+        The entries are read in the unsubscribing transaction, after its
+        flush, and replace the map's when it commits.
+        """
+        if self._subscribers is None:
+            return
+        chat_ids = {
+            task_id: await self.get_all_chat_ids(session, task_id)
+            for task_id in task_ids
+        }
+        after_commit(session, partial(self._set_subscribers, chat_ids))
+
+    def _set_subscribers(self, chat_ids: dict[int, list[int]]) -> None:
+        if self._subscribers is None:
+            return
+        for task_id, task_chat_ids in chat_ids.items():
+            if task_chat_ids:
+                self._subscribers[task_id] = set(task_chat_ids)
+            else:
+                self._subscribers.pop(task_id, None)
+
+    def _add_subscriber(self, task_id: int, chat_id: int) -> None:
+        if self._subscribers is not None:
+            self._subscribers.setdefault(task_id, set()).add(chat_id)
 
     async def get_or_create(
         self,
@@ -87,7 +190,12 @@ class TelegramUserCRUD(BaseCRUD):
             return user
         user.tasks.append(task)
         session.add(user)
-        await session.commit()
+        # Committed by the caller, so it can be part of a group commit.
+        await session.flush()
+        after_commit(
+            session,
+            partial(self._add_subscriber, task.id, tg_chat_id),
+        )
         refreshed_user = await session.execute(stmt)
         return refreshed_user.scalar_one_or_none()
 
@@ -121,7 +229,9 @@ class TelegramUserCRUD(BaseCRUD):
             return user
         user.tasks.remove(task)
         session.add(user)
-        await session.commit()
+        # Committed by the caller, so it can be part of a group commit.
+        await session.flush()
+        await self._refresh_subscribers(session, [task.id])
         refreshed_user = await session.execute(stmt)
         return refreshed_user.scalar_one_or_none()
 
@@ -142,14 +252,20 @@ class TelegramUserCRUD(BaseCRUD):
             self.model.tg_id == tg_id
         ).where(
             self.model.tg_chat_id == tg_chat_id
-        )
+        ).options(selectinload(self.model.tasks))
         user = await session.execute(stmt)
         user = user.scalar_one_or_none()
         if user:
+            task_ids = [task.id for task in user.tasks]
             await session.delete(user)
-            await session.commit()
+            # Committed by the caller, so it can be part of a group commit.
+            await session.flush()
+            await self._refresh_subscribers(session, task_ids)
             return True
         return False
 
 
-telegram_user_crud = TelegramUserCRUD(TelegramUser)
+telegram_user_crud = TelegramUserCRUD(
+    TelegramUser,
+    subscribers_ttl=settings.tg_subscribers_ttl,
+)
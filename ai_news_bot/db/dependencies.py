@@ -1,23 +1,104 @@
 import contextlib
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from starlette.requests import Request
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from starlette.requests import HTTPConnection
 
 from ai_news_bot.settings import settings
 
-_standalone_engine = create_async_engine(str(settings.db_url))
-_standalone_session_factory = async_sessionmaker(
-    _standalone_engine,
-    expire_on_commit=False,
-)
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Tune every new SQLite connection for concurrent use.
+
+    WAL lets readers work while a write is in progress, and the busy
+    timeout makes writers wait for each other instead of failing with
+    "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={settings.db_busy_timeout}")
+        cursor.execute(f"PRAGMA mmap_size={settings.db_mmap_size}")
+        # A negative cache size is in KiB rather than pages.
+        cursor.execute(f"PRAGMA cache_size=-{settings.db_cache_size_kib}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def create_engine(url: str | None = None) -> AsyncEngine:
+    """
+    Create a database engine, tuning SQLite connections with pragmas.
+
+    :param url: database URL, settings.db_url by default.
+    :return: new engine.
+    """
+    engine = create_async_engine(
+        url or str(settings.db_url),
+        echo=settings.db_echo,
+        pool_pre_ping=True,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    """Get the engine shared by the whole process, creating it if needed."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine()
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory of the shared engine."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            expire_on_commit=False,
+        )
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """Close the shared engine's connections."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+async def optimize_database() -> None:
+    """Let SQLite refresh the statistics its query planner relies on."""
+    engine = get_engine()
+    # PostgreSQL's autovacuum keeps its statistics fresh.
+    if engine.dialect.name != "sqlite":
+        return
+    async with engine.connect() as connection:
+        await connection.execute(text("PRAGMA optimize"))
 
 
-async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+async def get_db_session(
+    request: HTTPConnection,
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Create and get database session.
 
-    :param request: current request.
+    :param request: current request or WebSocket connection.
     :yield: database session.
     """
     session: AsyncSession = request.app.state.db_session_factory()
@@ -32,7 +113,7 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
 @contextlib.asynccontextmanager
 async def get_standalone_session():
     """Get a database session outside of FastAPI context."""
-    session = _standalone_session_factory()
+    session = get_session_factory()()
     try:
         yield session
         await session.commit()
@@ -0,0 +1,33 @@
+"""Index tg_user_news_task by news task.
+
+Revision ID: b7d21e4f9a3c
+Revises: 969473abd300
+Create Date: 2026-10-19 10:12:40.118265
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7d21e4f9a3c"
+down_revision = "969473abd300"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_index(
+        "ix_tg_user_news_task_news_task_id",
+        "tg_user_news_task",
+        ["news_task_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_index(
+        "ix_tg_user_news_task_news_task_id",
+        table_name="tg_user_news_task",
+    )
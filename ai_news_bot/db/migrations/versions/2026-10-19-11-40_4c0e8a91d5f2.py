@@ -0,0 +1,31 @@
+"""Add translation fields to News.
+
+Revision ID: 4c0e8a91d5f2
+Revises: b7d21e4f9a3c
+Create Date: 2026-10-19 11:40:03.527914
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4c0e8a91d5f2"
+down_revision = "b7d21e4f9a3c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.add_column("news", sa.Column("translation", sa.Text(), nullable=True))
+    op.add_column(
+        "news",
+        sa.Column("translation_key", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_column("news", "translation_key")
+    op.drop_column("news", "translation")
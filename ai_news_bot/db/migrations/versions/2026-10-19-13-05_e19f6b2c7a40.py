@@ -0,0 +1,47 @@
+"""Add outbox_message table.
+
+Revision ID: e19f6b2c7a40
+Revises: 4c0e8a91d5f2
+Create Date: 2026-10-19 13:05:51.204417
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e19f6b2c7a40"
+down_revision = "4c0e8a91d5f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_table(
+        "outbox_message",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_outbox_message_status_next_attempt_at",
+        "outbox_message",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_index(
+        "ix_outbox_message_status_next_attempt_at",
+        table_name="outbox_message",
+    )
+    op.drop_table("outbox_message")
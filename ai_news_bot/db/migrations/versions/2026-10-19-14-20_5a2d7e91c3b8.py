@@ -0,0 +1,33 @@
+"""Add article_cache table.
+
+Revision ID: 5a2d7e91c3b8
+Revises: e19f6b2c7a40
+Create Date: 2026-10-19 14:20:13.582904
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a2d7e91c3b8"
+down_revision = "e19f6b2c7a40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_table(
+        "article_cache",
+        sa.Column("link", sa.String(length=2048), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column("translation", sa.LargeBinary(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("link"),
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_table("article_cache")
@@ -0,0 +1,29 @@
+"""Add language to News.
+
+Revision ID: 8f3b1c6d2e07
+Revises: 5a2d7e91c3b8
+Create Date: 2026-10-19 15:30:42.118365
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f3b1c6d2e07"
+down_revision = "5a2d7e91c3b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.add_column(
+        "news",
+        sa.Column("language", sa.String(length=8), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_column("news", "language")
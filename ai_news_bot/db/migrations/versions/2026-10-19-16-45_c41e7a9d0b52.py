@@ -0,0 +1,133 @@
+"""Unique news links, news claims and PostgreSQL column types.
+
+Of news sharing a link, the first row is kept. The others are written
+to the news archive before they are deleted, downgrade doesn't bring
+them back.
+
+Revision ID: c41e7a9d0b52
+Revises: 8f3b1c6d2e07
+Create Date: 2026-10-19 16:45:09.531274
+
+"""
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from ai_news_bot.db.archive import write_archive
+from ai_news_bot.settings import settings
+
+# revision identifiers, used by Alembic.
+revision = "c41e7a9d0b52"
+down_revision = "8f3b1c6d2e07"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = {
+    "news": ["additional_data"],
+    "news_task": [
+        "false_positives",
+        "positives",
+        "non_relevant_news",
+        "relevant_news",
+        "rss_urls",
+        "tg_urls",
+    ],
+    "outbox_message": ["payload"],
+    "prompt": ["post_examples"],
+    "settings": ["rss_urls", "tg_urls"],
+}
+# Server defaults of JSON columns, which have to be recast too.
+JSON_DEFAULTS = {
+    ("news_task", "false_positives"): "[]",
+    ("news_task", "positives"): "[]",
+    ("news_task", "non_relevant_news"): "[]",
+    ("news_task", "relevant_news"): "[]",
+    ("news_task", "rss_urls"): "{}",
+    ("news_task", "tg_urls"): "{}",
+}
+TELEGRAM_ID_COLUMNS = ["tg_id", "tg_chat_id"]
+# VARCHAR(255) before, which PostgreSQL enforces and feeds exceed.
+NEWS_TEXT_COLUMNS = ["title", "link"]
+
+
+def _alter_json_columns(type_: sa.types.TypeEngine, cast: str) -> None:
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            default = JSON_DEFAULTS.get((table, column))
+            if default is not None:
+                op.alter_column(table, column, server_default=None)
+            op.alter_column(
+                table,
+                column,
+                type_=type_,
+                postgresql_using=f"{column}::{cast}",
+            )
+            if default is not None:
+                op.alter_column(
+                    table,
+                    column,
+                    server_default=sa.text(f"'{default}'::{cast}"),
+                )
+
+
+def _duplicate_links(news: sa.TableClause) -> sa.ColumnElement[bool]:
+    kept = sa.table("news", sa.column("id"), sa.column("link")).alias()
+    first_ids = sa.select(sa.func.min(kept.c.id)).where(
+        kept.c.link.is_not(None),
+    ).group_by(kept.c.link)
+    return sa.and_(news.c.link.is_not(None), news.c.id.not_in(first_ids))
+
+
+def _delete_duplicate_links() -> None:
+    if not context.is_offline_mode():
+        bind = op.get_bind()
+        # Reflected, so the rows are archived with typed values.
+        news = sa.Table("news", sa.MetaData(), autoload_with=bind)
+        rows = bind.execute(
+            sa.select(news).where(_duplicate_links(news)),
+        ).mappings().all()
+        if rows:
+            write_archive(
+                settings.news_archive_dir,
+                [dict(row) for row in rows],
+            )
+    news = sa.table("news", sa.column("id"), sa.column("link"))
+    op.execute(sa.delete(news).where(_duplicate_links(news)))
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    _delete_duplicate_links()
+    op.create_index("ux_news_link", "news", ["link"], unique=True)
+    op.add_column(
+        "news",
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _alter_json_columns(postgresql.JSONB(), "jsonb")
+    for column in TELEGRAM_ID_COLUMNS:
+        op.alter_column("tg_user", column, type_=sa.BigInteger())
+    for column in NEWS_TEXT_COLUMNS:
+        op.alter_column("news", column, type_=sa.Text())
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    postgres = op.get_bind().dialect.name == "postgresql"
+    if postgres:
+        for column in TELEGRAM_ID_COLUMNS:
+            op.alter_column("tg_user", column, type_=sa.Integer())
+        _alter_json_columns(sa.JSON(), "json")
+    op.drop_column("news", "claimed_at")
+    op.drop_index("ux_news_link", table_name="news")
+    if postgres:
+        # Truncated once the unique index is gone, as links may collide.
+        for column in NEWS_TEXT_COLUMNS:
+            op.alter_column(
+                "news",
+                column,
+                type_=sa.String(255),
+                postgresql_using=f"left({column}, 255)",
+            )
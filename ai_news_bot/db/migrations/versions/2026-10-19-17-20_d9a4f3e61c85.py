@@ -0,0 +1,40 @@
+"""Index unprocessed news and active tasks.
+
+Revision ID: d9a4f3e61c85
+Revises: c41e7a9d0b52
+Create Date: 2026-10-19 17:20:26.804113
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d9a4f3e61c85"
+down_revision = "c41e7a9d0b52"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_index(
+        "ix_news_processed_pub_date",
+        "news",
+        ["processed", "pub_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_news_task_is_active_end_date",
+        "news_task",
+        ["is_active", "end_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_index(
+        "ix_news_task_is_active_end_date",
+        table_name="news_task",
+    )
+    op.drop_index("ix_news_processed_pub_date", table_name="news")
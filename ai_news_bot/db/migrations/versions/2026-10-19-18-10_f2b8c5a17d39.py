@@ -0,0 +1,36 @@
+"""Switch SQLite to incremental auto-vacuum.
+
+Revision ID: f2b8c5a17d39
+Revises: d9a4f3e61c85
+Create Date: 2026-10-19 18:10:51.270934
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2b8c5a17d39"
+down_revision = "d9a4f3e61c85"
+branch_labels = None
+depends_on = None
+
+
+def _set_auto_vacuum(mode: str) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    # The mode of an existing database only changes with a full VACUUM,
+    # which can't run in a transaction. Done once here, while deploying,
+    # the news retention job only needs short incremental steps after.
+    with op.get_context().autocommit_block():
+        op.execute(f"PRAGMA auto_vacuum={mode}")
+        op.execute("VACUUM")
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    _set_auto_vacuum("INCREMENTAL")
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    _set_auto_vacuum("NONE")
@@ -0,0 +1,41 @@
+"""Timestamps of the pipeline stages of news.
+
+Revision ID: a6c3e8f15b27
+Revises: f2b8c5a17d39
+Create Date: 2026-10-19 19:05:42.118305
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a6c3e8f15b27"
+down_revision = "f2b8c5a17d39"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the migration."""
+    op.create_table(
+        "news_stage",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("news_id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.Column("stage", sa.String(length=16), nullable=False),
+        sa.Column("at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_news_stage_news_id",
+        "news_stage",
+        ["news_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Undo the migration."""
+    op.drop_index("ix_news_stage_news_id", table_name="news_stage")
+    op.drop_table("news_stage")
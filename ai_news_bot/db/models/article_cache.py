@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import DateTime, LargeBinary, String
+
+from ai_news_bot.db.base import Base
+
+
+class ArticleCache(Base):
+    """Extracted full text of an article, zlib-compressed."""
+
+    __tablename__ = "article_cache"
+
+    # Normalized article link.
+    link: Mapped[str] = mapped_column(String(2048), primary_key=True)
+    # Compressed JSON with the article url, title and text.
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # Compressed translated message text, if translated.
+    translation: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.now,
+    )
@@ -1,7 +1,11 @@
+from datetime import datetime
+
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql.sqltypes import JSON, DateTime, String, Text
+from sqlalchemy.sql.sqltypes import DateTime, String, Text
 
 from ai_news_bot.db.base import Base
+from ai_news_bot.db.types import JSONVariant
 
 
 class News(Base):
@@ -10,14 +14,37 @@ class News(Base):
     __tablename__ = "news"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    link: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    link: Mapped[str | None] = mapped_column(Text, nullable=True)
     pub_date: Mapped[DateTime] = mapped_column(DateTime, nullable=False)
-    additional_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    additional_data: Mapped[dict | None] = mapped_column(
+        JSONVariant,
+        nullable=True,
+    )
     processed: Mapped[bool] = mapped_column(nullable=False, default=False)
     source_name: Mapped[str | None] = mapped_column(
         String(100),
         nullable=False,
         default="unknown",
     )
+    # Language code detected at ingest, e.g. "en" or "ru".
+    language: Mapped[str | None] = mapped_column(String(8), nullable=True)
+    # Delivered translation, reused while translation_key still matches.
+    translation: Mapped[str | None] = mapped_column(Text, nullable=True)
+    translation_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+    )
+    # Set when a consumer takes the item, so other nodes skip it.
+    claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        nullable=True,
+    )
+
+    __table_args__ = (
+        # Lets ingest skip known links with ON CONFLICT DO NOTHING.
+        Index("ux_news_link", "link", unique=True),
+        # Serves the consumer's unprocessed news claim.
+        Index("ix_news_processed_pub_date", "processed", "pub_date"),
+    )
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import DateTime, Integer, String
+
+from ai_news_bot.db.base import Base
+
+
+class NewsStage(Base):
+    """Time a news item reached a pipeline stage."""
+
+    __tablename__ = "news_stage"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    news_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # None for the stages before news is checked against tasks.
+    task_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # "fetched", "inserted", "classified", "queued" or "delivered".
+    stage: Mapped[str] = mapped_column(String(16), nullable=False)
+    at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # Serves the timeline of a news item and deletes with the news.
+        Index("ix_news_stage_news_id", "news_id"),
+    )
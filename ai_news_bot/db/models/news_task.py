@@ -2,11 +2,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql.sqltypes import JSON, DateTime, String, Text
+from sqlalchemy.sql.sqltypes import DateTime, String, Text
 
 from ai_news_bot.db.base import Base
+from ai_news_bot.db.types import JSONVariant
 
 if TYPE_CHECKING:
     from ai_news_bot.db.models.users import User
@@ -31,12 +32,12 @@ class NewsTask(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user.id"))
     user: Mapped["User"] = relationship(back_populates="tasks")
     false_positives: Mapped[list[dict]] = mapped_column(
-        JSON,
+        JSONVariant,
         default=list,
         server_default="[]",
     )
     positives: Mapped[list[dict]] = mapped_column(
-        JSON,
+        JSONVariant,
         default=list,
         server_default="[]",
     )
@@ -46,12 +47,12 @@ class NewsTask(Base):
         default=None,
     )
     non_relevant_news: Mapped[list[str]] = mapped_column(
-        JSON,
+        JSONVariant,
         default=list,
         server_default="[]",
     )
     relevant_news: Mapped[list[str]] = mapped_column(
-        JSON,
+        JSONVariant,
         default=list,
         server_default="[]",
     )
@@ -60,14 +61,19 @@ class NewsTask(Base):
         back_populates="tasks",
     )
     rss_urls: Mapped[dict] = mapped_column(
-        JSON,
+        JSONVariant,
         default={},
     )
     tg_urls: Mapped[dict] = mapped_column(
-        JSON,
+        JSONVariant,
         default={},
     )
 
+    __table_args__ = (
+        # Serves get_active_tasks, which every consumer run calls.
+        Index("ix_news_task_is_active_end_date", "is_active", "end_date"),
+    )
+
     def __repr__(self):
         return (
             f"<NewsTask(id={self.id}, title={self.title}, "
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import DateTime, Integer, String, Text
+
+from ai_news_bot.db.base import Base
+from ai_news_bot.db.types import JSONVariant
+
+
+class OutboxMessage(Base):
+    """Telegram message waiting to be delivered."""
+
+    __tablename__ = "outbox_message"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONVariant, nullable=False)
+    # "pending" until delivered (and deleted), "dead" once out of attempts.
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default="pending",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.now,
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.now,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_message_status_next_attempt_at",
+            "status",
+            "next_attempt_at",
+        ),
+    )
@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql.sqltypes import JSON, Text
+from sqlalchemy.sql.sqltypes import Text
 
 from ai_news_bot.ai.prompts import Prompts
 from ai_news_bot.db.base import Base
+from ai_news_bot.db.types import JSONVariant
 
 
 class Prompt(Base):
@@ -24,7 +25,7 @@ class Prompt(Base):
         default=Prompts.SUGGEST_POST,
     )
     post_examples: Mapped[list] = mapped_column(
-        JSON,
+        JSONVariant,
         nullable=False,
         default=[
             Prompts.POST_EXAMPLE_ONE,
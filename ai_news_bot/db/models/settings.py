@@ -1,5 +1,6 @@
 from ai_news_bot.db.base import Base
-from sqlalchemy import String, JSON
+from ai_news_bot.db.types import JSONVariant
+from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -16,10 +17,10 @@ class Settings(Base):
         nullable=True,
     )
     rss_urls: Mapped[dict] = mapped_column(
-        JSON,
+        JSONVariant,
         default={},
     )
     tg_urls: Mapped[dict] = mapped_column(
-        JSON,
+        JSONVariant,
         default={},
     )
@@ -1,8 +1,8 @@
 from datetime import datetime
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql.sqltypes import DateTime, Integer
-from sqlalchemy import UniqueConstraint, ForeignKey, Table, Column
+from sqlalchemy.sql.sqltypes import BigInteger, DateTime, Integer
+from sqlalchemy import UniqueConstraint, ForeignKey, Table, Column, Index
 
 from ai_news_bot.db.base import Base
 from ai_news_bot.db.models.news_task import NewsTask
@@ -21,6 +21,8 @@ tg_user_news_task = Table(
         ForeignKey('news_task.id'),
         primary_key=True
     ),
+    # The primary key only serves lookups by user; fan-out goes by task.
+    Index('ix_tg_user_news_task_news_task_id', 'news_task_id'),
 )
 
 
@@ -33,8 +35,9 @@ class TelegramUser(Base):
         primary_key=True,
         autoincrement=True
     )
-    tg_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    tg_chat_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Telegram IDs don't fit in 32 bits.
+    tg_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    tg_chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     created_at: Mapped[DateTime] = mapped_column(
         DateTime,
         nullable=False,
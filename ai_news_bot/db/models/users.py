@@ -2,11 +2,12 @@
 import uuid
 import contextlib
 
-from fastapi import Depends
+from fastapi import Depends, Header, WebSocketException, status
 from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, schemas
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
+    CookieTransport,
     JWTStrategy,
 )
 from fastapi_users.db import (
@@ -89,13 +90,60 @@ auth_jwt = AuthenticationBackend(
     get_strategy=get_jwt_strategy,
 )
 
+# Browsers' EventSource can't send the Authorization header of the
+# bearer backend, but sends cookies, on reconnects too.
+cookie_transport = CookieTransport(
+    cookie_name="media_watcher_auth",
+    cookie_samesite="strict",
+)
+auth_cookie = AuthenticationBackend(
+    name="cookie",
+    transport=cookie_transport,
+    get_strategy=get_jwt_strategy,
+)
+
 backends = [
     auth_jwt,
+    auth_cookie,
 ]
 
 api_users = FastAPIUsers[User, uuid.UUID](get_user_manager, backends)
 
 current_active_user = api_users.current_user(active=True)
+current_superuser = api_users.current_user(active=True, superuser=True)
+
+# Subprotocol carrying the JWT of WebSocket connections.
+WS_AUTH_PROTOCOL = "bearer"
+
+
+async def websocket_user(
+    sec_websocket_protocol: str | None = Header(None),
+    user_manager: UserManager = Depends(get_user_manager),
+) -> User:
+    """
+    Get the active user of a WebSocket connection.
+
+    Browsers can't send the Authorization header with a WebSocket
+    handshake. They can send subprotocols, so the JWT comes as the one
+    after ``bearer``. Unlike a query parameter, it doesn't end up in the
+    access logs.
+
+    :param sec_websocket_protocol: subprotocols requested by the client.
+    :param user_manager: user manager.
+    :raises WebSocketException: if the token isn't valid.
+    :returns: the active user.
+    """
+    protocols = [
+        protocol.strip()
+        for protocol in (sec_websocket_protocol or "").split(",")
+    ]
+    token = None
+    if len(protocols) == 2 and protocols[0] == WS_AUTH_PROTOCOL:
+        token = protocols[1]
+    user = await get_jwt_strategy().read_token(token, user_manager)
+    if user is None or not user.is_active:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+    return user
 
 
 async def create_user(email: str, password: str, is_superuser: bool = False):
@@ -0,0 +1,182 @@
+"""Archival and removal of old news."""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ai_news_bot.ai.links import normalize_link
+from ai_news_bot.db.archive import write_archive
+from ai_news_bot.db.crud.article_cache import crud_article_cache
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.crud.news_task import news_task_crud
+from ai_news_bot.db.dependencies import get_session_factory
+from ai_news_bot.db.writer import DatabaseWriter, db_writer
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class NewsRetention:
+    """
+    Moves old news out of the database into compressed archive files.
+
+    News published more than ``retention_days`` ago is written to gzip
+    JSON lines files, one per publication day, and deleted in small
+    batches through the database writer, so no write transaction holds
+    the database for long. News kept as a positive example by a task
+    stays. On SQLite the freed pages are then given back to the file
+    system by incremental vacuum steps.
+
+    Cached full articles go with their news, and the ones cached more
+    than ``retention_days`` ago go too, whatever news they belong to.
+
+    If the process stops between archiving and deleting a batch, the
+    next run archives that batch again, so archives may repeat rows.
+
+    :param retention_days: age in days of the news to remove.
+    :param archive_dir: directory of the archive files.
+    :param batch_size: news archived and deleted per batch.
+    :param pause: seconds to wait between batches.
+    :param vacuum_pages: pages freed per incremental vacuum step.
+    :param session_factory: factory of database sessions for reads.
+    :param writer: database writer for deletes.
+    """
+
+    def __init__(
+        self,
+        retention_days: int = 30,
+        archive_dir: Path = Path("archive"),
+        batch_size: int = 500,
+        pause: float = 0.1,
+        vacuum_pages: int = 1000,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        writer: DatabaseWriter | None = None,
+    ) -> None:
+        self.retention_days = retention_days
+        self.archive_dir = archive_dir
+        self.batch_size = batch_size
+        self.pause = pause
+        self.vacuum_pages = vacuum_pages
+        self._session_factory = session_factory
+        self._writer = writer
+
+    @property
+    def sessions(self) -> async_sessionmaker[AsyncSession]:
+        """Factory of the sessions used for reads."""
+        return self._session_factory or get_session_factory()
+
+    @property
+    def writer(self) -> DatabaseWriter:
+        """Writer of the deletes."""
+        return self._writer or db_writer
+
+    async def run(self) -> int:
+        """
+        Archive and delete old news and cached articles, then vacuum.
+
+        :return: number of deleted news.
+        """
+        before = datetime.now() - timedelta(days=self.retention_days)
+        async with self.sessions() as session:
+            keep = await news_task_crud.get_positive_links(session)
+        kept_articles = {normalize_link(link) for link in keep if link}
+        deleted = 0
+        pruned = 0
+        after_id = 0
+        while True:
+            async with self.sessions() as session:
+                rows = await crud_news.get_older_than(
+                    session,
+                    before=before,
+                    after_id=after_id,
+                    limit=self.batch_size,
+                )
+            if not rows:
+                break
+            after_id = rows[-1]["id"]
+            rows = [row for row in rows if row["link"] not in keep]
+            if not rows:
+                continue
+            await asyncio.to_thread(write_archive, self.archive_dir, rows)
+            deleted += await self.writer.submit(
+                partial(
+                    crud_news.delete_by_ids,
+                    news_ids=[row["id"] for row in rows],
+                ),
+            )
+            articles = {
+                normalize_link(row["link"]) for row in rows if row["link"]
+            }
+            pruned += await self.writer.submit(
+                partial(
+                    crud_article_cache.delete_by_links,
+                    links=list(articles - kept_articles),
+                ),
+            )
+            await asyncio.sleep(self.pause)
+        pruned += await self.prune_article_cache(before)
+        logger.info(
+            f"Archived and deleted {deleted} news published before "
+            f"{before:%Y-%m-%d}, deleted {pruned} cached articles",
+        )
+        if deleted or pruned:
+            await self.vacuum()
+        return deleted
+
+    async def prune_article_cache(self, before: datetime) -> int:
+        """
+        Delete articles cached before a date, in batches.
+
+        :param before: date the articles must be cached before.
+        :return: number of deleted articles.
+        """
+        pruned = 0
+        while True:
+            async with self.sessions() as session:
+                links = await crud_article_cache.get_links_older_than(
+                    session,
+                    before=before,
+                    limit=self.batch_size,
+                )
+            if not links:
+                return pruned
+            pruned += await self.writer.submit(
+                partial(crud_article_cache.delete_by_links, links=links),
+            )
+            await asyncio.sleep(self.pause)
+
+    async def vacuum(self) -> None:
+        """Give free SQLite pages back in steps of ``vacuum_pages``."""
+        async with self.sessions() as session:
+            if session.get_bind().dialect.name != "sqlite":
+                # PostgreSQL's autovacuum reuses the space.
+                return
+            result = await session.execute(text("PRAGMA auto_vacuum"))
+            if result.scalar() != 2:
+                logger.warning(
+                    "SQLite auto_vacuum isn't INCREMENTAL, "
+                    "free pages stay in the database file.",
+                )
+                return
+        while await self.writer.submit(self._vacuum_step):
+            await asyncio.sleep(self.pause)
+
+    async def _vacuum_step(self, session: AsyncSession) -> int:
+        await session.execute(
+            text(f"PRAGMA incremental_vacuum({self.vacuum_pages})"),
+        )
+        result = await session.execute(text("PRAGMA freelist_count"))
+        return result.scalar()
+
+
+news_retention = NewsRetention(
+    retention_days=settings.news_retention_days,
+    archive_dir=settings.news_archive_dir,
+    batch_size=settings.news_retention_batch,
+    pause=settings.news_retention_pause,
+    vacuum_pages=settings.db_vacuum_pages,
+)
@@ -0,0 +1,15 @@
+"""Column types that work on every supported database."""
+from typing import Any
+
+from sqlalchemy import JSON, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+# JSON on SQLite, binary indexed JSONB on PostgreSQL.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+@compiles(Text, "postgresql")
+def compile_text(type_: Text, compiler: Any, **kw: Any) -> str:
+    """Render Text without a length, which PostgreSQL doesn't accept."""
+    return "TEXT"
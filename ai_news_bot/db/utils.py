@@ -1,13 +1,52 @@
 from pathlib import Path
 
-from ai_news_bot.settings import settings
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from ai_news_bot.settings import DatabaseBackend, settings
 
 
 async def create_database() -> None:
     """Create a database."""
+    if settings.db_backend != DatabaseBackend.POSTGRESQL:
+        return
+    db_url = str(settings.db_url.with_path("/postgres"))
+    engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
+    async with engine.connect() as conn:
+        database_existance = await conn.execute(
+            text(
+                "SELECT 1 FROM pg_database WHERE datname = :name",
+            ).bindparams(name=settings.db_base),
+        )
+        database_exists = database_existance.scalar() == 1
+    if database_exists:
+        await drop_database()
+    async with engine.connect() as conn:
+        await conn.execute(
+            text(
+                f'CREATE DATABASE "{settings.db_base}" '
+                "ENCODING 'utf8' TEMPLATE template1",
+            ),
+        )
+    await engine.dispose()
 
 
 async def drop_database() -> None:
     """Drop current database."""
-    if settings.db_file.exists():
-        Path(settings.db_file).unlink()
+    if settings.db_backend != DatabaseBackend.POSTGRESQL:
+        if settings.db_file.exists():
+            Path(settings.db_file).unlink()
+        return
+    db_url = str(settings.db_url.with_path("/postgres"))
+    engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
+    async with engine.connect() as conn:
+        await conn.execute(
+            text(
+                "SELECT pg_terminate_backend(pg_stat_activity.pid) "
+                "FROM pg_stat_activity "
+                "WHERE pg_stat_activity.datname = :name "
+                "AND pid <> pg_backend_pid()",
+            ).bindparams(name=settings.db_base),
+        )
+        await conn.execute(text(f'DROP DATABASE "{settings.db_base}"'))
+    await engine.dispose()
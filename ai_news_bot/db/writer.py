@@ -0,0 +1,194 @@
+"""Serialized, batched database writes."""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ai_news_bot.db.dependencies import get_session_factory
+from ai_news_bot.services import metrics
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT")
+WriteIntent = Callable[[AsyncSession], Awaitable[ResultT]]
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Any]) -> None:
+    """
+    Run a callback once the session's transaction is committed.
+
+    The callback is dropped if the transaction is rolled back instead.
+    It runs inside the commit, so it must not do I/O.
+
+    :param session: session of the write intent.
+    :param callback: function without arguments.
+    """
+    callbacks = session.info.get("after_commit")
+    if callbacks is None:
+        callbacks = session.info["after_commit"] = []
+        sync_session = session.sync_session
+        event.listen(sync_session, "after_commit", _run_after_commit)
+        event.listen(
+            sync_session,
+            "after_soft_rollback",
+            _drop_after_commit,
+        )
+    callbacks.append(callback)
+
+
+def _run_after_commit(sync_session) -> None:
+    callbacks = list(sync_session.info["after_commit"])
+    sync_session.info["after_commit"].clear()
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Error in after commit callback: {e}")
+
+
+def _drop_after_commit(sync_session, previous_transaction) -> None:
+    sync_session.info["after_commit"].clear()
+
+
+class DatabaseWriter:
+    """
+    Runs write intents one at a time and commits them in groups.
+
+    SQLite allows a single writer, so instead of every job committing on
+    its own and waiting on the others' locks, write intents are queued
+    to one task. The task collects whatever arrives within a short
+    window, runs the intents in one session and commits them together.
+    Callers await the result of their intent, which is only returned
+    once the commit succeeded.
+
+    If an intent fails, the group is rolled back and its intents are
+    run again one per transaction, so only the failing intent gets the
+    error. Intents must therefore not commit themselves and should be
+    safe to run twice. In-memory state following their writes is
+    changed with ``after_commit``, so a rolled back group leaves it as
+    it was.
+
+    Reads don't go through the writer.
+
+    :param batch_window: seconds to collect intents before committing.
+    :param max_batch: maximum number of intents per commit.
+    :param session_factory: factory of database sessions.
+    """
+
+    def __init__(
+        self,
+        batch_window: float = 0.005,
+        max_batch: int = 200,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[
+            tuple[WriteIntent, asyncio.Future] | None
+        ] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def sessions(self) -> async_sessionmaker[AsyncSession]:
+        """Factory of the writer's sessions."""
+        return self._session_factory or get_session_factory()
+
+    async def submit(self, intent: WriteIntent[ResultT]) -> ResultT:
+        """
+        Run a write intent and wait until it is committed.
+
+        When the writer isn't running, e.g. in scripts, the intent runs
+        and commits in its own session right away.
+
+        :param intent: coroutine function doing the writes in the given
+            session, without committing.
+        :return: what the intent returned.
+        """
+        if self._task is None:
+            async with self.sessions() as session:
+                result = await intent(session)
+                await session.commit()
+            return result
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((intent, future))
+        return await future
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Commit the intents already queued and stop the writer task."""
+        if self._task is None:
+            return
+        # Stop marker, everything queued before it is still committed.
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        # Intents submitted while stopping.
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                await self._commit([item])
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                return
+            await asyncio.sleep(self.batch_window)
+            batch = [item]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await self._commit(batch)
+            except Exception as e:
+                logger.error(f"Error committing writes: {e}")
+
+    async def _commit(
+        self,
+        batch: list[tuple[WriteIntent, asyncio.Future]],
+    ) -> None:
+        results: list[Any] = []
+        try:
+            async with self.sessions() as session:
+                for intent, _ in batch:
+                    results.append(await intent(session))
+                started = time.perf_counter()
+                await session.commit()
+                metrics.db_commit_seconds.observe(
+                    time.perf_counter() - started,
+                )
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            logger.warning(
+                f"Group commit of {len(batch)} writes failed, "
+                f"retrying them one by one: {e}"
+            )
+            for item in batch:
+                await self._commit([item])
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+db_writer = DatabaseWriter(
+    batch_window=settings.db_write_batch_window,
+    max_batch=settings.db_write_max_batch,
+)
@@ -0,0 +1,317 @@
+"""Logging off the event loop: queued records, batched Loki pushes."""
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterable
+
+from logging_loki.emitter import LokiEmitterV2
+
+from ai_news_bot.services import metrics
+
+# Attributes every record has, anything else was passed with ``extra``.
+RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)),
+) | {"message", "asctime"}
+
+_listener: QueueListener | None = None
+
+
+def _logfmt_value(value: Any) -> str:
+    text = str(value)
+    if text and not any(char in text for char in ' "=\n\\'):
+        return text
+    escaped = (
+        text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+    return f'"{escaped}"'
+
+
+class LogfmtFormatter(logging.Formatter):
+    """
+    Formats records as logfmt, including the fields given with ``extra``.
+
+    ``logger.info("Verdict for %s", title, extra={"task_id": 1})`` gives
+    ``msg="Verdict for ..." task_id=1``, which Loki's logfmt parser
+    turns into queryable fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as one logfmt line."""
+        fields = {"msg": record.getMessage()}
+        for name, value in record.__dict__.items():
+            if name not in RECORD_ATTRIBUTES:
+                fields[name] = value
+        if record.exc_info:
+            fields["exc"] = self.formatException(record.exc_info)
+        return " ".join(
+            f"{name}={_logfmt_value(value)}" for name, value in fields.items()
+        )
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets through at most ``rate`` records per message in every period.
+
+    Records are grouped by logger, level and unformatted message, so a
+    lazily formatted message counts as one however its arguments vary.
+    The first record let through after a period with dropped records
+    says how many were dropped.
+
+    :param rate: records per message and period.
+    :param period: length of a period in seconds.
+    :param max_messages: messages tracked before expired ones are
+        forgotten, f-string messages are all different.
+    """
+
+    def __init__(
+        self,
+        rate: int = 20,
+        period: float = 60.0,
+        max_messages: int = 10000,
+    ) -> None:
+        super().__init__()
+        self.rate = rate
+        self.period = period
+        self.max_messages = max_messages
+        # Message key -> start of its period, records and dropped records.
+        self._windows: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check if a record may pass, counting it."""
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                dropped = window[2] if window is not None else 0
+                if len(self._windows) >= self.max_messages:
+                    self._forget_expired(now)
+                self._windows[key] = [now, 1, 0]
+                if dropped:
+                    record.msg = (
+                        f"{record.msg} ({dropped} similar messages dropped)"
+                    )
+                return True
+            if window[1] < self.rate:
+                window[1] += 1
+                return True
+            window[2] += 1
+        metrics.log_records_dropped.labels("rate_limit").inc()
+        return False
+
+    def _forget_expired(self, now: float) -> None:
+        expired = [
+            key
+            for key, window in self._windows.items()
+            if now - window[0] >= self.period
+        ]
+        for key in expired:
+            del self._windows[key]
+        if len(self._windows) >= self.max_messages:
+            self._windows.clear()
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Puts records into a bounded queue for the listener thread.
+
+    Only the message is rendered on the logging thread, because its
+    arguments may change afterwards. Formatting with the handlers'
+    formatters happens in the listener thread. Records that don't fit
+    into the queue are dropped, logging never waits.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message arguments of a copy of the record."""
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.log_records_dropped.labels("queue_full").inc()
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    Queue listener flushing its handlers whenever the queue is idle.
+
+    :param flush_interval: seconds without records before flushing.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord | None:
+        """Wait for the next record, flushing while there is none."""
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+class BatchingLokiHandler(logging.Handler):
+    """
+    Pushes records to Loki in batches.
+
+    Meant to run in the queue listener thread, where the blocking HTTP
+    request doesn't hold up the application. A batch is pushed once it
+    holds ``batch_size`` records or its first record is
+    ``flush_interval`` seconds old, and whenever the handler is
+    flushed. A failed push is reported on stderr and its records are
+    dropped rather than retried, so an unreachable Loki can't pile up
+    records.
+
+    :param url: Loki push endpoint.
+    :param tags: labels of every record, level and logger are added.
+    :param auth: user and API key for basic authentication.
+    :param batch_size: records per push.
+    :param flush_interval: maximum age in seconds of a buffered record.
+    :param timeout: seconds to wait for Loki.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        tags: dict[str, str] | None = None,
+        auth: tuple[str, str] | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        timeout: float = 5.0,
+    ) -> None:
+        super().__init__()
+        self.emitter = LokiEmitterV2(url, tags, auth)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self._buffer: list[tuple[logging.LogRecord, str]] = []
+        self._first_buffered = 0.0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record, pushing the batch when it is due."""
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        if not self._buffer:
+            self._first_buffered = time.monotonic()
+        self._buffer.append((record, line))
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._first_buffered >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Push the buffered records."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            response = self.emitter.session.post(
+                self.emitter.url,
+                json=self.build_payload(batch),
+                headers=self.emitter.headers,
+                timeout=self.timeout,
+            )
+            if response.status_code != self.emitter.success_response_code:
+                raise ValueError(f"Loki responded {response.status_code}")
+        except Exception as e:
+            self.emitter.close()
+            sys.stderr.write(
+                f"Dropped {len(batch)} log records, Loki push failed: {e}\n",
+            )
+
+    def build_payload(
+        self,
+        batch: Iterable[tuple[logging.LogRecord, str]],
+    ) -> dict:
+        """Build the push request of records, one stream per label set."""
+        streams: defaultdict[tuple, list] = defaultdict(list)
+        for record, line in batch:
+            labels = tuple(sorted(self.emitter.build_tags(record).items()))
+            streams[labels].append([str(int(record.created * 1e9)), line])
+        return {
+            "streams": [
+                {"stream": dict(labels), "values": values}
+                for labels, values in streams.items()
+            ],
+        }
+
+    def close(self) -> None:
+        """Push what is left and close the HTTP session."""
+        self.flush()
+        self.emitter.close()
+        super().close()
+
+
+def start_queue_logging(
+    loggers: Iterable[logging.Logger],
+    handlers: list[logging.Handler],
+    queue_size: int = 10000,
+    rate_limit: int = 20,
+    rate_period: float = 60.0,
+    flush_interval: float = 1.0,
+) -> LogQueueHandler:
+    """
+    Move handlers behind a queue served by one listener thread.
+
+    The loggers' handlers are replaced by a queue handler. Handlers that
+    served only some of the loggers need a filter to keep doing so.
+
+    :param loggers: loggers to log through the queue.
+    :param handlers: handlers run by the listener thread.
+    :param queue_size: records waiting before new ones are dropped.
+    :param rate_limit: records per message and period.
+    :param rate_period: seconds of a rate limit period.
+    :param flush_interval: seconds without records before the
+        handlers are flushed.
+    :return: the queue handler.
+    """
+    global _listener
+    stop_queue_logging()
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = LogQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(rate_limit, rate_period))
+    for logger in loggers:
+        logger.handlers = [queue_handler]
+    _listener = FlushingQueueListener(
+        log_queue,
+        *handlers,
+        flush_interval=flush_interval,
+    )
+    _listener.start()
+    return queue_handler
+
+
+def stop_queue_logging() -> None:
+    """Handle the queued records and stop the listener thread."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_queue_logging)
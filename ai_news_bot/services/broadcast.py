@@ -0,0 +1,220 @@
+"""Fan-out of Redis pub/sub messages to WebSocket clients."""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Collection
+
+from redis.asyncio import ConnectionPool, Redis
+from starlette.websockets import WebSocket
+
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the channels the news verdicts are published to.
+RELEVANT_NEWS_CHANNEL = "relevant_news"
+# Sent to idle clients so proxies keep the connection open and dead
+# clients are noticed. The dashboard skips it.
+HEARTBEAT = '{"type": "heartbeat"}'
+# Close code telling a client it fell behind and may reconnect.
+TRY_AGAIN_LATER = 1013
+
+
+# Messages waiting to be sent to one client, None closes the connection.
+ClientQueue = asyncio.Queue[str | None]
+
+
+def task_channel(
+    task_id: int | str,
+    channel: str = RELEVANT_NEWS_CHANNEL,
+) -> str:
+    """
+    Get the channel of one task's verdicts.
+
+    :param task_id: task ID, or "*" for the pattern of all tasks.
+    :param channel: channel prefix.
+    """
+    return f"{channel}:task:{task_id}"
+
+
+class BroadcastHub:
+    """
+    Shares one Redis subscription between all WebSocket clients.
+
+    Verdicts are published to one channel per task. A single task per
+    process listens to all of them with a pattern subscription and puts
+    every message, decoded once, into the bounded queues of the clients
+    watching that task only, so messages are routed without parsing
+    them. A client whose queue fills up is disconnected instead of
+    holding messages for everyone, and can reconnect. Idle clients get
+    a heartbeat.
+
+    :param channel: prefix of the task channels to listen to.
+    :param queue_size: messages buffered per client.
+    :param heartbeat_interval: seconds of silence before a heartbeat.
+    :param retry_delay: seconds to wait before resubscribing after a
+        Redis error.
+    """
+
+    def __init__(
+        self,
+        channel: str = RELEVANT_NEWS_CHANNEL,
+        queue_size: int = 100,
+        heartbeat_interval: float = 25.0,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self.channel = channel
+        self.queue_size = queue_size
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_delay = retry_delay
+        # Watched task IDs by client, and clients by task ID.
+        self._clients: dict[ClientQueue, frozenset[int]] = {}
+        self._task_clients: defaultdict[int, set[ClientQueue]] = (
+            defaultdict(set)
+        )
+        self._task: asyncio.Task | None = None
+
+    @property
+    def client_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    def start(self, redis_pool: ConnectionPool) -> None:
+        """Start listening to the task channels."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(redis_pool))
+
+    async def stop(self) -> None:
+        """Stop listening to the task channels."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def subscribe(self, task_ids: Collection[int]) -> ClientQueue:
+        """
+        Register a client, returning its message queue.
+
+        :param task_ids: IDs of the tasks whose verdicts it gets.
+        """
+        queue: ClientQueue = asyncio.Queue(maxsize=self.queue_size)
+        self._clients[queue] = frozenset(task_ids)
+        for task_id in self._clients[queue]:
+            self._task_clients[task_id].add(queue)
+        return queue
+
+    def unsubscribe(self, queue: ClientQueue) -> None:
+        """Forget a client."""
+        for task_id in self._clients.pop(queue, ()):
+            clients = self._task_clients[task_id]
+            clients.discard(queue)
+            if not clients:
+                del self._task_clients[task_id]
+
+    def watches(self, task_id: int) -> bool:
+        """Check if any client gets the verdicts of a task."""
+        return task_id in self._task_clients
+
+    def broadcast(self, task_id: int, data: str) -> None:
+        """
+        Queue a message for every client watching a task.
+
+        :param task_id: ID of the task the message is about.
+        :param data: message text.
+        """
+        for queue in list(self._task_clients.get(task_id, ())):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self._drop(queue)
+
+    def _drop(self, queue: ClientQueue) -> None:
+        logger.warning("WebSocket client is too slow, disconnecting it")
+        self.unsubscribe(queue)
+        # Replace the backlog with the stop marker.
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def serve(
+        self,
+        websocket: WebSocket,
+        task_ids: Collection[int],
+    ) -> None:
+        """
+        Stream messages to an accepted WebSocket until it disconnects.
+
+        :param websocket: accepted client connection.
+        :param task_ids: IDs of the tasks whose verdicts it gets.
+        """
+        queue = self.subscribe(task_ids)
+        sender = asyncio.create_task(self._send(websocket, queue))
+        receiver = asyncio.create_task(self._receive(websocket))
+        try:
+            await asyncio.wait(
+                {sender, receiver},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            self.unsubscribe(queue)
+            for task in (sender, receiver):
+                task.cancel()
+            await asyncio.gather(sender, receiver, return_exceptions=True)
+
+    async def _send(self, websocket: WebSocket, queue: ClientQueue) -> None:
+        while True:
+            try:
+                data = await asyncio.wait_for(
+                    queue.get(),
+                    timeout=self.heartbeat_interval,
+                )
+            except asyncio.TimeoutError:
+                data = HEARTBEAT
+            if data is None:
+                await websocket.close(
+                    code=TRY_AGAIN_LATER,
+                    reason="Client is too slow",
+                )
+                return
+            await websocket.send_text(data)
+
+    async def _receive(self, websocket: WebSocket) -> None:
+        # Messages from clients are ignored, this only waits for the
+        # disconnect.
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+    async def _listen(self, redis_pool: ConnectionPool) -> None:
+        while True:
+            try:
+                async with Redis(connection_pool=redis_pool) as redis:
+                    async with redis.pubsub() as pubsub:
+                        await pubsub.psubscribe(
+                            task_channel("*", self.channel),
+                        )
+                        async for message in pubsub.listen():
+                            if message["type"] == "pmessage":
+                                self._route(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Error listening to {self.channel} tasks, "
+                    f"resubscribing: {e}"
+                )
+                await asyncio.sleep(self.retry_delay)
+
+    def _route(self, message: dict) -> None:
+        task_id = int(message["channel"].rsplit(b":", 1)[1])
+        # Verdicts of tasks nobody here watches aren't even decoded.
+        if self.watches(task_id):
+            self.broadcast(task_id, message["data"].decode())
+
+
+broadcast_hub = BroadcastHub(
+    queue_size=settings.ws_queue_size,
+    heartbeat_interval=settings.ws_heartbeat_interval,
+)
@@ -0,0 +1,62 @@
+"""In-process caches."""
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class LRUCache(Generic[KeyT, ValueT]):
+    """
+    A small least-recently-used cache.
+
+    Not thread-safe; it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[KeyT, ValueT] = OrderedDict()
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """
+        Get a value and mark it as recently used.
+
+        :param key: cache key.
+        :return: cached value or None.
+        """
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """
+        Store a value, evicting the least recently used one when full.
+
+        :param key: cache key.
+        :param value: value to store.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: KeyT) -> ValueT | None:
+        """
+        Remove a value from the cache.
+
+        :param key: cache key.
+        :return: the removed value or None.
+        """
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
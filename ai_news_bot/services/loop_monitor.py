@@ -0,0 +1,119 @@
+"""Watchdog for code blocking the event loop."""
+import asyncio
+import logging
+import math
+import sys
+import threading
+import time
+import traceback
+
+from ai_news_bot.services import metrics
+from ai_news_bot.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """
+    Measures event loop lag and reports what blocks the loop.
+
+    A task on the loop sleeps for ``interval`` and observes how late it
+    wakes up. A thread checks that the task keeps waking up, and when
+    it hasn't for ``threshold`` seconds, logs the stack of the loop's
+    thread, which is the code blocking it. asyncio's debug mode would
+    report slow callbacks too, but slows down the whole application.
+
+    :param interval: seconds between lag measurements.
+    :param threshold: seconds of lag that count as a stall.
+    :param dump_interval: minimum seconds between stack dumps.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        threshold: float = 0.5,
+        dump_interval: float = 60.0,
+    ) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.dump_interval = dump_interval
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._loop_thread_id = 0
+        # Last time the measuring task woke up.
+        self._heartbeat = 0.0
+        self._dumped_at = -math.inf
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._thread = threading.Thread(
+            target=self._watch,
+            name="loop-monitor",
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _measure(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            lag = max(now - expected, 0.0)
+            metrics.event_loop_lag_seconds.observe(lag)
+            if lag >= self.threshold:
+                metrics.event_loop_stalls.inc()
+
+    def _watch(self) -> None:
+        # Whether the current stall was reported already.
+        reported = False
+        while not self._stopping.wait(self.interval):
+            stalled = time.monotonic() - self._heartbeat - self.interval
+            if stalled < self.threshold:
+                reported = False
+                continue
+            if reported:
+                continue
+            reported = True
+            now = time.monotonic()
+            if now - self._dumped_at < self.dump_interval:
+                continue
+            self._dumped_at = now
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            logger.warning(
+                "Event loop blocked for %.2f seconds in:\n%s",
+                stalled,
+                "".join(traceback.format_stack(frame)),
+                extra={"stalled_seconds": round(stalled, 3)},
+            )
+
+
+loop_monitor = LoopMonitor(
+    interval=settings.loop_lag_interval,
+    threshold=settings.loop_lag_threshold,
+    dump_interval=settings.loop_lag_dump_interval,
+)
@@ -0,0 +1,384 @@
+"""In-process pipeline metrics in the Prometheus text format."""
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Sequence
+
+# Content type of the Prometheus text exposition format.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds, from a local database commit to a slow LLM request.
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+# Seconds to a day, for the latency of news through the pipeline.
+NEWS_LATENCY_BUCKETS = (
+    1.0,
+    5.0,
+    15.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+    3600.0,
+    7200.0,
+    21600.0,
+    86400.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+class CounterValue:
+    """Value of a counter for one set of label values."""
+
+    def __init__(self) -> None:
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter."""
+        self.value += amount
+
+
+class GaugeValue:
+    """Value of a gauge for one set of label values."""
+
+    def __init__(self) -> None:
+        self._value: float = 0
+        self._function: Callable[[], float] | None = None
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        if self._function is not None:
+            return self._function()
+        return self._value
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the gauge."""
+        self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrease the gauge."""
+        self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from a function whenever metrics are scraped."""
+        self._function = function
+
+
+class HistogramValue:
+    """Observations of a histogram for one set of label values."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # Observations per bucket, not cumulative, the last one is +Inf.
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the seconds the block takes."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Metric:
+    """
+    Base of the metric types.
+
+    Values are kept per combination of label values and created on
+    first use. Updates are plain attribute changes without locks: they
+    happen on the event loop, which is also where metrics are rendered.
+
+    :param name: metric name.
+    :param documentation: help text.
+    :param labelnames: names of the labels.
+    :param registry: registry the metric is rendered by.
+    """
+
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: "Registry | None" = None,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], object] = {}
+        (REGISTRY if registry is None else registry).register(self)
+
+    def labels(self, *values: object):
+        """
+        Get the value of a combination of label values.
+
+        :param values: label values, in the order of the label names.
+        """
+        key = tuple(str(value) for value in values)
+        child = self._values.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} has labels {self.labelnames}, "
+                    f"got {len(key)} values",
+                )
+            child = self._values[key] = self._new_value()
+        return child
+
+    def _new_value(self) -> object:
+        raise NotImplementedError
+
+    def _samples(self) -> Iterator[tuple[str, str, float]]:
+        """Yield name suffix, formatted labels and value of samples."""
+        for key, child in self._values.items():
+            labels = _format_labels(self.labelnames, key)
+            yield "", labels, child.value
+
+    def render(self) -> Iterator[str]:
+        """Yield the lines of the metric in the text format."""
+        yield f"# HELP {self.name} {_escape(self.documentation)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for suffix, labels, value in self._samples():
+            yield f"{self.name}{suffix}{labels} {_format_value(value)}"
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def _new_value(self) -> CounterValue:
+        return CounterValue()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter without labels."""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Value that goes up and down."""
+
+    type_name = "gauge"
+
+    def _new_value(self) -> GaugeValue:
+        return GaugeValue()
+
+    def set(self, value: float) -> None:
+        """Set the gauge without labels."""
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the gauge without labels from a function."""
+        self.labels().set_function(function)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observations in cumulative buckets.
+
+    :param buckets: upper bounds of the buckets, +Inf is added.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: "Registry | None" = None,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_value(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation without labels."""
+        self.labels().observe(value)
+
+    def time(self):
+        """Observe the seconds a block takes, without labels."""
+        return self.labels().time()
+
+    def _samples(self) -> Iterator[tuple[str, str, float]]:
+        names = (*self.labelnames, "le")
+        for key, child in self._values.items():
+            cumulative = 0
+            bounds = (*self.buckets, math.inf)
+            for bound, count in zip(bounds, child.counts):
+                cumulative += count
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, child.sum
+            yield "_count", labels, child.count
+
+
+class Registry:
+    """Collection of the metrics exposed together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        """Add a metric, its name has to be unique."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines = [
+            line
+            for metric in self._metrics.values()
+            for line in metric.render()
+        ]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+feed_fetch_seconds = Histogram(
+    "ai_news_bot_feed_fetch_seconds",
+    "Time to fetch a news source.",
+    ["source"],
+)
+feed_fetch_bytes = Counter(
+    "ai_news_bot_feed_fetch_bytes_total",
+    "Bytes downloaded from a news source.",
+    ["source"],
+)
+feed_fetch_errors = Counter(
+    "ai_news_bot_feed_fetch_errors_total",
+    "Failed fetches of a news source.",
+    ["source"],
+)
+news_items_parsed = Counter(
+    "ai_news_bot_news_items_parsed_total",
+    "News items read from a source.",
+    ["source"],
+)
+news_items_new = Counter(
+    "ai_news_bot_news_items_new_total",
+    "News items of a source added to the database.",
+    ["source"],
+)
+news_items_duplicate = Counter(
+    "ai_news_bot_news_items_duplicate_total",
+    "News items of a source that were already in the database.",
+    ["source"],
+)
+news_backlog = Gauge(
+    "ai_news_bot_news_backlog",
+    "Unprocessed news when the consumer last ran.",
+)
+llm_request_seconds = Histogram(
+    "ai_news_bot_llm_request_seconds",
+    "Time of successful LLM requests, by model and news task or purpose.",
+    ["model", "task"],
+)
+llm_tokens = Counter(
+    "ai_news_bot_llm_tokens_total",
+    "Tokens used by LLM requests, by model and news task or purpose.",
+    ["model", "task"],
+)
+llm_errors = Counter(
+    "ai_news_bot_llm_errors_total",
+    "Failed LLM requests, by model and news task or purpose.",
+    ["model", "task"],
+)
+delivery_queue_depth = Gauge(
+    "ai_news_bot_delivery_queue_depth",
+    "Telegram messages waiting for delivery.",
+)
+delivery_send_seconds = Histogram(
+    "ai_news_bot_delivery_send_seconds",
+    "Time to send a Telegram message.",
+)
+db_commit_seconds = Histogram(
+    "ai_news_bot_db_commit_seconds",
+    "Time of group commits of the database writer.",
+)
+news_stage_seconds = Histogram(
+    "ai_news_bot_news_stage_seconds",
+    "Time news took to reach a stage from the previous one, or from "
+    "publication for the fetched stage.",
+    ["stage"],
+    buckets=NEWS_LATENCY_BUCKETS,
+)
+news_delivery_seconds = Histogram(
+    "ai_news_bot_news_delivery_seconds",
+    "Time from publication of news to its delivery to a chat.",
+    buckets=NEWS_LATENCY_BUCKETS,
+)
+log_records_dropped = Counter(
+    "ai_news_bot_log_records_dropped_total",
+    "Log records dropped before reaching the handlers, by reason.",
+    ["reason"],
+)
+event_loop_lag_seconds = Histogram(
+    "ai_news_bot_event_loop_lag_seconds",
+    "Time the event loop was late to wake up a sleeping task.",
+)
+event_loop_stalls = Counter(
+    "ai_news_bot_event_loop_stalls_total",
+    "Times the event loop lag crossed the stall threshold.",
+)
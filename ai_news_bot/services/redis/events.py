@@ -0,0 +1,99 @@
+"""Server-sent event stream of news verdicts."""
+import re
+import zlib
+from typing import AsyncIterator, Collection
+
+from redis.asyncio import ConnectionPool, Redis
+
+from ai_news_bot.services.redis.publisher import RELEVANT_NEWS_STREAM
+
+EVENT_ID_RE = re.compile(r"^\d+-\d+$")
+# Comment line keeping idle connections open through proxies.
+KEEPALIVE = b": keep-alive\n\n"
+# Milliseconds browsers wait before reconnecting.
+RETRY_MS = 3000
+
+
+def format_event(event_id: str, data: str) -> bytes:
+    """Format a server-sent event."""
+    return f"id: {event_id}\ndata: {data}\n\n".encode()
+
+
+class GzipStream:
+    """
+    Gzip compression of an endless response, one chunk at a time.
+
+    Every chunk is flushed so it reaches the client right away, while
+    the compressor keeps its history, so repeated field names in later
+    events cost almost nothing.
+    """
+
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress a chunk and flush it."""
+        return (
+            self._compressor.compress(chunk)
+            + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        )
+
+
+async def read_events(
+    redis_pool: ConnectionPool,
+    last_event_id: str | None = None,
+    task_ids: Collection[int] | None = None,
+    result: bool | None = None,
+    keepalive: float = 15.0,
+    stream: str = RELEVANT_NEWS_STREAM,
+    count: int = 100,
+) -> AsyncIterator[bytes]:
+    """
+    Stream verdicts from the Redis stream as server-sent events.
+
+    :param redis_pool: Redis connection pool.
+    :param last_event_id: ID of the last event the client received.
+        Events after it are sent first, as far as the stream still
+        holds them. Without it, only new events are sent.
+    :param task_ids: only send verdicts for these tasks, all by
+        default.
+    :param result: only send relevant (True) or irrelevant verdicts.
+    :param keepalive: seconds without events before a keep-alive.
+    :param stream: Redis stream to read.
+    :param count: maximum number of entries read at once.
+    :yield: encoded events.
+    """
+    expected_result = None if result is None else str(int(result)).encode()
+    yield f"retry: {RETRY_MS}\n\n".encode()
+    async with Redis(connection_pool=redis_pool) as redis:
+        if last_event_id is None:
+            # Start after the current last entry. Reading from "$" on
+            # every call would lose entries added between the calls.
+            latest = await redis.xrevrange(stream, count=1)
+            last_event_id = latest[0][0] if latest else "0-0"
+        while True:
+            response = await redis.xread(
+                {stream: last_event_id},
+                count=count,
+                block=int(keepalive * 1000),
+            )
+            if not response:
+                yield KEEPALIVE
+                continue
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    last_event_id = entry_id
+                    if (
+                        task_ids is not None
+                        and int(fields[b"task"]) not in task_ids
+                    ):
+                        continue
+                    if (
+                        expected_result is not None
+                        and fields[b"result"] != expected_result
+                    ):
+                        continue
+                    yield format_event(
+                        entry_id.decode(),
+                        fields[b"data"].decode(),
+                    )
@@ -0,0 +1,143 @@
+"""Publishing of news verdicts to the live results channel."""
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import ujson
+from redis.asyncio import ConnectionPool, Redis
+
+from ai_news_bot.services.broadcast import (
+    RELEVANT_NEWS_CHANNEL,
+    task_channel,
+)
+from ai_news_bot.settings import settings
+
+if TYPE_CHECKING:
+    from ai_news_bot.db.models.news import News
+    from ai_news_bot.db.models.news_task import NewsTask
+
+logger = logging.getLogger(__name__)
+
+# Recent verdicts, for clients resuming the event stream.
+RELEVANT_NEWS_STREAM = "relevant_news:stream"
+
+
+def encode_verdict(news: "News", news_task: "NewsTask", result: bool) -> str:
+    """
+    Serialize a verdict in the RedisNewsMessageSchema format.
+
+    Only IDs and the fields the live results page shows are included.
+    """
+    return ujson.dumps(
+        {
+            "news": {
+                "id": news.id,
+                "title": news.title,
+                "link": news.link,
+                "pub_date": news.pub_date.isoformat(),
+                "source_name": news.source_name,
+            },
+            "task": {
+                "id": news_task.id,
+                "title": news_task.title,
+                "result": result,
+            },
+        },
+        ensure_ascii=False,
+    )
+
+
+class VerdictPublisher:
+    """
+    Collects verdicts and publishes them in one Redis round trip.
+
+    Verdicts are buffered while the consumer works through its batch
+    and sent with a pipeline when the consumer flushes: published to
+    the task's channel for WebSocket clients and appended to a capped stream
+    for event stream clients. Until started with a Redis pool, e.g. in
+    scripts and tests, verdicts are dropped.
+
+    :param channel: prefix of the task channels to publish to.
+    :param stream: Redis stream to append to.
+    :param stream_maxlen: approximate number of verdicts the stream
+        keeps.
+    :param max_events: buffered verdicts that make a flush due.
+    :param max_delay: seconds since the last publish that make a flush
+        due, so the live results page isn't a whole batch behind.
+    """
+
+    def __init__(
+        self,
+        channel: str = RELEVANT_NEWS_CHANNEL,
+        stream: str = RELEVANT_NEWS_STREAM,
+        stream_maxlen: int = 10000,
+        max_events: int = 50,
+        max_delay: float = 1.0,
+    ) -> None:
+        self.channel = channel
+        self.stream = stream
+        self.stream_maxlen = stream_maxlen
+        self.max_events = max_events
+        self.max_delay = max_delay
+        self._pool: ConnectionPool | None = None
+        # Task ID, verdict and encoded event of every buffered verdict.
+        self._events: list[tuple[int, bool, str]] = []
+        self._published_at = time.monotonic()
+
+    def start(self, redis_pool: ConnectionPool) -> None:
+        """Start publishing to the given Redis."""
+        self._pool = redis_pool
+
+    def stop(self) -> None:
+        """Stop publishing, dropping buffered verdicts."""
+        self._pool = None
+        self._events = []
+
+    def add(self, news: "News", news_task: "NewsTask", result: bool) -> None:
+        """Buffer a verdict for publishing."""
+        if self._pool is not None:
+            event = encode_verdict(news, news_task, result)
+            self._events.append((news_task.id, result, event))
+
+    async def flush(self, force: bool = True) -> None:
+        """
+        Publish the buffered verdicts.
+
+        :param force: publish even if the buffer isn't due yet.
+        """
+        if not self._events or self._pool is None:
+            return
+        if not force and (
+            len(self._events) < self.max_events
+            and time.monotonic() - self._published_at < self.max_delay
+        ):
+            return
+        events, self._events = self._events, []
+        self._published_at = time.monotonic()
+        try:
+            async with Redis(connection_pool=self._pool) as redis:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for task_id, result, event in events:
+                        pipe.publish(
+                            task_channel(task_id, self.channel),
+                            event,
+                        )
+                        # Filter fields, so readers don't parse events.
+                        pipe.xadd(
+                            self.stream,
+                            {
+                                "task": task_id,
+                                "result": int(result),
+                                "data": event,
+                            },
+                            maxlen=self.stream_maxlen,
+                            approximate=True,
+                        )
+                    await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error publishing {len(events)} verdicts: {e}")
+
+
+verdict_publisher = VerdictPublisher(
+    stream_maxlen=settings.events_stream_maxlen,
+)
@@ -1,9 +1,24 @@
+from datetime import datetime
+
 from pydantic import BaseModel
 
-from ai_news_bot.web.api.news_task.schema import (
-    NewsTaskRedisSchema,
-    RSSItemSchema,
-)
+
+class RedisNewsSchema(BaseModel):
+    """News fields shown on the live results page."""
+
+    id: int
+    title: str
+    link: str | None
+    pub_date: datetime
+    source_name: str
+
+
+class RedisVerdictSchema(BaseModel):
+    """Task a news item was checked for, and the verdict."""
+
+    id: int
+    title: str
+    result: bool
 
 
 class RedisNewsMessageSchema(BaseModel):
@@ -12,9 +27,5 @@ class RedisNewsMessageSchema(BaseModel):
     Contains news and task information.
     """
 
-    news: RSSItemSchema
-    task: NewsTaskRedisSchema
-
-    model_config = {
-        "arbitrary_types_allowed": True,
-    }
+    news: RedisNewsSchema
+    task: RedisVerdictSchema
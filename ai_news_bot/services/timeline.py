@@ -0,0 +1,156 @@
+"""Latency of news through the pipeline, from publication to delivery."""
+import enum
+import logging
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from ai_news_bot.db.crud.news_stage import crud_news_stage
+from ai_news_bot.db.writer import db_writer
+from ai_news_bot.services import metrics
+
+if TYPE_CHECKING:
+    from ai_news_bot.db.models.news_stage import NewsStage
+
+logger = logging.getLogger(__name__)
+
+
+class Stage(str, enum.Enum):
+    """Pipeline stages, in the order news goes through them."""
+
+    FETCHED = "fetched"
+    INSERTED = "inserted"
+    CLASSIFIED = "classified"
+    QUEUED = "queued"
+    DELIVERED = "delivered"
+
+
+# Stages recorded once per news item, the others once per task.
+NEWS_STAGES = (Stage.FETCHED, Stage.INSERTED)
+
+
+def seconds_between(start: datetime, end: datetime) -> float:
+    """
+    Get the seconds from one moment to another, at least 0.
+
+    Naive datetimes are taken as local time, so publication dates with a
+    time zone can be compared to the pipeline's naive timestamps.
+    """
+    if (start.tzinfo is None) != (end.tzinfo is None):
+        start, end = start.astimezone(), end.astimezone()
+    return max((end - start).total_seconds(), 0.0)
+
+
+def stage_row(
+    news_id: int,
+    stage: Stage,
+    at: datetime,
+    task_id: int | None = None,
+) -> dict[str, Any]:
+    """Build the column values of a stage timestamp."""
+    return {
+        "news_id": news_id,
+        "task_id": task_id,
+        "stage": stage.value,
+        "at": at,
+    }
+
+
+def observe(stage: Stage, since: datetime, at: datetime) -> None:
+    """
+    Record how long news took to reach a stage.
+
+    :param stage: stage reached.
+    :param since: time of the previous stage, or the publication date
+        for the fetched stage.
+    :param at: time the stage was reached.
+    """
+    metrics.news_stage_seconds.labels(stage.value).observe(
+        seconds_between(since, at),
+    )
+
+
+async def record(stages: list[dict[str, Any]]) -> None:
+    """
+    Store stage timestamps through the database writer.
+
+    Failures are logged only, losing a timestamp mustn't stop news.
+
+    :param stages: rows built with ``stage_row``.
+    """
+    if not stages:
+        return
+    try:
+        await db_writer.submit(
+            partial(crud_news_stage.add_many, stages=stages),
+        )
+    except Exception as e:
+        logger.error(f"Error recording {len(stages)} news stages: {e}")
+
+
+async def record_delivery(
+    news_id: int,
+    task_id: int,
+    pub_date: datetime,
+    queued_at: datetime,
+) -> None:
+    """Record a message about news delivered to a chat."""
+    now = datetime.now()
+    observe(Stage.DELIVERED, queued_at, now)
+    metrics.news_delivery_seconds.observe(seconds_between(pub_date, now))
+    await record([stage_row(news_id, Stage.DELIVERED, now, task_id)])
+
+
+def explain(
+    pub_date: datetime,
+    stages: list["NewsStage"],
+) -> list[dict[str, Any]]:
+    """
+    Break the latency of news down into its steps, per task.
+
+    Every step is the time from the previous recorded stage to the
+    first time a stage was reached, starting at the publication date.
+    Stages without a timestamp are skipped, so news never classified
+    for a task only shows the steps up to insertion.
+
+    :param pub_date: publication date of the news.
+    :param stages: stage timestamps of the news.
+    :return: for every task, its ID, the steps with their stage, time
+        and seconds, the total seconds and the slowest stage.
+    """
+    first: dict[tuple[int | None, str], datetime] = {}
+    for row in stages:
+        task_id = None if row.stage in NEWS_STAGES else row.task_id
+        key = (task_id, row.stage)
+        if key not in first or row.at < first[key]:
+            first[key] = row.at
+    task_ids = sorted(
+        {task_id for task_id, _ in first if task_id is not None},
+    ) or [None]
+    timelines = []
+    for task_id in task_ids:
+        steps = []
+        previous = pub_date
+        for stage in Stage:
+            owner = None if stage in NEWS_STAGES else task_id
+            at = first.get((owner, stage.value))
+            if at is None:
+                continue
+            steps.append(
+                {
+                    "stage": stage.value,
+                    "at": at,
+                    "seconds": seconds_between(previous, at),
+                },
+            )
+            previous = at
+        slowest = max(steps, key=lambda step: step["seconds"], default=None)
+        timelines.append(
+            {
+                "task_id": task_id,
+                "steps": steps,
+                "total_seconds": seconds_between(pub_date, previous),
+                "slowest": slowest["stage"] if slowest else None,
+            },
+        )
+    return timelines
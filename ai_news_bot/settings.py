@@ -5,7 +5,6 @@ from tempfile import gettempdir
 from typing import Optional
 import logging
 import logging.config
-import logging_loki
 
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,16 +28,40 @@ def setup_logging(
     log_level: LogLevel = LogLevel.INFO,
     loki_url: Optional[str] = None,
     loki_user: Optional[str] = None,
-    loki_api_key: Optional[str] = None
+    loki_api_key: Optional[str] = None,
+    queue_size: int = 10000,
+    rate_limit: int = 20,
+    rate_period: float = 60.0,
+    loki_batch_size: int = 500,
+    loki_flush_interval: float = 2.0,
 ) -> None:
     """
     Setup logging configuration.
 
+    Handlers run in a listener thread behind a queue, so a slow file
+    system or Loki never blocks the event loop.
+
     :param log_level: The log level to use.
     :param loki_url: Optional Loki URL for remote logging.
     :param loki_user: Optional Loki user ID.
     :param loki_api_key: Optional Loki API key.
+    :param queue_size: Records waiting for the handlers before new
+        ones are dropped.
+    :param rate_limit: Records per message and rate period.
+    :param rate_period: Seconds of a rate limit period.
+    :param loki_batch_size: Records per Loki push.
+    :param loki_flush_interval: Maximum seconds a record waits for its
+        Loki push.
     """
+    # Imported here, as it uses the metrics, which use the settings.
+    from ai_news_bot.log import (
+        BatchingLokiHandler,
+        LogfmtFormatter,
+        start_queue_logging,
+        stop_queue_logging,
+    )
+
+    stop_queue_logging()
     logging_config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -57,6 +80,12 @@ def setup_logging(
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
         },
+        "filters": {
+            # The file and Loki only get the application's records.
+            "application": {
+                "name": "ai_news_bot",
+            },
+        },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
@@ -68,6 +97,7 @@ def setup_logging(
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": log_level.value,
                 "formatter": "detailed",
+                "filters": ["application"],
                 "filename": "ai_news_bot.log",
                 "maxBytes": 10485760,  # 10MB
                 "backupCount": 5,
@@ -104,25 +134,39 @@ def setup_logging(
 
     logging.config.dictConfig(logging_config)
 
+    ai_logger = logging.getLogger("ai_news_bot")
+    # The console and file handlers, the console serves every logger.
+    handlers = list(ai_logger.handlers)
+    loki_error = None
     # Add Loki handler if credentials are provided
     if loki_url and loki_user and loki_api_key:
         try:
-            loki_handler = logging_loki.LokiHandler(
+            loki_handler = BatchingLokiHandler(
                 url=f"{loki_url}/loki/api/v1/push",
                 tags={"application": "verstka-media-watcher"},
                 auth=(loki_user, loki_api_key),
-                version="2",
+                batch_size=loki_batch_size,
+                flush_interval=loki_flush_interval,
             )
             loki_handler.setLevel(log_level.value)
-
-            # Add to ai_news_bot logger
-            ai_logger = logging.getLogger("ai_news_bot")
-            ai_logger.addHandler(loki_handler)
+            loki_handler.setFormatter(LogfmtFormatter())
+            loki_handler.addFilter(logging.Filter("ai_news_bot"))
+            handlers.append(loki_handler)
         except Exception as e:
             # Don't fail startup if Loki is unavailable
-            logging.getLogger("ai_news_bot").warning(
-                f"Failed to setup Loki handler: {e}"
-            )
+            loki_error = e
+    start_queue_logging(
+        loggers=[
+            logging.getLogger(name)
+            for name in (*logging_config["loggers"], None)
+        ],
+        handlers=handlers,
+        queue_size=queue_size,
+        rate_limit=rate_limit,
+        rate_period=rate_period,
+    )
+    if loki_error is not None:
+        ai_logger.warning(f"Failed to setup Loki handler: {loki_error}")
 
 
 def get_logger(name: str = "ai_news_bot") -> logging.Logger:
@@ -136,6 +180,13 @@ def get_logger(name: str = "ai_news_bot") -> logging.Logger:
     return logger
 
 
+class DatabaseBackend(str, enum.Enum):
+    """Supported databases."""
+
+    SQLITE = "sqlite"
+    POSTGRESQL = "postgresql"
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -157,16 +208,57 @@ class Settings(BaseSettings):
     environment: str = "dev"
 
     log_level: LogLevel = LogLevel.INFO
+    # Records waiting for the logging thread before new ones are dropped,
+    # and records of one message let through per rate period (seconds).
+    log_queue_size: int = 10000
+    log_rate_limit: int = 20
+    log_rate_period: float = 60.0
     users_secret: str = os.getenv("USERS_SECRET", "")
     # Variables for the database
+    db_backend: DatabaseBackend = DatabaseBackend.SQLITE
     db_file: Path = Path("/app/data/media_watcher_verstka.db")
+    # PostgreSQL connection, used with db_backend=postgresql.
+    db_host: str = "media-watcher-db"
+    db_port: int = 5432
+    db_user: str = "ai_news_bot"
+    db_pass: str = "ai_news_bot"
+    db_base: str = "ai_news_bot"
     db_echo: bool = False
+    # SQLite connection tuning: busy wait in ms, mmap size in bytes and
+    # page cache size in KiB.
+    db_busy_timeout: int = 5000
+    db_mmap_size: int = 256 * 1024 * 1024
+    db_cache_size_kib: int = 64 * 1024
+    # Group commits of the single database writer.
+    db_write_batch_window: float = 0.005
+    db_write_max_batch: int = 200
+    # News older than this many days is archived and removed daily.
+    news_retention_days: int = 30
+    news_archive_dir: Path = Path("/app/data/archive")
+    news_retention_batch: int = 500
+    # Seconds between delete batches, so other writers get their turn.
+    news_retention_pause: float = 0.1
+    # Free pages returned to the file system per incremental vacuum step.
+    db_vacuum_pages: int = 1000
     # Variables for Redis
     redis_host: str = "media-watcher-redis"
     redis_port: int = 6379
     redis_user: Optional[str] = None
     redis_pass: Optional[str] = None
     redis_base: Optional[int] = None
+    # Live results WebSocket: messages buffered per client before it is
+    # disconnected as too slow, and seconds between heartbeats.
+    ws_queue_size: int = 100
+    ws_heartbeat_interval: float = 25.0
+    # Verdicts kept in the Redis stream behind the event stream endpoint,
+    # and seconds an idle event stream waits before a keep-alive.
+    events_stream_maxlen: int = 10000
+    events_keepalive: float = 15.0
+    # Event loop watchdog: seconds between lag measurements, lag that
+    # counts as a stall, and minimum seconds between stack dumps.
+    loop_lag_interval: float = 0.1
+    loop_lag_threshold: float = 0.5
+    loop_lag_dump_interval: float = 60.0
     # For testing purposes.
     tg_bot_test_token: Optional[str] = None
     tg_bot_token: Optional[str] = None
@@ -176,9 +268,47 @@ class Settings(BaseSettings):
     loki_name: Optional[str] = None
     loki_url: Optional[str] = None
     loki_user: Optional[str] = None
+    # Records per Loki push and seconds a record waits for its push.
+    loki_batch_size: int = 500
+    loki_flush_interval: float = 2.0
     tg_session_string: Optional[str] = None
     tg_api_id: Optional[int] = None
     tg_api_hash: Optional[str] = None
+    # Telegram delivery: concurrent senders and Bot API rate limits.
+    tg_delivery_workers: int = 4
+    tg_global_rate: float = 30.0
+    tg_chat_rate: float = 1.0
+    tg_group_rate_per_minute: float = 20.0
+    # Durable outbox: pending message cap and retry policy.
+    tg_outbox_max_depth: int = 10000
+    tg_outbox_max_attempts: int = 5
+    tg_outbox_retry_backoff: float = 5.0
+    # Seconds the in-memory task subscriber map is used before reloading,
+    # so subscriptions made by other processes show up.
+    tg_subscribers_ttl: float = 60.0
+    # Feed parsing: worker processes, 0 parses inline, and the feed size
+    # in bytes from which feeds are parsed in a worker.
+    feed_parse_workers: int = 2
+    feed_parse_inline_max_bytes: int = 64 * 1024
+    # Full-text article extraction for the translate button.
+    article_workers: int = 4
+    article_domain_concurrency: int = 2
+    article_timeout: float = 15.0
+    # Full text prefetched for relevant news, cached by normalized link.
+    article_cache_size: int = 256
+    article_prefetch_concurrency: int = 2
+    article_prefetch_translate: bool = False
+    # Background translation of delivered messages. Workers mostly wait
+    # for their batch, so there can be as many as a batch holds.
+    translation_workers: int = 20
+    translation_queue_size: int = 1000
+    # Translations batched per AI request.
+    translation_batch_window: float = 2.0
+    translation_batch_token_budget: int = 3000
+    translation_batch_max_items: int = 20
+    # Sources detected in one language this often skip detection.
+    language_profile_min_samples: int = 20
+    language_profile_threshold: float = 0.9
 
     @property
     def db_url(self) -> URL:
@@ -187,6 +317,15 @@ class Settings(BaseSettings):
 
         :return: database URL.
         """
+        if self.db_backend == DatabaseBackend.POSTGRESQL:
+            return URL.build(
+                scheme="postgresql+asyncpg",
+                host=self.db_host,
+                port=self.db_port,
+                user=self.db_user,
+                password=self.db_pass,
+                path=f"/{self.db_base}",
+            )
         return f"sqlite+aiosqlite:///{self.db_file}"
 
     @property
@@ -221,6 +360,11 @@ class Settings(BaseSettings):
             self.loki_url,
             self.loki_user,
             self.loki_api_key,
+            queue_size=self.log_queue_size,
+            rate_limit=self.log_rate_limit,
+            rate_period=self.log_rate_period,
+            loki_batch_size=self.loki_batch_size,
+            loki_flush_interval=self.loki_flush_interval,
         )
 
 
@@ -1,30 +1,41 @@
 import asyncio
 import logging
-from typing import Optional
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.error import BadRequest
 from telegram.ext import (
     Application, CallbackQueryHandler, CommandHandler, ContextTypes
 )
-from langdetect import detect
 
 from ai_news_bot.db.crud.telegram import telegram_user_crud
 from ai_news_bot.db.crud.news_task import news_task_crud
 from ai_news_bot.db.dependencies import get_standalone_session
+from ai_news_bot.db.writer import db_writer
+from ai_news_bot.services import metrics, timeline
 from ai_news_bot.settings import settings
 from ai_news_bot.telegram.schemas import TelegramUser
-from ai_news_bot.web.api.news_task.schema import RSSItemSchema
-from ai_news_bot.ai.utils import (
-    get_full_text,
-    translate_with_ai
-)
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.ai.translation import translate_article, translate_news
+from ai_news_bot.telegram.deferred_translation import DeferredTranslator
+from ai_news_bot.telegram.delivery import DeliveryEngine
+from ai_news_bot.telegram.outbox import Outbox
 from ai_news_bot.telegram.utils import chunk_message, clear_html_tags
 
+if TYPE_CHECKING:
+    from ai_news_bot.db.models.telegram import (
+        TelegramUser as TelegramUserModel,
+    )
+
 logger = logging.getLogger(__name__)
 
 # Global bot instance
 bot_app: Optional[Application] = None
-task_message_queue: asyncio.Queue = asyncio.Queue()
+# Deliveries being recorded, referenced until they're stored.
+delivery_records: set[asyncio.Task] = set()
 
 
 async def start_command(
@@ -41,7 +52,10 @@ async def start_command(
             session=session,
             obj_in=tg_user
         )
-        all_tasks = await news_task_crud.get_all_objects(session=session)
+        all_tasks = await news_task_crud.get_all_objects(
+            session=session,
+            load_profile="summary",
+        )
     tasks = [
         (task.id, task.title) for task in all_tasks if task not in user.tasks
     ]
@@ -69,19 +83,20 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         tg_id=update.message.from_user.id,
         tg_chat_id=update.message.chat.id,
     )
-    async with get_standalone_session() as session:
-        is_deleted = await telegram_user_crud.delete_session(
-            session=session,
+    is_deleted = await db_writer.submit(
+        partial(
+            telegram_user_crud.delete_session,
             tg_id=tg_user.tg_id,
             tg_chat_id=tg_user.tg_chat_id,
-        )
-        await update.message.reply_text(
-            (
-                "Вы от меня отписались."
-                if is_deleted
-                else "Не удалось отписаться. Возможно, вы не подписаны."
-            ),
-        )
+        ),
+    )
+    await update.message.reply_text(
+        (
+            "Вы от меня отписались."
+            if is_deleted
+            else "Не удалось отписаться. Возможно, вы не подписаны."
+        ),
+    )
 
 
 async def handle_callback_query(
@@ -96,18 +111,18 @@ async def handle_callback_query(
     async with get_standalone_session() as session:
         # Irrelevant
         if callback_data["action"] == "irr":
-            news = RSSItemSchema.model_validate(callback_data["news"])
             await news_task_crud.add_false_positive(
-                news=news,
+                news=callback_data["news"],
                 news_task_id=callback_data["task_id"],
                 session=session,
             )
         # Translate
         elif callback_data["action"] == "translate":
             if "news" in callback_data:
-                article = get_full_text(callback_data["news"].link)
-                if article:
-                    translated_text = await translate_with_ai(article)
+                translated_text = await translate_article(
+                    callback_data["news"].link,
+                )
+                if translated_text:
                     if len(translated_text) > 4000:
                         chunks = chunk_message(translated_text)
                         for chunk in chunks:
@@ -134,12 +149,15 @@ async def handle_callback_query(
             task = await news_task_crud.get_object_by_id(
                 session=session,
                 obj_id=callback_data["task_id"],
+                load_profile="summary",
             )
-            telegram_user = await telegram_user_crud.add_task_to_user(
-                session=session,
-                tg_id=query.from_user.id,
-                tg_chat_id=query.message.chat.id,
-                task=task,
+            telegram_user = await db_writer.submit(
+                partial(
+                    subscribe_to_task,
+                    tg_id=query.from_user.id,
+                    tg_chat_id=query.message.chat.id,
+                    task_id=task.id,
+                ),
             )
             if telegram_user:
                 await send_message(
@@ -189,8 +207,10 @@ async def setup_bot() -> Application:
 
         asyncio.create_task(bot_app.updater.start_polling())
 
-        # Start message queue processor
-        asyncio.create_task(process_task_message_queue())
+        # Start message delivery and translation workers
+        delivery_engine.start()
+        await outbox.start(delivery_engine)
+        deferred_translator.start()
 
         logger.info("Telegram bot started successfully")
         return bot_app
@@ -203,59 +223,165 @@ async def shutdown_bot() -> None:
     """Gracefully shut down the Telegram bot."""
     global bot_app
     if bot_app is not None:
+        await deferred_translator.stop()
+        await outbox.stop()
+        await delivery_engine.stop()
+        await asyncio.gather(*delivery_records, return_exceptions=True)
         await bot_app.stop()
         await bot_app.shutdown()
         bot_app = None
         logger.info("Telegram bot shutdown complete")
 
 
-async def process_task_message_queue() -> None:
-    """Background task that processes messages from the queue."""
-    while True:
-        try:
-            message_data = await task_message_queue.get()
-            if message_data["task_id"]:
-                await send_task_message(
-                    chat_id=message_data["chat_id"],
-                    text=message_data["text"],
-                    task_id=message_data["task_id"],
-                    news=message_data["news"],
-                )
-            else:
-                await send_message(
-                    chat_id=message_data["chat_id"],
-                    text=message_data["text"],
-                )
-            task_message_queue.task_done()
-        except Exception as e:
-            logger.error(f"Error processing message from queue: {e}")
-        await asyncio.sleep(0.1)
+async def deliver_message(message_data: dict) -> None:
+    """Send or edit one queued message."""
+    if message_data.get("edit_message_id"):
+        await edit_task_message(
+            chat_id=message_data["chat_id"],
+            message_id=message_data["edit_message_id"],
+            text=message_data["text"],
+            task_id=message_data["task_id"],
+            news=NewsItem.from_json(message_data["news"]),
+            translatable=message_data["translatable"],
+        )
+    elif message_data["task_id"]:
+        message_id = await send_task_message(
+            chat_id=message_data["chat_id"],
+            text=message_data["text"],
+            task_id=message_data["task_id"],
+            news=NewsItem.from_json(message_data["news"]),
+            translatable=message_data["translatable"],
+        )
+        if message_data.get("translation_key"):
+            deferred_translator.delivered(
+                message_data["translation_key"],
+                {**message_data, "message_id": message_id},
+            )
+        if message_data.get("news_id"):
+            # Not awaited, so the send doesn't wait for a commit and a
+            # failure can't get the message sent again.
+            task = asyncio.create_task(record_delivery(message_data))
+            delivery_records.add(task)
+            task.add_done_callback(delivery_records.discard)
+    else:
+        await send_message(
+            chat_id=message_data["chat_id"],
+            text=message_data["text"],
+        )
+
+
+async def record_delivery(message_data: dict) -> None:
+    """Record the delivery of news to a chat, logging failures only."""
+    try:
+        await timeline.record_delivery(
+            news_id=message_data["news_id"],
+            task_id=int(message_data["task_id"]),
+            pub_date=datetime.fromisoformat(message_data["news"]["pub_date"]),
+            queued_at=datetime.fromisoformat(message_data["queued_at"]),
+        )
+    except Exception as e:
+        logger.error(
+            f"Error recording delivery of news {message_data['news_id']}: "
+            f"{e}",
+        )
+
+
+async def queue_translation_edit(message_data: dict, text: str) -> None:
+    """Queue replacing a delivered message's text with its translation."""
+    await outbox.put(
+        chat_id=message_data["chat_id"],
+        payload={
+            "text": text,
+            "task_id": message_data["task_id"],
+            "news": message_data["news"],
+            "translatable": message_data["translatable"],
+            "edit_message_id": message_data["message_id"],
+        },
+    )
+
+
+outbox = Outbox(
+    send=deliver_message,
+    max_depth=settings.tg_outbox_max_depth,
+    max_attempts=settings.tg_outbox_max_attempts,
+    retry_backoff=settings.tg_outbox_retry_backoff,
+)
+delivery_engine = DeliveryEngine(
+    send=outbox.deliver,
+    on_drop=outbox.fail,
+    workers=settings.tg_delivery_workers,
+    global_rate=settings.tg_global_rate,
+    chat_rate=settings.tg_chat_rate,
+    group_rate=settings.tg_group_rate_per_minute / 60,
+)
+# Counts the messages handed to the engine too, until they are sent.
+metrics.delivery_queue_depth.set_function(lambda: outbox.depth)
+deferred_translator = DeferredTranslator(
+    translate=translate_news,
+    apply=queue_translation_edit,
+    workers=settings.translation_workers,
+    max_queue=settings.translation_queue_size,
+)
 
 
 async def queue_task_message(
     chat_id: int,
     text: str,
     task_id: str | None = None,
-    news: RSSItemSchema | None = None,
+    news: NewsItem | None = None,
+    translatable: bool = False,
+    translation_key: str | None = None,
+    news_id: int | None = None,
 ) -> None:
     """
-    Add a message to the queue for sending.
+    Add a message to the outbox for sending.
+
+    Waits while the outbox is full.
 
     Args:
         chat_id: Telegram chat ID to send the message to
         text: Message text
         task_id: ID to include in button callbacks
+        news: News item the message is about
+        translatable: Whether to show the full-text translate button
+        translation_key: Key of a pending translation to edit the
+            message to once it is ready
+        news_id: ID of the news, to record when it was delivered
     """
-    await task_message_queue.put(
-        {
-            "chat_id": chat_id,
+    await outbox.put(
+        chat_id=chat_id,
+        payload={
             "text": text,
             "task_id": task_id,
-            "news": news,
+            "news": news.as_json() if news else None,
+            "translatable": translatable,
+            "translation_key": translation_key,
+            "news_id": news_id,
+            "queued_at": datetime.now().isoformat(),
         },
     )
 
 
+async def subscribe_to_task(
+    session: AsyncSession,
+    tg_id: int,
+    tg_chat_id: int,
+    task_id: int,
+) -> "TelegramUserModel":
+    """Subscribe a Telegram user to a task, as a database write intent."""
+    task = await news_task_crud.get_object_by_id(
+        session=session,
+        obj_id=task_id,
+        load_profile="summary",
+    )
+    return await telegram_user_crud.add_task_to_user(
+        session=session,
+        tg_id=tg_id,
+        tg_chat_id=tg_chat_id,
+        task=task,
+    )
+
+
 async def send_choose_task_message(
     chat_id: int,
     tasks: list[(int, str)],
@@ -297,26 +423,24 @@ async def send_choose_task_message(
     )
 
 
-async def send_task_message(
-    chat_id: int,
+def build_task_message(
     text: str,
     task_id: str,
-    news: RSSItemSchema,
-) -> int:
+    news: NewsItem,
+    translatable: bool = False,
+) -> dict:
     """
-    Send a message with  buttons.
+    Build the text, buttons and options of a news message.
 
     Args:
-        chat_id: Telegram chat ID
         text: Message text
         task_id: ID to include in button callbacks
+        news: News item the message is about
+        translatable: Whether to show the full-text translate button
 
     Returns:
-        Message ID of the sent message
+        Keyword arguments for sending or editing the message
     """
-    global bot_app
-    if bot_app is None:
-        raise RuntimeError("Bot not initialized")
     # irr_callback = {
     #     "action": "irr",
     #     "task_id": task_id,
@@ -327,7 +451,6 @@ async def send_task_message(
         "task_id": task_id,
         "news": news,
     }
-    post_language = detect(news.title)
     keyboard = [
         [],
         # [
@@ -337,32 +460,96 @@ async def send_task_message(
         #     ),
         # ],
     ]
-    if post_language == "en":
+    if translatable:
         keyboard[0].append(
             InlineKeyboardButton(
                 "🇬🇧 -> 🇷🇺",
                 callback_data=translate_callback
             )
         )
-        text = await translate_with_ai(news)
-        
     reply_markup = InlineKeyboardMarkup(keyboard)
     disable_web_page_preview = True
     if "https://t.me" in news.link:
         text = news.link
         disable_web_page_preview = False
     text = text.rstrip() + f"\n\nИсточник: {news.source_name}"
-    await asyncio.wait_for(
+    return {
+        "text": text,
+        "reply_markup": reply_markup,
+        "disable_web_page_preview": disable_web_page_preview,
+        "parse_mode": "HTML",
+    }
+
+
+async def send_task_message(
+    chat_id: int,
+    text: str,
+    task_id: str,
+    news: NewsItem,
+    translatable: bool = False,
+) -> int:
+    """
+    Send a message with  buttons.
+
+    Args:
+        chat_id: Telegram chat ID
+        text: Message text
+        task_id: ID to include in button callbacks
+        news: News item the message is about
+        translatable: Whether to show the full-text translate button
+
+    Returns:
+        Message ID of the sent message
+    """
+    global bot_app
+    if bot_app is None:
+        raise RuntimeError("Bot not initialized")
+    message = await asyncio.wait_for(
         bot_app.bot.send_message(
             chat_id=chat_id,
-            text=text,
-            reply_markup=reply_markup,
-            disable_web_page_preview=disable_web_page_preview,
-            parse_mode="HTML",
             disable_notification=True,
+            **build_task_message(text, task_id, news, translatable),
         ),
         timeout=5.00,
     )
+    return message.message_id
+
+
+async def edit_task_message(
+    chat_id: int,
+    message_id: int,
+    text: str,
+    task_id: str,
+    news: NewsItem,
+    translatable: bool = False,
+) -> None:
+    """
+    Replace the text of a sent news message, keeping its buttons.
+
+    Args:
+        chat_id: Telegram chat ID
+        message_id: ID of the message to edit
+        text: New message text
+        task_id: ID to include in button callbacks
+        news: News item the message is about
+        translatable: Whether to show the full-text translate button
+    """
+    global bot_app
+    if bot_app is None:
+        raise RuntimeError("Bot not initialized")
+    try:
+        await asyncio.wait_for(
+            bot_app.bot.edit_message_text(
+                chat_id=chat_id,
+                message_id=message_id,
+                **build_task_message(text, task_id, news, translatable),
+            ),
+            timeout=5.00,
+        )
+    except BadRequest as e:
+        # Editing to the same text again, e.g. after a retry, is fine.
+        if "not modified" not in str(e):
+            raise
 
 
 async def send_message(chat_id: int, text: str):
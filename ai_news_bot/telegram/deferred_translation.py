@@ -0,0 +1,138 @@
+"""Translation of already delivered messages through message edits."""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ai_news_bot.services.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TranslationJob:
+    """Translation of one news item and the messages waiting for it."""
+
+    done: bool = False
+    text: str | None = None
+    messages: list[dict[str, Any]] = field(default_factory=list)
+
+
+class DeferredTranslator:
+    """
+    Translates news in the background and edits delivered messages.
+
+    Messages are sent with the original text right away. Each news item
+    is translated once by a bounded pool of workers, and every message
+    delivered for it is then edited to the translation. Messages
+    delivered after the translation finished are edited straight away.
+
+    :param translate: coroutine function translating an item, returning
+        None when the translation failed.
+    :param apply: coroutine function applying a translation to a
+        delivered message.
+    :param workers: number of concurrent translations.
+    :param max_queue: translations allowed to wait for a worker. Items
+        submitted beyond that are left untranslated.
+    :param max_jobs: how many recent items to remember.
+    """
+
+    def __init__(
+        self,
+        translate: Callable[[Any], Awaitable[str | None]],
+        apply: Callable[[dict[str, Any], str], Awaitable[None]],
+        workers: int = 2,
+        max_queue: int = 1000,
+        max_jobs: int = 1024,
+    ) -> None:
+        self._translate = translate
+        self._apply = apply
+        self.workers = workers
+        self._jobs: LRUCache[str, TranslationJob] = LRUCache(max_jobs)
+        self._queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(
+            maxsize=max_queue,
+        )
+        self._tasks: list[asyncio.Task] = []
+        self._edits: set[asyncio.Task] = set()
+
+    def submit(self, key: str, item: Any) -> None:
+        """
+        Queue an item for translation unless it is already known.
+
+        :param key: translation key of the item.
+        :param item: item passed to the translate function.
+        """
+        if key in self._jobs:
+            return
+        try:
+            self._queue.put_nowait((key, item))
+        except asyncio.QueueFull:
+            logger.warning(f"Translation queue is full, skipping {key}")
+            return
+        self._jobs.set(key, TranslationJob())
+
+    def delivered(self, key: str, message: dict[str, Any]) -> None:
+        """
+        Register a delivered message for editing once translated.
+
+        :param key: translation key of the message's item.
+        :param message: message data, with "chat_id" and "message_id".
+        """
+        job = self._jobs.get(key)
+        if job is None:
+            return
+        if not job.done:
+            job.messages.append(message)
+        elif job.text is not None:
+            self._schedule_edit(message, job.text)
+
+    def start(self) -> None:
+        """Start the translation workers."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers and cancel edits still being applied."""
+        tasks = self._tasks + list(self._edits)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _schedule_edit(self, message: dict[str, Any], text: str) -> None:
+        # Applying may wait for outbox capacity, which must not hold up
+        # the delivery worker that reported the message.
+        task = asyncio.create_task(self._apply_edit(message, text))
+        self._edits.add(task)
+        task.add_done_callback(self._edits.discard)
+
+    async def _apply_edit(self, message: dict[str, Any], text: str) -> None:
+        try:
+            await self._apply(message, text)
+        except Exception as e:
+            logger.error(
+                f"Error applying translation to message "
+                f"{message.get('message_id')}: {e}"
+            )
+
+    async def _worker(self) -> None:
+        while True:
+            key, item = await self._queue.get()
+            try:
+                text = await self._translate(item)
+            except Exception as e:
+                logger.error(f"Error translating {key}: {e}")
+                text = None
+            job = self._jobs.get(key)
+            if job is None:
+                continue
+            job.done = True
+            job.text = text
+            messages, job.messages = job.messages, []
+            if text is None:
+                continue
+            for message in messages:
+                self._schedule_edit(message, text)
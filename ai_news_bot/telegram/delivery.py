@@ -0,0 +1,259 @@
+"""Rate-limited concurrent delivery of queued Telegram messages."""
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from telegram.error import RetryAfter
+
+from ai_news_bot.services import metrics
+
+logger = logging.getLogger(__name__)
+
+# How many times a message is retried after flood control before dropping.
+MAX_RETRY_AFTER = 5
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    :param rate: tokens added per second.
+    :param capacity: maximum number of tokens, i.e. the allowed burst.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - max(self._updated, self._paused_until)
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity,
+                self._tokens + elapsed * self.rate,
+            )
+            self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        :return: 0 if a token was taken, otherwise seconds to wait.
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def is_full(self) -> bool:
+        """
+        Check if the bucket refilled completely.
+
+        A full bucket is idle, replacing it with a new one changes
+        nothing.
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return False
+        self._refill(now)
+        return self._tokens >= self.capacity
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while (delay := self.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the given time, then start empty."""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+
+def retry_after_seconds(error: RetryAfter) -> float:
+    """Get the flood-control delay from a RetryAfter error."""
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class DeliveryEngine:
+    """
+    Sends queued messages with several concurrent workers.
+
+    Every send takes a token from a global bucket and from a bucket of
+    its chat, private and group chats having separate limits. Messages
+    of one chat are kept in a FIFO and only one worker handles a chat at
+    a time, so order within a chat is preserved. A chat waiting for its
+    bucket is rescheduled instead of holding a worker.
+
+    :param send: coroutine function delivering one message.
+    :param on_drop: coroutine function called with a message and the
+        error when the message is given up on.
+    :param workers: number of concurrent senders.
+    :param global_rate: messages per second across all chats.
+    :param chat_rate: messages per second to one private chat.
+    :param group_rate: messages per second to one group chat.
+    :param prune_interval: seconds between removals of the buckets of
+        chats that are idle and whose bucket refilled completely.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+        on_drop: Callable[
+            [dict[str, Any], Exception],
+            Awaitable[None],
+        ] | None = None,
+        workers: int = 4,
+        global_rate: float = 30.0,
+        chat_rate: float = 1.0,
+        group_rate: float = 20 / 60,
+        prune_interval: float = 60.0,
+    ) -> None:
+        self._send = send
+        self._on_drop = on_drop
+        self.workers = workers
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self.global_bucket = TokenBucket(global_rate, capacity=global_rate)
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self.prune_interval = prune_interval
+        self._pruned_at = time.monotonic()
+        # Chat ID -> messages waiting for that chat. A chat is either in
+        # the ready queue, scheduled for later or held by one worker.
+        self._pending: dict[int, deque[dict[str, Any]]] = {}
+        self._ready: asyncio.Queue[int] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def depth(self) -> int:
+        """Number of messages waiting to be sent."""
+        return sum(len(messages) for messages in self._pending.values())
+
+    def submit(self, message: dict[str, Any]) -> None:
+        """
+        Queue a message for delivery.
+
+        :param message: message data, must contain "chat_id".
+        """
+        chat_id = message["chat_id"]
+        messages = self._pending.get(chat_id)
+        if messages is None:
+            self._pending[chat_id] = deque([message])
+            self._ready.put_nowait(chat_id)
+        else:
+            messages.append(message)
+
+    def start(self) -> None:
+        """Start the sender tasks."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the sender tasks, leaving unsent messages queued."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        if time.monotonic() - self._pruned_at >= self.prune_interval:
+            self._prune_buckets()
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            # Group and channel chat IDs are negative.
+            rate = self.group_rate if chat_id < 0 else self.chat_rate
+            bucket = TokenBucket(rate)
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _prune_buckets(self) -> None:
+        """Forget the buckets of idle chats, they would be recreated full."""
+        self._pruned_at = time.monotonic()
+        idle = [
+            chat_id
+            for chat_id, bucket in self._chat_buckets.items()
+            if chat_id not in self._pending and bucket.is_full()
+        ]
+        for chat_id in idle:
+            del self._chat_buckets[chat_id]
+
+    def _schedule(self, chat_id: int, delay: float) -> None:
+        asyncio.get_running_loop().call_later(
+            delay,
+            self._ready.put_nowait,
+            chat_id,
+        )
+
+    async def _worker(self) -> None:
+        while True:
+            chat_id = await self._ready.get()
+            try:
+                await self._process_chat(chat_id)
+            except Exception as e:
+                logger.error(f"Error delivering to chat {chat_id}: {e}")
+                await self._drop(chat_id, e)
+
+    async def _drop(self, chat_id: int, error: Exception) -> None:
+        message = self._pending[chat_id][0]
+        self._release(chat_id)
+        if self._on_drop is not None:
+            try:
+                await self._on_drop(message, error)
+            except Exception as e:
+                logger.error(f"Error handling dropped message: {e}")
+
+    def _release(self, chat_id: int) -> None:
+        """Drop the head message of a chat and hand the chat back."""
+        messages = self._pending[chat_id]
+        messages.popleft()
+        if messages:
+            self._ready.put_nowait(chat_id)
+        else:
+            del self._pending[chat_id]
+
+    async def _process_chat(self, chat_id: int) -> None:
+        delay = self._chat_bucket(chat_id).try_acquire()
+        if delay > 0:
+            self._schedule(chat_id, delay)
+            return
+        await self.global_bucket.acquire()
+        message = self._pending[chat_id][0]
+        started = time.perf_counter()
+        try:
+            await self._send(message)
+        except RetryAfter as e:
+            seconds = retry_after_seconds(e)
+            # Flood control applies to the whole bot, not only this chat.
+            self.global_bucket.pause(seconds)
+            message["retry_after_count"] = (
+                message.get("retry_after_count", 0) + 1
+            )
+            if message["retry_after_count"] <= MAX_RETRY_AFTER:
+                logger.warning(
+                    f"Flood control for chat {chat_id}, "
+                    f"retrying in {seconds}s",
+                )
+                self._schedule(chat_id, seconds)
+                return
+            logger.error(f"Dropping message to chat {chat_id}: {e}")
+            await self._drop(chat_id, e)
+            return
+        metrics.delivery_send_seconds.observe(time.perf_counter() - started)
+        self._release(chat_id)
@@ -0,0 +1,233 @@
+"""Durable outbound message queue backed by the database."""
+import asyncio
+import logging
+from functools import partial
+from typing import Any, AsyncContextManager, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from telegram.error import RetryAfter
+
+from ai_news_bot.db.crud.outbox import crud_outbox
+from ai_news_bot.db.dependencies import get_standalone_session
+from ai_news_bot.db.writer import DatabaseWriter, db_writer
+from ai_news_bot.telegram.delivery import DeliveryEngine
+
+logger = logging.getLogger(__name__)
+
+# How many messages the engine may hold in memory at once.
+DISPATCH_BATCH = 100
+
+
+class Outbox:
+    """
+    Persists outgoing messages and feeds them to the delivery engine.
+
+    Delivery is at-least-once: a message row is deleted only after it was
+    sent, so anything pending survives a restart and is sent on the next
+    start. Failed sends are retried with exponential backoff until they
+    run out of attempts and land in the dead-letter list. Until a failed
+    message is retried, the later messages of its chat aren't sent.
+
+    The number of pending messages is capped. ``put`` waits while the
+    outbox is full, and producers can check ``is_full`` to hold back.
+
+    :param send: coroutine function delivering one message.
+    :param max_depth: maximum number of pending messages.
+    :param max_attempts: attempts before a message is dead-lettered.
+    :param retry_backoff: delay before the first retry, in seconds.
+    :param poll_interval: how often due retries are looked up, in seconds.
+    :param session_factory: factory of database sessions for reads.
+    :param writer: database writer of the message rows.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+        max_depth: int = 10000,
+        max_attempts: int = 5,
+        retry_backoff: float = 5.0,
+        poll_interval: float = 1.0,
+        session_factory: Callable[
+            [],
+            AsyncContextManager[AsyncSession],
+        ] = get_standalone_session,
+        writer: DatabaseWriter | None = None,
+    ) -> None:
+        self._send = send
+        self.max_depth = max_depth
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+        self._session_factory = session_factory
+        self._writer = writer
+        self._engine: DeliveryEngine | None = None
+        self._depth = 0
+        # Rows handed to the engine and not yet acked or failed.
+        self._inflight: set[int] = set()
+        # Chat ID -> message of the chat waiting for a retry.
+        self._retrying: dict[int, int] = {}
+        self._wakeup = asyncio.Event()
+        self._capacity = asyncio.Condition()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def writer(self) -> DatabaseWriter:
+        """Writer of the message rows."""
+        return self._writer or db_writer
+
+    @property
+    def depth(self) -> int:
+        """Number of messages waiting for delivery."""
+        return self._depth
+
+    @property
+    def is_full(self) -> bool:
+        """Whether new messages have to wait for free space."""
+        return self._depth >= self.max_depth
+
+    async def start(self, engine: DeliveryEngine) -> None:
+        """
+        Start feeding pending messages to the delivery engine.
+
+        :param engine: engine whose send and drop callbacks are
+            ``deliver`` and ``fail`` of this outbox.
+        """
+        if self._task is not None:
+            return
+        self._engine = engine
+        async with self._session_factory() as session:
+            self._depth = await crud_outbox.count_pending(session)
+        if self._depth:
+            logger.info(f"Resuming delivery of {self._depth} messages")
+        self._task = asyncio.create_task(self._dispatch())
+
+    async def stop(self) -> None:
+        """Stop dispatching. Undelivered messages stay in the database."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._inflight.clear()
+        self._retrying.clear()
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the outbox has room for another message."""
+        async with self._capacity:
+            await self._capacity.wait_for(lambda: not self.is_full)
+
+    async def put(self, chat_id: int, payload: dict[str, Any]) -> None:
+        """
+        Persist a message for delivery, waiting while the outbox is full.
+
+        :param chat_id: Telegram chat ID.
+        :param payload: JSON-serializable message data.
+        """
+        await self.wait_for_capacity()
+        await self.writer.submit(
+            partial(crud_outbox.enqueue, chat_id=chat_id, payload=payload),
+        )
+        self._depth += 1
+        self._wakeup.set()
+
+    async def deliver(self, message: dict[str, Any]) -> None:
+        """
+        Send a message and acknowledge it.
+
+        Flood control errors are left to the engine, which retries the
+        message itself. Other errors schedule a retry from the database.
+        Messages of a chat waiting for a retry are put back instead, they
+        are fetched again once the retried message is gone.
+        """
+        retrying = self._retrying.get(message["chat_id"])
+        if retrying is not None and retrying != message["outbox_id"]:
+            self._inflight.discard(message["outbox_id"])
+            return
+        try:
+            await self._send(message)
+        except RetryAfter:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to deliver outbox message {message['outbox_id']}: {e}"
+            )
+            await self.fail(message, e)
+            return
+        await self._ack(message)
+
+    async def fail(self, message: dict[str, Any], error: Exception) -> None:
+        """Record a failed delivery attempt."""
+        outbox_id = message["outbox_id"]
+        failed = await self.writer.submit(
+            partial(
+                crud_outbox.mark_failed,
+                message_id=outbox_id,
+                error=str(error),
+                max_attempts=self.max_attempts,
+                retry_backoff=self.retry_backoff,
+            ),
+        )
+        self._inflight.discard(outbox_id)
+        if failed is not None and failed.status == "pending":
+            self._retrying[failed.chat_id] = outbox_id
+            return
+        self._unblock(message)
+        if failed is not None:
+            logger.error(f"Outbox message {outbox_id} moved to dead letters")
+            await self._release_capacity()
+
+    async def _ack(self, message: dict[str, Any]) -> None:
+        outbox_id = message["outbox_id"]
+        await self.writer.submit(
+            partial(crud_outbox.ack, message_id=outbox_id),
+        )
+        self._inflight.discard(outbox_id)
+        self._unblock(message)
+        await self._release_capacity()
+
+    def _unblock(self, message: dict[str, Any]) -> None:
+        """Let the next messages of a chat go once its retry is over."""
+        chat_id = message["chat_id"]
+        if self._retrying.get(chat_id) == message["outbox_id"]:
+            del self._retrying[chat_id]
+            self._wakeup.set()
+
+    async def _release_capacity(self) -> None:
+        self._depth = max(self._depth - 1, 0)
+        async with self._capacity:
+            self._capacity.notify_all()
+
+    async def _dispatch(self) -> None:
+        while True:
+            try:
+                await self._dispatch_due()
+            except Exception as e:
+                logger.error(f"Error dispatching outbox messages: {e}")
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self.poll_interval,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _dispatch_due(self) -> None:
+        """Hand due messages to the engine, keeping its buffer short."""
+        limit = DISPATCH_BATCH - self._engine.depth
+        if limit <= 0:
+            return
+        async with self._session_factory() as session:
+            messages = await crud_outbox.get_due(
+                session=session,
+                limit=limit,
+                exclude_ids=self._inflight,
+            )
+        for message in messages:
+            self._inflight.add(message.id)
+            self._engine.submit(
+                {
+                    **message.payload,
+                    "chat_id": message.chat_id,
+                    "outbox_id": message.id,
+                },
+            )
@@ -0,0 +1,3 @@
+from ai_news_bot.web.api.admin.views import router
+
+__all__ = ["router"]
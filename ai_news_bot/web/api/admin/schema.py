@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class NewsStageSchema(BaseModel):
+    stage: str
+    task_id: int | None
+    at: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
+
+
+class TimelineStepSchema(BaseModel):
+    stage: str
+    at: datetime
+    # Time since the previous stage, or since publication.
+    seconds: float
+
+
+class TaskTimelineSchema(BaseModel):
+    task_id: int | None
+    steps: list[TimelineStepSchema]
+    total_seconds: float
+    slowest: str | None
+
+
+class NewsTimelineSchema(BaseModel):
+    news_id: int
+    title: str
+    pub_date: datetime
+    stages: list[NewsStageSchema]
+    tasks: list[TaskTimelineSchema]
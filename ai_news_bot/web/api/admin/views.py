@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.crud.news_stage import crud_news_stage
+from ai_news_bot.db.dependencies import get_db_session
+from ai_news_bot.db.models.users import User, current_superuser
+from ai_news_bot.services import timeline
+from ai_news_bot.web.api.admin.schema import NewsTimelineSchema
+
+router = APIRouter()
+
+
+@router.get(
+    "/news/{news_id}/timeline",
+    response_model=NewsTimelineSchema,
+)
+async def get_news_timeline(
+    news_id: int,
+    session: AsyncSession = Depends(get_db_session),
+    user: User = Depends(current_superuser),
+) -> NewsTimelineSchema:
+    """
+    Explain where a news item spent its time before delivery.
+
+    Every task the news was checked for gets the steps from publication
+    to fetching, insertion, classification, queueing and the first
+    delivery, with the slowest of them.
+
+    :param news_id: The ID of the news.
+    :return: The stage timestamps and their breakdown per task.
+    """
+    news = await crud_news.get_object_by_id(session=session, obj_id=news_id)
+    if news is None:
+        raise HTTPException(status_code=404, detail="News not found.")
+    stages = await crud_news_stage.get_timeline(session, news_id=news_id)
+    return NewsTimelineSchema(
+        news_id=news.id,
+        title=news.title,
+        pub_date=news.pub_date,
+        stages=stages,
+        tasks=timeline.explain(news.pub_date, stages),
+    )
@@ -1,4 +1,7 @@
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ai_news_bot.services.metrics import CONTENT_TYPE, REGISTRY
 
 router = APIRouter()
 
@@ -10,3 +13,10 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+# Async, so rendering runs on the event loop that updates the metrics.
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Expose the pipeline metrics in the Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
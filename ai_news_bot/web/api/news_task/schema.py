@@ -17,6 +17,7 @@ class RSSItemSchema(BaseModel):
     description: str | None
     pub_date: datetime
     source_name: str = "unknown"
+    language: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,14 +1,28 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket
-from redis.asyncio import Redis
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+)
+from fastapi.responses import StreamingResponse
+from redis.asyncio import ConnectionPool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_news_bot.db.crud.news_task import news_task_crud
 from ai_news_bot.db.crud.settings import settings_crud
 from ai_news_bot.db.crud.prompt import crud_prompt
 from ai_news_bot.db.dependencies import get_db_session
-from ai_news_bot.db.models.users import User, current_active_user
+from ai_news_bot.db.models.users import (
+    User,
+    WS_AUTH_PROTOCOL,
+    current_active_user,
+    websocket_user,
+)
 from ai_news_bot.web.api.news_task.schema import (
     NewsTaskCreateSchema,
     NewsTaskReadSchema,
@@ -18,6 +32,14 @@ from ai_news_bot.web.api.news_task.schema import (
     SourceType
 )
 from ai_news_bot.ai.news_consumer import process_news
+from ai_news_bot.services.broadcast import broadcast_hub
+from ai_news_bot.services.redis.dependency import get_redis_pool
+from ai_news_bot.services.redis.events import (
+    EVENT_ID_RE,
+    GzipStream,
+    read_events,
+)
+from ai_news_bot.settings import settings as app_settings
 from ai_news_bot.web.api.news_task.validators import (
     validate_telegram_channel_url,
     validate_rss_url
@@ -161,6 +183,60 @@ async def remove_source(
         )
 
 
+# Registered before "/{task_id}", which would match "/events" too.
+@router.get("/events")
+async def news_events(
+    request: Request,
+    task_id: list[int] | None = Query(None),
+    result: bool | None = None,
+    last_event_id: str | None = Header(None),
+    redis_pool: ConnectionPool = Depends(get_redis_pool),
+    session: AsyncSession = Depends(get_db_session),
+    user: User = Depends(current_active_user),
+) -> StreamingResponse:
+    """
+    Stream verdicts of the current user's tasks as server-sent events.
+
+    Browsers' EventSource can't send the Authorization header, so it is
+    authenticated by the cookie set by ``/api/auth/cookie/login``. It
+    resumes after a reconnect with the Last-Event-ID header, as long as
+    the Redis stream still holds the missed verdicts.
+
+    :param task_id: only send verdicts for these of the user's tasks.
+    :param result: only send relevant (true) or irrelevant verdicts.
+    :param last_event_id: ID of the last event the client received.
+    """
+    if last_event_id is not None and not EVENT_ID_RE.match(last_event_id):
+        raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+    task_ids = await news_task_crud.get_task_ids(session, user_id=user.id)
+    if task_id:
+        task_ids &= set(task_id)
+    events = read_events(
+        redis_pool,
+        last_event_id=last_event_id,
+        task_ids=task_ids,
+        result=result,
+        keepalive=app_settings.events_keepalive,
+    )
+    headers = {
+        "Cache-Control": "no-cache",
+        # Stops nginx from buffering the stream.
+        "X-Accel-Buffering": "no",
+    }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        gzip = GzipStream()
+        body = (gzip.compress(event) async for event in events)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    else:
+        body = events
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers=headers,
+    )
+
+
 @router.get("/{task_id}", response_model=NewsTaskReadSchema)
 async def get_news_task(
     task_id: int,
@@ -258,18 +334,18 @@ async def check_ai_news_task(
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
-):
-    await websocket.accept()
-    redis_pool = websocket.app.state.redis_pool
-    async with Redis(connection_pool=redis_pool) as redis:
-        pubsub = redis.pubsub()
-        await pubsub.subscribe("relevant_news")
-        try:
-            while True:
-                message = await pubsub.get_message(
-                    ignore_subscribe_messages=True
-                )
-                if message:
-                    await websocket.send_text(message["data"].decode())
-        except Exception as e:
-            raise e
+    session: AsyncSession = Depends(get_db_session),
+    user: User = Depends(websocket_user),
+) -> None:
+    """
+    Stream verdicts of the user's tasks to the live results page.
+
+    Tasks are looked up once, tasks created later are streamed after
+    the page reconnects.
+    """
+    task_ids = await news_task_crud.get_task_ids(session, user_id=user.id)
+    # Give the connection back instead of holding it while streaming.
+    await session.commit()
+    # Browsers drop connections not accepting a subprotocol they asked for.
+    await websocket.accept(subprotocol=WS_AUTH_PROTOCOL)
+    await broadcast_hub.serve(websocket, task_ids)
@@ -7,7 +7,8 @@ from ai_news_bot.web.api import (
     prompt,
     redis,
     users,
-    settings
+    settings,
+    admin,
 )
 
 api_router = APIRouter()
@@ -26,4 +27,5 @@ api_router.include_router(
     prefix="/settings",
     tags=["settings"],
 )
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 # Note: The order of inclusion matters for path matching.
@@ -5,6 +5,7 @@ from ai_news_bot.db.models.users import (
     UserRead,  # type: ignore
     UserUpdate,  # type: ignore
     api_users,  # type: ignore
+    auth_cookie,  # type: ignore
     auth_jwt,  # type: ignore
 )
 
@@ -41,3 +42,8 @@ router.include_router(
     prefix="/auth/jwt",
     tags=["auth"],
 )
+router.include_router(
+    api_users.get_auth_router(auth_cookie),
+    prefix="/auth/cookie",
+    tags=["auth"],
+)
@@ -3,34 +3,45 @@ from typing import AsyncGenerator
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from ai_news_bot.services.broadcast import broadcast_hub
+from ai_news_bot.services.loop_monitor import loop_monitor
 from ai_news_bot.services.redis.lifespan import init_redis, shutdown_redis
+from ai_news_bot.services.redis.publisher import verdict_publisher
 from ai_news_bot.settings import settings
 from ai_news_bot.telegram.bot import setup_bot, shutdown_bot
 from ai_news_bot.db.models.users import create_user
+from ai_news_bot.db.crud.telegram import telegram_user_crud
+from ai_news_bot.db.dependencies import (
+    dispose_engine,
+    get_engine,
+    get_session_factory,
+    get_standalone_session,
+    optimize_database,
+)
+from ai_news_bot.db.retention import news_retention
+from ai_news_bot.db.writer import db_writer
 from ai_news_bot.ai.telegram_producer import telegram_producer
 from ai_news_bot.ai.rss_producer import rss_producer
 from ai_news_bot.ai.news_consumer import news_consumer
+from ai_news_bot.ai.articles import article_extractor
+from ai_news_bot.ai.feeds import feed_parser
+from ai_news_bot.ai.language import language_profiles
+from ai_news_bot.ai.prefetch import article_prefetcher
 
 
 async def _setup_db(app: FastAPI) -> None:  # pragma: no cover
     """
     Creates connection to the database.
 
-    This function creates SQLAlchemy engine instance,
-    session_factory for creating sessions
-    and stores them in the application's state property.
+    This function stores the shared SQLAlchemy engine and the
+    session_factory for creating sessions in the application's state
+    property, so the API and the background jobs use one engine.
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
-    session_factory = async_sessionmaker(
-        engine,
-        expire_on_commit=False,
-    )
-    app.state.db_engine = engine
-    app.state.db_session_factory = session_factory
+    app.state.db_engine = get_engine()
+    app.state.db_session_factory = get_session_factory()
 
 
 @asynccontextmanager
@@ -48,8 +59,15 @@ async def lifespan_setup(
     """
 
     app.middleware_stack = None
+    loop_monitor.start()
     await _setup_db(app)
+    db_writer.start()
     init_redis(app)
+    broadcast_hub.start(app.state.redis_pool)
+    verdict_publisher.start(app.state.redis_pool)
+    async with get_standalone_session() as session:
+        await telegram_user_crud.warm_subscribers(session)
+        await language_profiles.warm(session)
     await setup_bot()
     await create_user(
         email=settings.admin_email,
@@ -77,13 +95,34 @@ async def lifespan_setup(
         max_instances=1,
         misfire_grace_time=30,
     )
+    scheduler.add_job(
+        optimize_database,
+        "interval",
+        hours=1,
+    )
+    scheduler.add_job(
+        news_retention.run,
+        "cron",
+        hour=4,
+        coalesce=True,
+        max_instances=1,
+    )
     app.middleware_stack = app.build_middleware_stack()
 
     yield
 
     if hasattr(app.state, "scheduler"):
         app.state.scheduler.shutdown(wait=False)
-    await app.state.db_engine.dispose()
 
+    verdict_publisher.stop()
+    await broadcast_hub.stop()
     await shutdown_redis(app)
     await shutdown_bot()
+    await article_prefetcher.close()
+    await article_extractor.close()
+    await feed_parser.close()
+    await db_writer.stop()
+    # Last, as the outbox and the prefetcher still write on shutdown.
+    await optimize_database()
+    await dispose_engine()
+    await loop_monitor.stop()
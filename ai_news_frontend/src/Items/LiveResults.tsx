@@ -1,6 +1,6 @@
 import useWebSocket, { ReadyState} from "react-use-websocket";
 import { useState, useEffect } from "react";
-// import { authApi } from "../api";
+import { TOKEN_STORAGE_KEY } from "../api";
 import type { RedisMessage } from "../interface";
 import { Table } from "@chakra-ui/react";
 
@@ -9,6 +9,9 @@ const MESSAGES_STORAGE_KEY = 'websocket_messages';
 const MAX_MESSAGES = 100;
 
 export default function LiveResults() {
+  // Browsers can't send the Authorization header with WebSockets, the
+  // token goes as a subprotocol to stay out of the access logs.
+  const token = localStorage.getItem(TOKEN_STORAGE_KEY) ?? "";
   const url = "ws://localhost/api/news_task/ws";
   const [messages, setMessages] = useState<RedisMessage[]>(() => {
     const savedMessages = localStorage.getItem(MESSAGES_STORAGE_KEY);
@@ -16,6 +19,7 @@ export default function LiveResults() {
   });
   
   const { lastMessage, readyState } = useWebSocket(url, {
+    protocols: ["bearer", token],
     shouldReconnect: () => true,
   });
 
@@ -26,6 +30,11 @@ export default function LiveResults() {
           ? JSON.parse(lastMessage.data) 
           : lastMessage.data;
 
+        // The server sends heartbeats to keep idle connections open.
+        if (parsedMessage?.type === 'heartbeat') {
+          return;
+        }
+
         if (parsedMessage && typeof parsedMessage === 'object') {
           const updatedMessages = (prev: RedisMessage[]) => {
             const updated = [...prev, parsedMessage];
@@ -8,7 +8,7 @@ const API_BASE_URL = '/api';
 // For local development, uncomment the following line and comment the above line
 // const API_BASE_URL = 'http://localhost:8050/api';
 
-const TOKEN_STORAGE_KEY = 'auth_token';
+export const TOKEN_STORAGE_KEY = 'auth_token';
 
 export interface ApiUser {
   id: string;
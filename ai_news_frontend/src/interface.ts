@@ -28,19 +28,23 @@ export interface NewsTask extends NewsTaskCreate{
   tg_urls: Record<string, string>;
 }
 
-interface NewsTaskRedis extends NewsTaskCreate {
+interface RedisNews {
   id: number;
-  is_active: boolean;
-  created_at: string;
-  positives: News[];
-  false_positives: News[];
-  user_id: string;
+  title: string;
+  link: string | null;
+  pub_date: string;
+  source_name: string;
+}
+
+interface NewsTaskRedis {
+  id: number;
+  title: string;
   result: boolean;
 }
 
 
 export interface RedisMessage {
-  news: News;
+  news: RedisNews;
   task: NewsTaskRedis
 }
 
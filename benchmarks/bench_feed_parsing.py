@@ -0,0 +1,93 @@
+"""
+Measure event loop lag while feeds are parsed, inline and in workers.
+
+Parses a round of synthetic RSS feeds the way the RSS producer does,
+while a probe task sleeps in short steps and records how late it wakes
+up. The lag is what WebSocket clients, API requests and bot callbacks
+would wait during the round.
+
+Run with ``python -m benchmarks.bench_feed_parsing``.
+"""
+import asyncio
+import os
+import statistics
+import time
+
+from ai_news_bot.ai.feeds import FeedParser
+
+FEEDS = 20
+ITEMS_PER_FEED = 500
+PROBE_INTERVAL = 0.005
+
+
+def _feed(feed_no: int) -> bytes:
+    items = "".join(
+        f"""
+        <item>
+            <title>Example news {feed_no}-{item_no}</title>
+            <link>https://example.com/{feed_no}/{item_no}</link>
+            <description>{"Lorem ipsum dolor sit amet. " * 10}</description>
+            <pubDate>Mon, 19 Oct 2026 10:{item_no % 60:02d}:00 GMT</pubDate>
+        </item>"""
+        for item_no in range(ITEMS_PER_FEED)
+    )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Feed {feed_no}</title>
+        <link>https://example.com/{feed_no}</link>
+        <description>Benchmark feed</description>{items}
+    </channel>
+</rss>""".encode()
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.monotonic() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(max(time.monotonic() - expected, 0.0))
+
+
+async def _run(name: str, parser: FeedParser, feeds: list[bytes]) -> None:
+    # Warm the pool up, starting workers isn't part of a round.
+    await parser.parse(feeds[0])
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(parser.parse(feed) for feed in feeds))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    await parser.close()
+
+    items = sum(len(result) for result in results)
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p50 = statistics.median(lags_ms)
+    p99 = lags_ms[int(len(lags_ms) * 0.99)]
+    print(
+        f"{name:<12}{items / elapsed:>10.0f}{p50:>10.1f}"
+        f"{p99:>10.1f}{lags_ms[-1]:>10.1f}",
+    )
+
+
+async def main() -> None:
+    feeds = [_feed(feed_no) for feed_no in range(FEEDS)]
+    size = sum(len(feed) for feed in feeds) // FEEDS // 1024
+    workers = min(os.cpu_count() or 1, 4)
+    print(
+        f"{FEEDS} feeds of {ITEMS_PER_FEED} items ({size} KiB each), "
+        f"{workers} workers, loop lag in ms",
+    )
+    print(f"{'parsing':<12}{'items/s':>10}{'p50':>10}{'p99':>10}{'max':>10}")
+    await _run("inline", FeedParser(max_workers=0), feeds)
+    await _run(
+        "pool",
+        FeedParser(max_workers=workers, inline_max_bytes=0),
+        feeds,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""
+Compare BaseCRUD load profiles for NewsTask reads.
+
+Seeds an in-memory SQLite database with tasks carrying realistically sized
+example lists and measures, per profile, the wall time of one
+``get_all_objects`` cycle and the number of raw column bytes SQLite hands
+over for decoding.
+
+Run with ``python -m benchmarks.bench_load_profiles``.
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# The API package must be imported before the CRUD modules it depends on.
+import ai_news_bot.web.api.router  # noqa: F401
+from ai_news_bot.db.crud.news_task import news_task_crud
+from ai_news_bot.db.meta import meta
+from ai_news_bot.db.models import load_all_models
+from ai_news_bot.db.models.news_task import NewsTask
+
+TASKS = 50
+EXAMPLES_PER_LIST = 200
+CYCLES = 20
+
+
+def _example(task_no: int, item_no: int) -> dict:
+    return {
+        "title": f"Example news {task_no}-{item_no}",
+        "link": f"https://example.com/{task_no}/{item_no}",
+        "description": "Lorem ipsum dolor sit amet. " * 20,
+        "pub_date": datetime.now().isoformat(),
+        "source_name": "Example",
+    }
+
+
+async def _seed(session_factory) -> None:
+    user_id = uuid.uuid4()
+    async with session_factory() as session:
+        for task_no in range(TASKS):
+            examples = [
+                _example(task_no, item_no)
+                for item_no in range(EXAMPLES_PER_LIST)
+            ]
+            session.add(
+                NewsTask(
+                    title=f"Task {task_no}",
+                    description="Benchmark task",
+                    end_date=datetime.now() + timedelta(days=1),
+                    user_id=user_id,
+                    positives=examples,
+                    false_positives=examples,
+                    relevant_news=[item["title"] for item in examples],
+                    non_relevant_news=[item["title"] for item in examples],
+                    rss_urls={f"Feed {task_no}": "https://example.com/rss"},
+                    tg_urls={},
+                ),
+            )
+        await session.commit()
+
+
+async def _decoded_bytes(session, load_profile: str) -> int:
+    """Sum the size of the raw values the profile's SELECT returns."""
+    stmt = select(NewsTask).options(
+        *news_task_crud._load_options(load_profile),
+    )
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        str(stmt.compile(compile_kwargs={"literal_binds": True})),
+    )
+    return sum(
+        len(value) if isinstance(value, (str, bytes)) else 8
+        for row in result.all()
+        for value in row
+        if value is not None
+    )
+
+
+async def main() -> None:
+    load_all_models()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(meta.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await _seed(session_factory)
+
+    print(f"{TASKS} tasks, {EXAMPLES_PER_LIST} items per JSON list")
+    print(f"{'profile':<10}{'ms/cycle':>12}{'bytes/cycle':>16}")
+    for load_profile in ("full", "sources", "summary"):
+        async with session_factory() as session:
+            decoded = await _decoded_bytes(session, load_profile)
+        started = time.perf_counter()
+        for _ in range(CYCLES):
+            async with session_factory() as session:
+                await news_task_crud.get_all_objects(
+                    session=session,
+                    load_profile=load_profile,
+                )
+        elapsed_ms = (time.perf_counter() - started) * 1000 / CYCLES
+        print(f"{load_profile:<10}{elapsed_ms:>12.2f}{decoded:>16,}")
+
+    started = time.perf_counter()
+    for _ in range(CYCLES):
+        async with session_factory() as session:
+            await news_task_crud.get_field_values(session, "rss_urls")
+    elapsed_ms = (time.perf_counter() - started) * 1000 / CYCLES
+    print(f"{'rss_urls':<10}{elapsed_ms:>12.2f}{'(projection)':>16}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""
+Compare RSSItemSchema and NewsItem on the path of news through the bot.
+
+Runs 10k items through the steps news takes from a producer to a chat:
+building the item at ingest, the column values of the insert, the copy
+made for delivery, the outbox payload and reading it back for sending.
+Measures the time of every step and, with tracemalloc, the memory held
+by the ingested items and the peak of a whole run.
+
+Run with ``python -m benchmarks.bench_news_records``.
+"""
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable
+
+# The API package must be imported before the CRUD modules it depends on.
+import ai_news_bot.web.api.router  # noqa: F401
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.web.api.news_task.schema import RSSItemSchema
+
+ITEMS = 10000
+ROUNDS = 5
+DESCRIPTION = "Lorem ipsum dolor sit amet. " * 10
+
+
+def _values() -> list[tuple]:
+    pub_date = datetime.now()
+    return [
+        (
+            f"News {item_no}",
+            f"https://example.com/news/{item_no}",
+            DESCRIPTION,
+            pub_date,
+            f"Source {item_no % 10}",
+        )
+        for item_no in range(ITEMS)
+    ]
+
+
+def _schema_steps() -> dict[str, Callable[[Any], Any]]:
+    return {
+        "ingest": lambda values: [
+            RSSItemSchema(
+                title=title,
+                link=link,
+                description=description,
+                pub_date=pub_date,
+                source_name=source_name,
+            )
+            for title, link, description, pub_date, source_name in values
+        ],
+        "insert": lambda items: [item.model_dump() for item in items],
+        "deliver": lambda items: [
+            RSSItemSchema(
+                title=item.title,
+                link=item.link,
+                description=item.description,
+                pub_date=item.pub_date,
+                source_name=item.source_name,
+                language=item.language,
+            )
+            for item in items
+        ],
+        "outbox": lambda items: [
+            item.model_dump(mode="json") for item in items
+        ],
+        "send": lambda payloads: [
+            RSSItemSchema.model_validate(payload) for payload in payloads
+        ],
+    }
+
+
+def _record_steps() -> dict[str, Callable[[Any], Any]]:
+    return {
+        "ingest": lambda values: [NewsItem(*value) for value in values],
+        "insert": lambda items: [item.as_dict() for item in items],
+        "deliver": lambda items: [NewsItem.from_news(item) for item in items],
+        "outbox": lambda items: [item.as_json() for item in items],
+        "send": lambda payloads: [
+            NewsItem.from_json(payload) for payload in payloads
+        ],
+    }
+
+
+def _run(steps: dict[str, Callable[[Any], Any]], values: list[tuple]):
+    items = steps["ingest"](values)
+    steps["insert"](items)
+    copies = steps["deliver"](items)
+    payloads = steps["outbox"](copies)
+    return items, steps["send"](payloads)
+
+
+def _time(steps: dict[str, Callable[[Any], Any]], values: list[tuple]):
+    best: dict[str, float] = {}
+    for _ in range(ROUNDS):
+        data: Any = values
+        for name, step in steps.items():
+            started = time.perf_counter()
+            result = step(data)
+            elapsed = time.perf_counter() - started
+            best[name] = min(best.get(name, elapsed), elapsed)
+            # The insert's column values don't go on to the next step.
+            if name != "insert":
+                data = result
+    return best
+
+
+def _memory(steps: dict[str, Callable[[Any], Any]], values: list[tuple]):
+    tracemalloc.start()
+    items = steps["ingest"](values)
+    held = tracemalloc.get_traced_memory()[0]
+    del items
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    _run(steps, values)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return held, peak
+
+
+def main() -> None:
+    values = _values()
+    print(f"{ITEMS} items, best of {ROUNDS} rounds, ms per step")
+    names = list(_record_steps())
+    print(
+        f"{'type':<14}"
+        + "".join(f"{name:>9}" for name in names)
+        + f"{'total':>9}{'held KiB':>10}{'peak KiB':>10}",
+    )
+    for label, steps in (
+        ("RSSItemSchema", _schema_steps()),
+        ("NewsItem", _record_steps()),
+    ):
+        best = _time(steps, values)
+        held, peak = _memory(steps, values)
+        print(
+            f"{label:<14}"
+            + "".join(f"{best[name] * 1000:>9.1f}" for name in names)
+            + f"{sum(best.values()) * 1000:>9.1f}"
+            f"{held / 1024:>10.0f}{peak / 1024:>10.0f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Compare SQLite with default settings and with the tuned engine.
+
+Runs concurrent ingest writers, one session and commit per news item like
+``add_news_to_db``, next to readers issuing API-style queries, against a
+fresh database file per engine. Reports write throughput, read latency
+percentiles and "database is locked" errors.
+
+Run with ``python -m benchmarks.bench_sqlite_pragmas``.
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+# The API package must be imported before the CRUD modules it depends on.
+import ai_news_bot.web.api.router  # noqa: F401
+from ai_news_bot.db.dependencies import create_engine
+from ai_news_bot.db.meta import meta
+from ai_news_bot.db.models import load_all_models
+from ai_news_bot.db.models.news import News
+
+WRITERS = 4
+ITEMS_PER_WRITER = 250
+READERS = 4
+DESCRIPTION = "Lorem ipsum dolor sit amet. " * 20
+
+
+async def _writer(session_factory, writer_no: int, errors: list) -> None:
+    for item_no in range(ITEMS_PER_WRITER):
+        try:
+            async with session_factory() as session:
+                session.add(
+                    News(
+                        title=f"News {writer_no}-{item_no}",
+                        link=f"https://example.com/{writer_no}/{item_no}",
+                        description=DESCRIPTION,
+                        pub_date=datetime.now(),
+                        source_name=f"Source {writer_no}",
+                    ),
+                )
+                await session.commit()
+        except OperationalError as e:
+            errors.append(e)
+
+
+async def _reader(session_factory, done: asyncio.Event, latencies: list):
+    while not done.is_set():
+        started = time.perf_counter()
+        async with session_factory() as session:
+            await session.execute(
+                select(News).order_by(News.pub_date.desc()).limit(50),
+            )
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0)
+
+
+async def _run(name: str, engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(meta.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    errors: list = []
+    latencies: list[float] = []
+    done = asyncio.Event()
+    readers = [
+        asyncio.create_task(_reader(session_factory, done, latencies))
+        for _ in range(READERS)
+    ]
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _writer(session_factory, writer_no, errors)
+            for writer_no in range(WRITERS)
+        ),
+    )
+    elapsed = time.perf_counter() - started
+    done.set()
+    await asyncio.gather(*readers)
+    await engine.dispose()
+
+    written = WRITERS * ITEMS_PER_WRITER - len(errors)
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<10}{written / elapsed:>12.0f}"
+        f"{percentiles[49]:>10.2f}{percentiles[94]:>10.2f}"
+        f"{percentiles[98]:>10.2f}{len(errors):>8}",
+    )
+
+
+async def main() -> None:
+    load_all_models()
+    print(
+        f"{WRITERS} writers x {ITEMS_PER_WRITER} items, {READERS} readers",
+    )
+    print(
+        f"{'engine':<10}{'writes/s':>12}{'read p50':>10}"
+        f"{'p95':>10}{'p99':>10}{'locked':>8}",
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for name, factory in (
+            ("default", create_async_engine),
+            ("tuned", create_engine),
+        ):
+            path = os.path.join(directory, f"{name}.db")
+            await _run(name, factory(f"sqlite+aiosqlite:///{path}"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
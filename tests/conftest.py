@@ -14,9 +14,9 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from ai_news_bot.db.dependencies import get_db_session
-from ai_news_bot.db.utils import create_database
+from ai_news_bot.db.utils import create_database, drop_database
 from ai_news_bot.services.redis.dependency import get_redis_pool
-from ai_news_bot.settings import settings
+from ai_news_bot.settings import DatabaseBackend, settings
 from ai_news_bot.web.application import get_app
 
 
@@ -45,6 +45,19 @@ async def _engine() -> AsyncGenerator[AsyncEngine, None]:
 
     load_all_models()
 
+    if settings.db_backend == DatabaseBackend.POSTGRESQL:
+        # Run against the configured server, in a fresh database.
+        await create_database()
+        engine = create_async_engine(str(settings.db_url))
+        async with engine.begin() as conn:
+            await conn.run_sync(meta.create_all)
+        try:
+            yield engine
+        finally:
+            await engine.dispose()
+            await drop_database()
+        return
+
     # Create a temporary database file for testing
     test_db_fd, test_db_path = tempfile.mkstemp(suffix=".db")
     os.close(test_db_fd)  # Close the file descriptor
@@ -53,7 +66,6 @@ async def _engine() -> AsyncGenerator[AsyncEngine, None]:
     os.environ["MEDIA_WATCHER_DB_FILE"] = test_db_path
 
     # Reload settings to pick up the new database path
-    from ai_news_bot.settings import settings
     settings.db_file = Path(test_db_path)
 
     await create_database()
@@ -67,7 +79,6 @@ async def _engine() -> AsyncGenerator[AsyncEngine, None]:
     finally:
         await engine.dispose()
         # Clean up the temporary test database file
-        import os
         if os.path.exists(test_db_path):
             os.unlink(test_db_path)
 
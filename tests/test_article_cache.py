@@ -0,0 +1,108 @@
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from ai_news_bot.ai import article_cache
+from ai_news_bot.ai.article_cache import (
+    get_article,
+    get_stored_translation,
+    normalize_link,
+    save_translation,
+)
+from ai_news_bot.ai.prefetch import ArticlePrefetcher
+from ai_news_bot.db.models.article_cache import ArticleCache
+from ai_news_bot.db.writer import DatabaseWriter
+
+
+@pytest.fixture(autouse=True)
+async def session_factory(_engine: AsyncEngine):
+    """Point the article cache at the test database."""
+    maker = async_sessionmaker(_engine, expire_on_commit=False)
+
+    @contextlib.asynccontextmanager
+    async def factory():
+        async with maker() as session:
+            yield session
+            await session.commit()
+
+    article_cache.articles.clear()
+    with (
+        patch.object(article_cache, "get_standalone_session", factory),
+        patch.object(
+            article_cache,
+            "db_writer",
+            DatabaseWriter(session_factory=maker),
+        ),
+    ):
+        yield factory
+    article_cache.articles.clear()
+    async with factory() as session:
+        await session.execute(delete(ArticleCache))
+
+
+def _extracted(url: str) -> MagicMock:
+    return MagicMock(url=url, title="Title", text="Full text " * 500)
+
+
+def test_normalize_link():
+    """Test that equivalent links share a cache key."""
+    assert normalize_link(
+        "HTTPS://Example.com/news/1/?utm_source=tg&b=2&a=1#comments",
+    ) == "https://example.com/news/1?a=1&b=2"
+    assert normalize_link("https://example.com") == "https://example.com/"
+
+
+@pytest.mark.anyio
+async def test_get_article_survives_memory_eviction(session_factory):
+    """Test that articles are stored compressed and read back."""
+    link = "https://example.com/news/1"
+    with patch.object(
+        article_cache.article_extractor,
+        "extract",
+        AsyncMock(return_value=_extracted(link)),
+    ) as mock_extract:
+        first = await get_article(link)
+        article_cache.articles.clear()
+        second = await get_article(link + "?utm_medium=social")
+
+    assert first == second
+    mock_extract.assert_called_once()
+    async with session_factory() as session:
+        row = await session.get(ArticleCache, normalize_link(link))
+    assert len(row.content) < len(first.text)
+
+
+@pytest.mark.anyio
+async def test_translation_stored_with_article():
+    """Test that a translation is kept with the cached article."""
+    link = "https://example.com/news/2"
+    with patch.object(
+        article_cache.article_extractor,
+        "extract",
+        AsyncMock(return_value=_extracted(link)),
+    ):
+        await get_article(link)
+    await save_translation(link, "Перевод")
+
+    assert await get_stored_translation(link + "/") == "Перевод"
+
+
+@pytest.mark.anyio
+async def test_prefetcher_skips_duplicate_links():
+    """Test that an article is prefetched once and Telegram posts never."""
+    prefetcher = ArticlePrefetcher(concurrency=2)
+    with patch(
+        "ai_news_bot.ai.prefetch.get_article", AsyncMock()
+    ) as mock_get:
+        prefetcher.schedule("https://example.com/news/3")
+        prefetcher.schedule("https://example.com/news/3/")
+        prefetcher.schedule(None)
+        prefetcher.schedule("https://t.me/example/1")
+        await asyncio.sleep(0.01)
+        await prefetcher.close()
+
+    mock_get.assert_awaited_once_with("https://example.com/news/3")
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from ai_news_bot.ai.articles import ArticleExtractor
+
+ARTICLE_HTML = """
+<html>
+  <head><title>Test article</title></head>
+  <body>
+    <article>
+      <h1>Test article</h1>
+      <p>First paragraph of a reasonably long test article body that the
+      extractor should pick up as the main text of the page.</p>
+      <p>Second paragraph of the same article, also long enough to count
+      as content rather than boilerplate for the parser.</p>
+    </article>
+  </body>
+</html>
+"""
+
+
+@pytest.mark.anyio
+async def test_extract_parses_off_the_event_loop(monkeypatch):
+    """Test that pages are downloaded async and parsed in a worker thread."""
+    parse_threads: list[str] = []
+
+    def fake_get_full_text(url: str, html: str | None = None):
+        parse_threads.append(threading.current_thread().name)
+        return {"url": url, "html": html}
+
+    monkeypatch.setattr(
+        "ai_news_bot.ai.articles.get_full_text",
+        fake_get_full_text,
+    )
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, text=ARTICLE_HTML),
+    )
+    extractor = ArticleExtractor(client=httpx.AsyncClient(transport=transport))
+    try:
+        article = await extractor.extract("https://example.com/a")
+    finally:
+        await extractor.close()
+
+    assert article == {"url": "https://example.com/a", "html": ARTICLE_HTML}
+    assert parse_threads[0].startswith("article-parser")
+
+
+@pytest.mark.anyio
+async def test_extract_caps_concurrency_per_domain(monkeypatch):
+    """Test that one domain never gets more than per_domain requests."""
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.02)
+        active[host] -= 1
+        return httpx.Response(200, text=ARTICLE_HTML)
+
+    monkeypatch.setattr(
+        "ai_news_bot.ai.articles.get_full_text",
+        lambda url, html=None: url,
+    )
+    extractor = ArticleExtractor(
+        per_domain=2,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    try:
+        await asyncio.gather(
+            *(
+                extractor.extract(f"https://{host}/{n}")
+                for host in ("one.example", "two.example")
+                for n in range(6)
+            ),
+        )
+    finally:
+        await extractor.close()
+
+    assert peak == {"one.example": 2, "two.example": 2}
+    # Semaphores of domains nothing waits on are dropped.
+    assert extractor._domain_limits == {}
+
+
+@pytest.mark.anyio
+async def test_extract_returns_none_on_http_error():
+    """Test that failed downloads don't reach the parser."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+    extractor = ArticleExtractor(client=httpx.AsyncClient(transport=transport))
+    try:
+        assert await extractor.extract("https://example.com/missing") is None
+    finally:
+        await extractor.close()
@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ai_news_bot.ai import batch_translation
+from ai_news_bot.ai.batch_translation import TranslationBatcher
+from ai_news_bot.ai.utils import TranslateResponseSchema
+
+
+def _translated(text: str) -> TranslateResponseSchema:
+    return TranslateResponseSchema(title=f"RU {text}", description=None)
+
+
+async def _batch_response(texts: dict[str, str], api_key: str):
+    return {text_id: _translated(text) for text_id, text in texts.items()}
+
+
+@pytest.fixture(autouse=True)
+def api_key():
+    """Have an AI API key configured."""
+    with patch.object(
+        batch_translation, "get_ai_api_key", AsyncMock(return_value="key")
+    ):
+        yield
+
+
+@pytest.mark.anyio
+async def test_items_in_window_share_one_request():
+    """Test that texts submitted together are translated in one request."""
+    batcher = TranslationBatcher(window=0.05)
+    with patch.object(
+        batch_translation,
+        "request_batch_translation",
+        AsyncMock(side_effect=_batch_response),
+    ) as mock_batch, patch.object(
+        batch_translation, "request_translation", AsyncMock()
+    ) as mock_single:
+        results = await asyncio.gather(
+            *(batcher.translate(f"news {n}") for n in range(5)),
+        )
+
+    assert [result.title for result in results] == [
+        f"RU news {n}" for n in range(5)
+    ]
+    mock_batch.assert_awaited_once()
+    mock_single.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_token_budget_splits_batches():
+    """Test that a batch is sent as soon as it reaches the token budget."""
+    batcher = TranslationBatcher(window=10.0, token_budget=20)
+    with patch.object(
+        batch_translation,
+        "request_batch_translation",
+        AsyncMock(side_effect=_batch_response),
+    ) as mock_batch:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.translate("x" * 40) for _ in range(4))),
+            timeout=1.0,
+        )
+
+    assert len(results) == 4
+    assert mock_batch.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_unparsed_items_fall_back_to_single_requests():
+    """Test that items missing from the batch response are retried alone."""
+
+    async def partial_response(texts, api_key):
+        return {"0": _translated(texts["0"])}
+
+    batcher = TranslationBatcher(window=0.01)
+    with patch.object(
+        batch_translation,
+        "request_batch_translation",
+        AsyncMock(side_effect=partial_response),
+    ), patch.object(
+        batch_translation,
+        "request_translation",
+        AsyncMock(side_effect=lambda text, api_key: _translated(text)),
+    ) as mock_single:
+        results = await asyncio.gather(
+            batcher.translate("first"),
+            batcher.translate("second"),
+            batcher.translate("third"),
+        )
+
+    assert [result.title for result in results] == [
+        "RU first", "RU second", "RU third",
+    ]
+    assert mock_single.await_count == 2
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from redis.asyncio import ConnectionPool, Redis
+from starlette.websockets import WebSocketDisconnect
+
+from ai_news_bot.services.broadcast import (
+    HEARTBEAT,
+    TRY_AGAIN_LATER,
+    BroadcastHub,
+    task_channel,
+)
+
+
+class FakeWebSocket:
+    """WebSocket recording what is sent, disconnecting on demand."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.close_code: int | None = None
+        self.disconnected = asyncio.Event()
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.close_code = code
+
+    async def receive(self) -> dict:
+        await self.disconnected.wait()
+        return {"type": "websocket.disconnect"}
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    async def poll() -> None:
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.anyio
+async def test_one_subscription_feeds_task_watchers(
+    fake_redis_pool: ConnectionPool,
+) -> None:
+    """Test that a task's message reaches only the clients watching it."""
+    hub = BroadcastHub(channel="test_channel")
+    hub.start(fake_redis_pool)
+    try:
+        watchers = [hub.subscribe({1}), hub.subscribe({1, 2})]
+        other = hub.subscribe({2})
+        async with Redis(connection_pool=fake_redis_pool) as redis:
+            # Retried until the hub has subscribed.
+            for _ in range(100):
+                if await redis.publish(
+                    task_channel(1, "test_channel"),
+                    '{"id": 1}',
+                ):
+                    break
+                await asyncio.sleep(0.01)
+            patterns = await redis.pubsub_numpat()
+        received = await asyncio.gather(
+            *(asyncio.wait_for(queue.get(), 2) for queue in watchers),
+        )
+    finally:
+        await hub.stop()
+
+    assert patterns == 1
+    assert received == ['{"id": 1}'] * 2
+    assert other.empty()
+
+
+def test_unsubscribe_forgets_unwatched_tasks() -> None:
+    """Test that tasks without clients are no longer routed."""
+    hub = BroadcastHub()
+    first = hub.subscribe({1, 2})
+    second = hub.subscribe({2})
+
+    hub.unsubscribe(first)
+
+    assert not hub.watches(1)
+    assert hub.watches(2)
+    hub.unsubscribe(second)
+    assert hub.client_count == 0
+    assert not hub.watches(2)
+
+
+@pytest.mark.anyio
+async def test_slow_client_is_disconnected() -> None:
+    """Test that a client with a full queue is closed, others unharmed."""
+    hub = BroadcastHub(queue_size=2, heartbeat_interval=10)
+    slow = FakeWebSocket()
+    serving = asyncio.create_task(hub.serve(slow, {1}))
+    await _wait_for(lambda: hub.client_count == 1)
+    fast = hub.subscribe({1})
+
+    # The event loop doesn't run the slow client's sender in between.
+    for n in range(3):
+        hub.broadcast(1, str(n))
+        fast.get_nowait()
+
+    await asyncio.wait_for(serving, 2)
+    assert slow.close_code == TRY_AGAIN_LATER
+    assert slow.sent == []
+    assert hub.client_count == 1
+
+
+@pytest.mark.anyio
+async def test_heartbeat_and_cleanup_on_disconnect() -> None:
+    """Test that idle clients get heartbeats and leave on disconnect."""
+    hub = BroadcastHub(heartbeat_interval=0.01)
+    websocket = FakeWebSocket()
+    serving = asyncio.create_task(hub.serve(websocket, {1}))
+
+    await _wait_for(lambda: len(websocket.sent) >= 2)
+    websocket.disconnected.set()
+    await asyncio.wait_for(serving, 2)
+
+    assert set(websocket.sent) == {HEARTBEAT}
+    assert hub.client_count == 0
+
+
+@pytest.mark.anyio
+async def test_websocket_rejects_missing_token(fastapi_app: FastAPI) -> None:
+    """Test that the live feed refuses unauthenticated connections."""
+    # Not entered as a context manager, so the lifespan doesn't run.
+    client = TestClient(fastapi_app)
+    with pytest.raises(WebSocketDisconnect) as error:
+        with client.websocket_connect("/api/news_task/ws"):
+            pass
+    assert error.value.code == status.WS_1008_POLICY_VIOLATION
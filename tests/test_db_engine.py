@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_news_bot.db.dependencies import (
+    get_engine,
+    get_standalone_session,
+    optimize_database,
+)
+from ai_news_bot.settings import settings
+
+
+@pytest.mark.anyio
+async def test_engine_applies_sqlite_pragmas(_engine: AsyncEngine):
+    """Test that connections of the shared engine are tuned."""
+    async with get_standalone_session() as session:
+        pragmas = {
+            name: (await session.execute(text(f"PRAGMA {name}"))).scalar()
+            for name in (
+                "journal_mode",
+                "synchronous",
+                "busy_timeout",
+                "cache_size",
+                "temp_store",
+            )
+        }
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        # NORMAL
+        "synchronous": 1,
+        "busy_timeout": settings.db_busy_timeout,
+        "cache_size": -settings.db_cache_size_kib,
+        # MEMORY
+        "temp_store": 2,
+    }
+
+
+@pytest.mark.anyio
+async def test_engine_is_shared(_engine: AsyncEngine):
+    """Test that one engine serves the whole process."""
+    assert get_engine() is get_engine()
+    await optimize_database()
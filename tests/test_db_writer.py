@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime
+from functools import partial
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.models.news import News
+from ai_news_bot.db.writer import DatabaseWriter, after_commit
+
+
+@pytest.fixture
+async def session_factory(_engine: AsyncEngine):
+    """Session factory on the test database, cleaning up news after."""
+    maker = async_sessionmaker(_engine, expire_on_commit=False)
+    yield maker
+    async with maker() as session:
+        await session.execute(delete(News))
+        await session.commit()
+
+
+def _item(n: int) -> NewsItem:
+    return NewsItem(
+        title=f"News {n}",
+        link=f"https://example.com/writer/{n}",
+        description="Description",
+        pub_date=datetime.now(),
+        source_name="Source",
+    )
+
+
+async def _count_news(session_factory) -> int:
+    async with session_factory() as session:
+        result = await session.execute(select(func.count(News.id)))
+        return result.scalar_one()
+
+
+@pytest.mark.anyio
+async def test_intents_are_group_committed(session_factory):
+    """Test that concurrent intents share commits and all get results."""
+    commits = 0
+
+    class CountingSession(AsyncSession):
+        async def commit(self) -> None:
+            nonlocal commits
+            commits += 1
+            await super().commit()
+
+    writer = DatabaseWriter(
+        batch_window=0.01,
+        session_factory=async_sessionmaker(
+            session_factory.kw["bind"],
+            class_=CountingSession,
+            expire_on_commit=False,
+        ),
+    )
+    writer.start()
+    try:
+        added = await asyncio.gather(
+            *(
+                writer.submit(partial(crud_news.add_if_new, item=_item(n)))
+                for n in range(50)
+            ),
+        )
+    finally:
+        await writer.stop()
+
+    assert all(news is not None and news.id for news in added)
+    assert await _count_news(session_factory) == 50
+    assert commits < 5
+
+
+@pytest.mark.anyio
+async def test_failing_intent_does_not_fail_the_group(session_factory):
+    """Test that only the failing intent gets its error."""
+
+    async def broken(session: AsyncSession) -> None:
+        session.add(News(title=None))
+        await session.flush()
+
+    writer = DatabaseWriter(batch_window=0.01, session_factory=session_factory)
+    writer.start()
+    try:
+        results = await asyncio.gather(
+            writer.submit(partial(crud_news.add_if_new, item=_item(1))),
+            writer.submit(broken),
+            writer.submit(partial(crud_news.add_if_new, item=_item(2))),
+            return_exceptions=True,
+        )
+    finally:
+        await writer.stop()
+
+    assert isinstance(results[0], News)
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[2], News)
+    assert await _count_news(session_factory) == 2
+
+
+@pytest.mark.anyio
+async def test_stop_commits_queued_intents(session_factory):
+    """Test that intents queued before stopping are still written."""
+    writer = DatabaseWriter(batch_window=0.05, session_factory=session_factory)
+    writer.start()
+    pending = [
+        asyncio.create_task(
+            writer.submit(partial(crud_news.add_if_new, item=_item(n))),
+        )
+        for n in range(3)
+    ]
+    await asyncio.sleep(0)
+    await writer.stop()
+
+    results = await asyncio.gather(*pending)
+    assert all(isinstance(news, News) for news in results)
+    assert await _count_news(session_factory) == 3
+
+
+@pytest.mark.anyio
+async def test_after_commit_skips_rolled_back_groups(session_factory):
+    """Test that callbacks only run for committed writes."""
+    committed: list[int] = []
+
+    async def add(session: AsyncSession, n: int) -> None:
+        await crud_news.add_if_new(session, item=_item(n))
+        after_commit(session, partial(committed.append, n))
+
+    async def broken(session: AsyncSession) -> None:
+        after_commit(session, partial(committed.append, -1))
+        session.add(News(title=None))
+        await session.flush()
+
+    writer = DatabaseWriter(batch_window=0.01, session_factory=session_factory)
+    writer.start()
+    try:
+        await asyncio.gather(
+            writer.submit(partial(add, n=1)),
+            writer.submit(broken),
+            writer.submit(partial(add, n=2)),
+            return_exceptions=True,
+        )
+    finally:
+        await writer.stop()
+
+    # The failed group commit ran nothing, the retries one each.
+    assert sorted(committed) == [1, 2]
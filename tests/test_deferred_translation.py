@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ai_news_bot.telegram.deferred_translation import DeferredTranslator
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_messages_edited_once_translated():
+    """Test that messages delivered before and after translation are edited."""
+    translated = asyncio.Event()
+
+    async def translate(item):
+        await translated.wait()
+        return f"translated {item}"
+
+    apply = AsyncMock()
+    translator = DeferredTranslator(translate=translate, apply=apply)
+    translator.start()
+    try:
+        translator.submit("key", "news")
+        translator.submit("key", "news")
+        translator.delivered("key", {"chat_id": 1, "message_id": 10})
+        await _settle()
+        apply.assert_not_called()
+
+        translated.set()
+        await _settle()
+        translator.delivered("key", {"chat_id": 2, "message_id": 20})
+        await _settle()
+    finally:
+        await translator.stop()
+
+    assert [call.args for call in apply.call_args_list] == [
+        ({"chat_id": 1, "message_id": 10}, "translated news"),
+        ({"chat_id": 2, "message_id": 20}, "translated news"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_failed_translation_leaves_messages():
+    """Test that nothing is edited when the translation fails."""
+    apply = AsyncMock()
+    translator = DeferredTranslator(
+        translate=AsyncMock(side_effect=RuntimeError("AI is down")),
+        apply=apply,
+    )
+    translator.start()
+    try:
+        translator.submit("key", "news")
+        translator.delivered("key", {"chat_id": 1, "message_id": 10})
+        await _settle()
+        translator.delivered("key", {"chat_id": 2, "message_id": 20})
+        await _settle()
+    finally:
+        await translator.stop()
+
+    apply.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_full_queue_skips_translation():
+    """Test that items beyond the queue bound stay untranslated."""
+    translate = AsyncMock(return_value="translated")
+    translator = DeferredTranslator(
+        translate=translate,
+        apply=AsyncMock(),
+        max_queue=1,
+    )
+    translator.submit("first", "news 1")
+    translator.submit("second", "news 2")
+    translator.start()
+    await _settle()
+    await translator.stop()
+
+    translate.assert_awaited_once_with("news 1")
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from collections import deque
+
+import pytest
+from telegram.error import RetryAfter
+
+from ai_news_bot.telegram.delivery import DeliveryEngine, TokenBucket
+
+
+def test_token_bucket_limits_burst():
+    """Test that a bucket hands out its capacity, then asks to wait."""
+    bucket = TokenBucket(rate=10.0, capacity=2.0)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    delay = bucket.try_acquire()
+    assert 0 < delay <= 0.1
+
+
+def test_token_bucket_pause():
+    """Test that a paused bucket hands out nothing until the pause ends."""
+    bucket = TokenBucket(rate=100.0, capacity=5.0)
+    bucket.pause(0.5)
+    assert bucket.try_acquire() > 0.4
+
+
+def test_delivery_engine_prunes_idle_buckets():
+    """Test that buckets of idle chats are forgotten once refilled."""
+
+    async def send(message: dict) -> None:
+        """Nothing to send."""
+
+    engine = DeliveryEngine(send=send, chat_rate=100.0, prune_interval=0.0)
+    engine._chat_bucket(1).try_acquire()
+    engine._chat_bucket(2).try_acquire()
+    engine._pending[2] = deque([{"chat_id": 2}])
+    time.sleep(0.02)
+
+    engine._chat_bucket(3).try_acquire()
+
+    assert set(engine._chat_buckets) == {2, 3}
+
+
+async def _wait_for(condition, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for delivery"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_delivery_engine_keeps_order_per_chat():
+    """Test that messages of one chat are sent in submission order."""
+    sent: list[tuple[int, int]] = []
+
+    async def send(message: dict) -> None:
+        await asyncio.sleep(0.001)
+        sent.append((message["chat_id"], message["n"]))
+
+    engine = DeliveryEngine(
+        send=send,
+        workers=4,
+        global_rate=1000.0,
+        chat_rate=1000.0,
+        group_rate=1000.0,
+    )
+    engine.start()
+    for n in range(10):
+        for chat_id in (1, 2, -3):
+            engine.submit({"chat_id": chat_id, "n": n})
+    try:
+        await _wait_for(lambda: len(sent) == 30)
+    finally:
+        await engine.stop()
+
+    for chat_id in (1, 2, -3):
+        assert [n for chat, n in sent if chat == chat_id] == list(range(10))
+    assert engine.depth == 0
+
+
+@pytest.mark.anyio
+async def test_delivery_engine_applies_chat_rate():
+    """Test that one chat is throttled while others are not held up."""
+    sent: list[tuple[int, float]] = []
+
+    async def send(message: dict) -> None:
+        sent.append((message["chat_id"], time.monotonic()))
+
+    engine = DeliveryEngine(
+        send=send,
+        workers=1,
+        global_rate=1000.0,
+        chat_rate=10.0,
+    )
+    engine.start()
+    for _ in range(3):
+        engine.submit({"chat_id": 1})
+    for chat_id in range(100, 110):
+        engine.submit({"chat_id": chat_id})
+    try:
+        await _wait_for(lambda: len(sent) == 13)
+    finally:
+        await engine.stop()
+
+    chat_one = [sent_at for chat, sent_at in sent if chat == 1]
+    assert chat_one[2] - chat_one[0] >= 0.15
+    # The other chats didn't have to wait behind the throttled one.
+    other_chats_done = max(t for chat, t in sent if chat != 1)
+    assert other_chats_done < chat_one[2]
+
+
+@pytest.mark.anyio
+async def test_delivery_engine_honours_retry_after():
+    """Test that a RetryAfter pauses sending and retries the message."""
+    attempts: list[float] = []
+    sent: list[int] = []
+
+    async def send(message: dict) -> None:
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise RetryAfter(1)
+        sent.append(message["n"])
+
+    engine = DeliveryEngine(send=send, workers=2, chat_rate=1000.0)
+    engine.start()
+    engine.submit({"chat_id": 1, "n": 1})
+    engine.submit({"chat_id": 1, "n": 2})
+    try:
+        await _wait_for(lambda: len(sent) == 2)
+    finally:
+        await engine.stop()
+
+    assert sent == [1, 2]
+    assert attempts[1] - attempts[0] >= 0.9
@@ -0,0 +1,186 @@
+import zlib
+from datetime import datetime
+
+import pytest
+import ujson
+from httpx import AsyncClient
+from redis.asyncio import ConnectionPool
+
+from ai_news_bot.db.models.news import News
+from ai_news_bot.db.models.news_task import NewsTask
+from ai_news_bot.services.redis.events import (
+    KEEPALIVE,
+    GzipStream,
+    read_events,
+)
+from ai_news_bot.services.redis.publisher import VerdictPublisher
+from ai_news_bot.settings import settings
+
+
+async def _publish(pool: ConnectionPool, verdicts: list[tuple]) -> None:
+    publisher = VerdictPublisher(stream="test_stream")
+    publisher.start(pool)
+    for news_id, task_id, result in verdicts:
+        publisher.add(
+            News(
+                id=news_id,
+                title=f"News {news_id}",
+                link=f"https://example.com/{news_id}",
+                pub_date=datetime(2026, 1, 1),
+                source_name="Source",
+            ),
+            NewsTask(id=task_id, title=f"Task {task_id}"),
+            result,
+        )
+    await publisher.flush()
+
+
+async def _take(events, count: int) -> list[bytes]:
+    taken = []
+    async for event in events:
+        taken.append(event)
+        if len(taken) == count:
+            break
+    await events.aclose()
+    return taken
+
+
+def _parse(event: bytes) -> tuple[str, dict]:
+    lines = dict(
+        line.split(": ", 1) for line in event.decode().strip().split("\n")
+    )
+    return lines["id"], ujson.loads(lines["data"])
+
+
+@pytest.mark.anyio
+async def test_events_resume_after_last_event_id(
+    fake_redis_pool: ConnectionPool,
+) -> None:
+    """Test that a reconnecting client gets the events it missed."""
+    await _publish(fake_redis_pool, [(1, 1, True), (2, 1, False)])
+    first = await _take(
+        read_events(fake_redis_pool, "0-0", stream="test_stream"),
+        3,
+    )
+    first_id, _ = _parse(first[1])
+    await _publish(fake_redis_pool, [(3, 1, True)])
+
+    resumed = await _take(
+        read_events(fake_redis_pool, first_id, stream="test_stream"),
+        3,
+    )
+
+    assert first[0].startswith(b"retry:")
+    assert [_parse(event)[1]["news"]["id"] for event in resumed[1:]] == [
+        2,
+        3,
+    ]
+
+
+@pytest.mark.anyio
+async def test_events_are_filtered_by_task_and_verdict(
+    fake_redis_pool: ConnectionPool,
+) -> None:
+    """Test that only the requested verdicts are sent."""
+    await _publish(
+        fake_redis_pool,
+        [(1, 1, True), (2, 2, True), (3, 1, False), (4, 1, True)],
+    )
+
+    events = await _take(
+        read_events(
+            fake_redis_pool,
+            "0-0",
+            task_ids=[1],
+            result=True,
+            keepalive=0.05,
+            stream="test_stream",
+        ),
+        4,
+    )
+
+    assert [_parse(event)[1]["news"]["id"] for event in events[1:3]] == [
+        1,
+        4,
+    ]
+    assert events[3] == KEEPALIVE
+
+
+@pytest.mark.anyio
+async def test_no_events_without_tasks(
+    fake_redis_pool: ConnectionPool,
+) -> None:
+    """Test that a user without tasks gets only keep-alives."""
+    await _publish(fake_redis_pool, [(1, 1, True)])
+
+    events = await _take(
+        read_events(
+            fake_redis_pool,
+            "0-0",
+            task_ids=set(),
+            keepalive=0.05,
+            stream="test_stream",
+        ),
+        2,
+    )
+
+    assert events[1] == KEEPALIVE
+
+
+def test_gzip_stream_chunks_decompress_one_by_one() -> None:
+    """Test that every compressed chunk can be read when it arrives."""
+    gzip = GzipStream()
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    chunks = [f"id: {n}-0\ndata: {{}}\n\n".encode() for n in range(3)]
+
+    for chunk in chunks:
+        assert decompressor.decompress(gzip.compress(chunk)) == chunk
+
+
+@pytest.mark.anyio
+async def test_invalid_last_event_id_is_rejected(
+    client: AsyncClient,
+    auth_headers: dict,
+) -> None:
+    """Test that a malformed Last-Event-ID is a bad request."""
+    response = await client.get(
+        "/api/news_task/events",
+        headers={"Last-Event-ID": "not-an-id", **auth_headers},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_events_accept_the_auth_cookie(
+    client: AsyncClient,
+    auth_headers: dict,
+) -> None:
+    """Test that EventSource clients are authenticated with a cookie."""
+    response = await client.post(
+        "/api/auth/cookie/login",
+        data={
+            "username": settings.admin_email,
+            "password": settings.admin_password,
+        },
+    )
+    assert response.status_code == 204
+    cookie = response.headers["set-cookie"]
+    assert "HttpOnly" in cookie
+    assert "SameSite=strict" in cookie
+
+    # Bad Last-Event-ID instead of 401, as the user was authenticated.
+    response = await client.get(
+        "/api/news_task/events",
+        headers={
+            "Last-Event-ID": "not-an-id",
+            "Cookie": cookie.split(";")[0],
+        },
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_events_require_authentication(client: AsyncClient) -> None:
+    """Test that anonymous clients get no events."""
+    response = await client.get("/api/news_task/events")
+    assert response.status_code == 401
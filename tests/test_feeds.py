@@ -0,0 +1,108 @@
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from ai_news_bot.ai import utils
+from ai_news_bot.ai.feed_worker import parse_feed
+from ai_news_bot.ai.feeds import FeedParser
+
+
+def make_feed(items: int) -> bytes:
+    """Build an RSS feed with the given number of items."""
+    entries = "".join(
+        f"""
+        <item>
+            <title>Новость {index}</title>
+            <link>https://example.com/{index}</link>
+            <description>Description {index}</description>
+            <pubDate>Mon, 19 Oct 2026 10:{index % 60:02d}:00 GMT</pubDate>
+        </item>"""
+        for index in range(items)
+    )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Example</title>
+        <link>https://example.com</link>
+        <description>Example feed</description>{entries}
+    </channel>
+</rss>""".encode()
+
+
+class BrokenExecutor:
+    """Executor of a pool whose worker died."""
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("A worker died")
+
+    def shutdown(self, *args, **kwargs) -> None:
+        """Nothing to shut down."""
+
+
+def test_parse_feed() -> None:
+    """Test that feeds are parsed into compact items."""
+    items = parse_feed(make_feed(2))
+
+    assert items == [
+        (
+            "Новость 0",
+            "https://example.com/0",
+            "Description 0",
+            datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc),
+        ),
+        (
+            "Новость 1",
+            "https://example.com/1",
+            "Description 1",
+            datetime(2026, 10, 19, 10, 1, tzinfo=timezone.utc),
+        ),
+    ]
+
+
+@pytest.mark.anyio
+async def test_feed_parser_uses_pool_for_large_feeds() -> None:
+    """Test that large feeds are parsed in a worker process."""
+    feed_parser = FeedParser(max_workers=1, inline_max_bytes=1024)
+    content = make_feed(20)
+    try:
+        items = await feed_parser.parse(content)
+        assert feed_parser._executor is not None
+    finally:
+        await feed_parser.close()
+
+    assert items == parse_feed(content)
+
+
+@pytest.mark.anyio
+async def test_feed_parser_falls_back_to_inline() -> None:
+    """Test that small feeds and feeds hit by a broken pool are parsed."""
+    feed_parser = FeedParser(max_workers=1, inline_max_bytes=1024)
+    small = make_feed(1)
+    large = make_feed(20)
+
+    assert await feed_parser.parse(small) == parse_feed(small)
+    assert feed_parser._executor is None
+
+    feed_parser._executor = BrokenExecutor()
+    assert await feed_parser.parse(large) == parse_feed(large)
+    assert feed_parser._executor is None
+
+
+@pytest.mark.anyio
+async def test_parse_rss_feed_skips_bad_feeds() -> None:
+    """Test that a feed that can't be parsed gives no items."""
+    request = httpx.Request("GET", "https://example.com/rss")
+    good = httpx.Response(200, content=make_feed(3), request=request)
+    bad = httpx.Response(200, content=b"<rss>", request=request)
+
+    items = await utils.parse_rss_feed(good, "Example")
+
+    assert [item.title for item in items] == [
+        "Новость 0",
+        "Новость 1",
+        "Новость 2",
+    ]
+    assert items[0].source_name == "Example"
+    assert await utils.parse_rss_feed(bad, "Example") == []
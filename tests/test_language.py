@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+
+from ai_news_bot.ai import language
+from ai_news_bot.ai.language import (
+    LanguageProfiles,
+    detect_text_language,
+    text_script,
+)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Apple unveils new iPhone with the fastest chip yet", "en"),
+        ("Госдума приняла закон о цифровом рубле", "ru"),
+        ("Верховна Рада ухвалила бюджет на наступний рік", "uk"),
+        ("Госдума приняла закон о налогах", "ru"),
+        ("Die Regierung plant neue Steuern für Unternehmen", "de"),
+        ("12345 !!!", None),
+    ],
+)
+def test_detect_text_language(text, expected):
+    """Test detection of the languages the bot deals with."""
+    assert detect_text_language(text) == expected
+
+
+def test_detect_text_language_is_deterministic():
+    """Test that the statistical detector gives stable results."""
+    text = "Un nouveau gouvernement prend ses fonctions"
+    assert len({detect_text_language(text) for _ in range(20)}) == 1
+
+
+def test_text_script_ignores_html():
+    """Test that markup doesn't turn Cyrillic text into Latin."""
+    profiles = LanguageProfiles(min_samples=1)
+    assert profiles.detect(
+        "Новости",
+        '<a href="https://example.com/some/long/path">Подробнее</a>',
+        "Source",
+    ) == "ru"
+    assert text_script("<b>Новости</b>") == "cyrillic"
+
+
+def test_dominant_language_skips_detection():
+    """Test that a source with a clear language isn't detected again."""
+    profiles = LanguageProfiles(min_samples=3, threshold=0.9)
+    for _ in range(3):
+        profiles.detect("The market is up after the report", None, "Reuters")
+    assert profiles.dominant("Reuters") == "en"
+
+    with patch.object(language, "detect_text_language") as mock_detect:
+        assert profiles.detect("Fed holds rates", None, "Reuters") == "en"
+        mock_detect.assert_not_called()
+        # A text in another script is still detected.
+        mock_detect.return_value = "ru"
+        assert profiles.detect("Курс доллара", None, "Reuters") == "ru"
+        mock_detect.assert_called_once()
+
+
+def test_mixed_source_has_no_dominant_language():
+    """Test that sources publishing in several languages are detected."""
+    profiles = LanguageProfiles(min_samples=2, threshold=0.9)
+    for title in ("The market is up after the report", "Рынок вырос"):
+        profiles.detect(title, None, "Mixed")
+    assert profiles.dominant("Mixed") is None
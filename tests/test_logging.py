@@ -0,0 +1,157 @@
+import logging
+import queue
+import time
+from typing import Any
+
+from ai_news_bot.log import (
+    BatchingLokiHandler,
+    FlushingQueueListener,
+    LogfmtFormatter,
+    LogQueueHandler,
+    RateLimitFilter,
+)
+
+
+class ListHandler(logging.Handler):
+    """Handler keeping the records it gets."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class FakeResponse:
+    status_code = 204
+
+
+class FakeSession:
+    """HTTP session keeping the pushed payloads."""
+
+    def __init__(self) -> None:
+        self.payloads: list[dict[str, Any]] = []
+
+    def post(self, url: str, json: dict[str, Any], **kwargs: Any):
+        self.payloads.append(json)
+        return FakeResponse()
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+def make_record(
+    msg: str,
+    *args: Any,
+    name: str = "ai_news_bot.test",
+    level: int = logging.INFO,
+    **extra: Any,
+) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_rate_limit_filter() -> None:
+    """Test that repeated messages are limited and the drops reported."""
+    rate_filter = RateLimitFilter(rate=2, period=0.05)
+
+    passed = [
+        rate_filter.filter(make_record("News %s", index))
+        for index in range(5)
+    ]
+    other = rate_filter.filter(make_record("Other"))
+    time.sleep(0.06)
+    record = make_record("News %s", 5)
+
+    assert passed == [True, True, False, False, False]
+    assert other
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "News 5 (3 similar messages dropped)"
+
+
+def test_logfmt_formatter() -> None:
+    """Test that extra fields are formatted as logfmt."""
+    record = make_record(
+        "News '%s' is relevant",
+        'Say "hi"',
+        news_id=3,
+        relevant=True,
+    )
+
+    line = LogfmtFormatter().format(record)
+
+    assert line == (
+        'msg="News \'Say \\"hi\\"\' is relevant" news_id=3 relevant=True'
+    )
+
+
+def test_queue_handler_resolves_arguments() -> None:
+    """Test that records reach the handlers from the listener thread."""
+    log_queue: queue.Queue = queue.Queue(maxsize=10)
+    target = ListHandler()
+    listener = FlushingQueueListener(log_queue, target, flush_interval=0.01)
+    handler = LogQueueHandler(log_queue)
+    items = ["first"]
+    listener.start()
+    try:
+        handler.handle(make_record("Items %s", items, task_id=1))
+        # Changes after logging don't show up in the message.
+        items.append("second")
+    finally:
+        listener.stop()
+
+    [record] = target.records
+    assert record.getMessage() == "Items ['first']"
+    assert record.task_id == 1
+
+
+def test_queue_handler_drops_when_full() -> None:
+    """Test that logging doesn't wait for a full queue."""
+    log_queue: queue.Queue = queue.Queue(maxsize=1)
+    handler = LogQueueHandler(log_queue)
+
+    handler.handle(make_record("First"))
+    handler.handle(make_record("Second"))
+
+    assert log_queue.qsize() == 1
+    assert log_queue.get_nowait().msg == "First"
+
+
+def test_loki_handler_batches() -> None:
+    """Test that records are pushed in batches, one stream per label set."""
+    handler = BatchingLokiHandler(
+        "http://loki/loki/api/v1/push",
+        tags={"application": "test"},
+        batch_size=3,
+        flush_interval=60.0,
+    )
+    session = FakeSession()
+    handler.emitter._session = session
+    records = [
+        make_record("One"),
+        make_record("Two", level=logging.WARNING),
+        make_record("Three"),
+        make_record("Four"),
+    ]
+
+    for record in records:
+        handler.handle(record)
+
+    assert len(session.payloads) == 1
+    streams = session.payloads[0]["streams"]
+    assert [stream["stream"]["severity"] for stream in streams] == [
+        "info",
+        "warning",
+    ]
+    assert streams[0]["stream"]["application"] == "test"
+    assert streams[0]["values"] == [
+        [str(int(records[0].created * 1e9)), "One"],
+        [str(int(records[2].created * 1e9)), "Three"],
+    ]
+
+    handler.close()
+
+    assert len(session.payloads) == 2
+    assert session.payloads[1]["streams"][0]["values"][0][1] == "Four"
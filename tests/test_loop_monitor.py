@@ -0,0 +1,54 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ai_news_bot.services import loop_monitor as loop_monitor_module
+from ai_news_bot.services import metrics
+from ai_news_bot.services.loop_monitor import LoopMonitor
+
+
+def block_the_loop(seconds: float) -> None:
+    """Stand-in for a blocking call on the event loop."""
+    time.sleep(seconds)
+
+
+@pytest.mark.anyio
+async def test_loop_monitor_reports_blocking_call() -> None:
+    """Test that a stall is measured and its stack dumped once."""
+    monitor = LoopMonitor(interval=0.01, threshold=0.1, dump_interval=60.0)
+    stalls = metrics.event_loop_stalls.labels().value
+    lags = metrics.event_loop_lag_seconds.labels().count
+    with patch.object(loop_monitor_module.logger, "warning") as warning:
+        monitor.start()
+        await asyncio.sleep(0.05)
+        block_the_loop(0.3)
+        await asyncio.sleep(0.05)
+        # A second stall within the dump interval isn't dumped.
+        block_the_loop(0.3)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    assert metrics.event_loop_stalls.labels().value == stalls + 2
+    assert metrics.event_loop_lag_seconds.labels().count > lags
+    warning.assert_called_once()
+    message, stalled, stack = warning.call_args.args
+    assert message.startswith("Event loop blocked")
+    assert stalled >= 0.1
+    assert "block_the_loop" in stack
+
+
+@pytest.mark.anyio
+async def test_loop_monitor_ignores_short_lag() -> None:
+    """Test that lag below the threshold isn't reported."""
+    monitor = LoopMonitor(interval=0.01, threshold=0.5)
+    stalls = metrics.event_loop_stalls.labels().value
+    with patch.object(loop_monitor_module.logger, "warning") as warning:
+        monitor.start()
+        block_the_loop(0.05)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    assert metrics.event_loop_stalls.labels().value == stalls
+    warning.assert_not_called()
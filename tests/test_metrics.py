@@ -0,0 +1,83 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from ai_news_bot.services import metrics
+from ai_news_bot.services.metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+)
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    """Test that observations are counted in every bucket above them."""
+    registry = Registry()
+    histogram = Histogram(
+        "test_seconds",
+        "Test latency.",
+        ["stage"],
+        buckets=[0.1, 1.0],
+        registry=registry,
+    )
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.labels("fetch").observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == [
+        "# HELP test_seconds Test latency.",
+        "# TYPE test_seconds histogram",
+    ]
+    assert lines[2:] == [
+        'test_seconds_bucket{stage="fetch",le="0.1"} 2',
+        'test_seconds_bucket{stage="fetch",le="1.0"} 3',
+        'test_seconds_bucket{stage="fetch",le="+Inf"} 4',
+        'test_seconds_sum{stage="fetch"} 2.65',
+        'test_seconds_count{stage="fetch"} 4',
+    ]
+
+
+def test_counter_and_gauge_samples() -> None:
+    """Test label escaping, label checks and gauge functions."""
+    registry = Registry()
+    counter = Counter(
+        "test_total",
+        "Test counter.",
+        ["source"],
+        registry=registry,
+    )
+    gauge = Gauge("test_depth", "Test gauge.", registry=registry)
+    counter.labels('Say "hi"').inc(3)
+    gauge.set_function(lambda: 7)
+
+    text = registry.render()
+
+    assert 'test_total{source="Say \\"hi\\""} 3\n' in text
+    assert "test_depth 7\n" in text
+    with pytest.raises(ValueError):
+        counter.labels()
+    with pytest.raises(ValueError):
+        Counter("test_total", "Duplicate.", registry=registry)
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+) -> None:
+    """Test that the pipeline metrics are exposed without authentication."""
+    metrics.feed_fetch_bytes.labels("Endpoint source").inc(100)
+
+    response = await client.get(fastapi_app.url_path_for("metrics"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert "# TYPE ai_news_bot_db_commit_seconds histogram" in response.text
+    assert (
+        'ai_news_bot_feed_fetch_bytes_total{source="Endpoint source"} 100'
+        in response.text
+    )
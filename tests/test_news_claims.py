@@ -0,0 +1,128 @@
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from ai_news_bot.ai import utils
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.models.news import News
+from ai_news_bot.db.models.news_stage import NewsStage
+from ai_news_bot.db.writer import DatabaseWriter
+from ai_news_bot.services import timeline
+
+
+@pytest.fixture
+async def session_factory(_engine: AsyncEngine):
+    """Session factory on the test database, cleaning up news after."""
+    maker = async_sessionmaker(_engine, expire_on_commit=False)
+    yield maker
+    async with maker() as session:
+        await session.execute(delete(NewsStage))
+        await session.execute(delete(News))
+        await session.commit()
+
+
+def _item(n: int) -> NewsItem:
+    return NewsItem(
+        title=f"News {n}",
+        link=f"https://example.com/claims/{n}",
+        description="Description",
+        pub_date=datetime.now(),
+        source_name="Source",
+    )
+
+
+async def _add(session_factory, count: int) -> None:
+    async with session_factory() as session:
+        for n in range(count):
+            await crud_news.add_if_new(session, _item(n))
+        await session.commit()
+
+
+@pytest.mark.anyio
+async def test_add_if_new_skips_known_links(session_factory):
+    """Test that a link already stored is not added again."""
+    async with session_factory() as session:
+        first = await crud_news.add_if_new(session, _item(1))
+        second = await crud_news.add_if_new(session, _item(1))
+        await session.commit()
+
+    assert first is not None
+    assert first.id is not None
+    assert second is None
+
+
+@pytest.mark.anyio
+async def test_add_news_to_db_skips_failing_items(session_factory):
+    """Test that an item failing to insert doesn't stop the others."""
+
+    @contextlib.asynccontextmanager
+    async def standalone_session():
+        async with session_factory() as session:
+            yield session
+            await session.commit()
+
+    writer = DatabaseWriter(session_factory=session_factory)
+    writer.start()
+    broken = _item(2)
+    broken.title = None
+    try:
+        with (
+            patch.object(utils, "db_writer", writer),
+            patch.object(timeline, "db_writer", writer),
+            patch.object(utils, "get_standalone_session", standalone_session),
+        ):
+            await utils.add_news_to_db([_item(1), broken, _item(3)])
+    finally:
+        await writer.stop()
+
+    async with session_factory() as session:
+        links = (await session.execute(select(News.link))).scalars().all()
+        stages = (await session.execute(select(NewsStage))).scalars().all()
+    assert sorted(links) == [_item(1).link, _item(3).link]
+    assert len(stages) == 4
+
+
+@pytest.mark.anyio
+async def test_concurrent_claims_dont_overlap(session_factory):
+    """Test that every news item is claimed by a single consumer."""
+    await _add(session_factory, 30)
+
+    async def claim() -> list[int]:
+        async with session_factory() as session:
+            news = await crud_news.claim_unprocessed_news(session, limit=10)
+            await session.commit()
+        return [item.id for item in news]
+
+    claims = await asyncio.gather(*(claim() for _ in range(5)))
+    claimed = [news_id for ids in claims for news_id in ids]
+
+    assert len(claimed) == 30
+    assert len(set(claimed)) == 30
+
+
+@pytest.mark.anyio
+async def test_expired_and_released_claims_are_reclaimed(session_factory):
+    """Test that news comes back once its claim expires or is released."""
+    await _add(session_factory, 2)
+    async with session_factory() as session:
+        first, second = await crud_news.claim_unprocessed_news(session)
+        assert await crud_news.claim_unprocessed_news(session) == []
+        await crud_news.release_claims(session, news_ids=[first.id])
+        await session.execute(
+            update(News).where(News.id == second.id).values(
+                claimed_at=datetime.now() - timedelta(hours=1),
+            ),
+        )
+        reclaimed = await crud_news.claim_unprocessed_news(
+            session,
+            claim_timeout=timedelta(minutes=10),
+        )
+        await session.commit()
+
+    assert [news.id for news in reclaimed] == [first.id, second.id]
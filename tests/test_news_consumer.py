@@ -1,23 +1,35 @@
-from datetime import datetime, timezone
+import contextlib
+import uuid
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
 
+from ai_news_bot.ai import news_consumer as news_consumer_module
 from ai_news_bot.ai.news_consumer import (
     add_positive_news,
     news_consumer,
     process_news,
     send_news_to_telegram,
 )
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.ai.translation import translation_key
 from ai_news_bot.db.crud.news import crud_news
 from ai_news_bot.db.crud.news_task import news_task_crud
 from ai_news_bot.db.crud.prompt import crud_prompt
 from ai_news_bot.db.crud.telegram import telegram_user_crud
 from ai_news_bot.db.models.news import News
 from ai_news_bot.db.models.news_task import NewsTask
+from ai_news_bot.db.models.news_stage import NewsStage
 from ai_news_bot.db.models.prompt import Prompt
-from ai_news_bot.web.api.news_task.schema import RSSItemSchema
+from ai_news_bot.db.writer import DatabaseWriter
+from ai_news_bot.services import timeline
 
 
 # Test fixtures
@@ -69,9 +81,10 @@ def sample_prompt():
 async def test_send_news_to_telegram(sample_news, dbsession: AsyncSession):
     """Test sending news to telegram."""
     chat_ids = [123456789, 987654321]
+    sample_news.language = "ru"
 
     with patch.object(
-        telegram_user_crud, 'get_all_chat_ids', return_value=chat_ids
+        telegram_user_crud, 'get_subscribed_chat_ids', return_value=chat_ids
     ):
         with patch(
             'ai_news_bot.ai.news_consumer.queue_task_message'
@@ -87,9 +100,34 @@ async def test_send_news_to_telegram(sample_news, dbsession: AsyncSession):
             assert "Test News Title" in call_args['text']
             assert "https://example.com/news/1" in call_args['text']
             assert call_args['task_id'] == "1"
-            assert call_args['news'] == RSSItemSchema.model_validate(
-                sample_news
-            )
+            assert call_args['news'] == NewsItem.from_news(sample_news)
+            assert call_args['translatable'] is False
+
+
+@pytest.mark.anyio
+async def test_send_news_to_telegram_defers_translation(sample_news):
+    """Test that English news is sent at once and translated once."""
+    chat_ids = [123456789, 987654321, 555555555]
+    sample_news.language = "en"
+
+    with patch.object(
+        telegram_user_crud, 'get_subscribed_chat_ids', return_value=chat_ids
+    ):
+        with patch(
+            'ai_news_bot.ai.news_consumer.deferred_translator'
+        ) as mock_translator:
+            with patch(
+                'ai_news_bot.ai.news_consumer.queue_task_message'
+            ) as mock_queue:
+                await send_news_to_telegram(sample_news, task_id=1)
+
+    key = translation_key(sample_news)
+    mock_translator.submit.assert_called_once_with(key, sample_news)
+    assert mock_queue.call_count == 3
+    for call in mock_queue.call_args_list:
+        assert "Test News Title" in call[1]['text']
+        assert call[1]['translatable'] is True
+        assert call[1]['translation_key'] == key
 
 
 @pytest.mark.anyio
@@ -166,17 +204,118 @@ async def test_add_positive_news(
                 mock_add_positive.assert_called_once()
                 call_args = mock_add_positive.call_args[1]
 
-                # Check the RSSItemSchema was created correctly
                 rss_item = call_args['news']
-                assert isinstance(rss_item, RSSItemSchema)
+                assert isinstance(rss_item, NewsItem)
                 assert rss_item.title == sample_news.title
                 assert rss_item.link == sample_news.link
 
 
+@pytest.fixture
+async def database(_engine: AsyncEngine):
+    """Run the database writer and sessions on the test database."""
+    maker = async_sessionmaker(_engine, expire_on_commit=False)
+
+    @contextlib.asynccontextmanager
+    async def factory():
+        async with maker() as session:
+            yield session
+            await session.commit()
+
+    writer = DatabaseWriter(session_factory=maker)
+    writer.start()
+    with (
+        patch.object(news_consumer_module, "db_writer", writer),
+        patch.object(timeline, "db_writer", writer),
+        patch.object(
+            news_consumer_module,
+            "get_standalone_session",
+            factory,
+        ),
+    ):
+        yield maker
+    await writer.stop()
+    async with factory() as session:
+        await session.execute(delete(NewsStage))
+        await session.execute(delete(News))
+        await session.execute(delete(NewsTask))
+
+
+async def _add_news_and_task(maker) -> tuple[int, int]:
+    async with maker() as session:
+        news = News(
+            title="Relevant News",
+            link="https://example.com/news/relevant",
+            description="Description",
+            pub_date=datetime.now(),
+            source_name="Test Source",
+        )
+        news_task = NewsTask(
+            title="Test Task",
+            description="Filter for tech news",
+            end_date=datetime.now() + timedelta(days=1),
+            user_id=uuid.uuid4(),
+            rss_urls={"Test Source": "https://example.com/rss"},
+            tg_urls={},
+        )
+        session.add_all([news, news_task])
+        await session.commit()
+        return news.id, news_task.id
+
+
+@pytest.mark.anyio
+async def test_add_positive_news_is_stored(database) -> None:
+    """Test that positives are added through the database writer."""
+    news_id, news_task_id = await _add_news_and_task(database)
+
+    await add_positive_news(news_id=news_id, news_task_id=news_task_id)
+
+    async with database() as session:
+        positives = await session.scalar(
+            select(NewsTask.positives).where(NewsTask.id == news_task_id),
+        )
+    assert [item["link"] for item in positives] == [
+        "https://example.com/news/relevant",
+    ]
+
+
+@pytest.mark.anyio
+async def test_news_consumer_delivers_relevant_news(database) -> None:
+    """Test one relevant news item from claim to queued message."""
+    news_id, news_task_id = await _add_news_and_task(database)
+
+    with (
+        patch.object(
+            news_consumer_module,
+            "process_news",
+            AsyncMock(return_value=True),
+        ),
+        patch.object(
+            telegram_user_crud,
+            "get_subscribed_chat_ids",
+            AsyncMock(return_value=[123456789]),
+        ),
+        patch.object(
+            news_consumer_module,
+            "queue_task_message",
+            AsyncMock(),
+        ) as mock_queue,
+        patch.object(news_consumer_module.article_prefetcher, "schedule"),
+    ):
+        await news_consumer()
+
+    mock_queue.assert_called_once()
+    assert mock_queue.call_args.kwargs["news_id"] == news_id
+    async with database() as session:
+        news = await session.get(News, news_id)
+        news_task = await session.get(NewsTask, news_task_id)
+    assert news.processed
+    assert [item["link"] for item in news_task.positives] == [news.link]
+
+
 @pytest.mark.anyio
 async def test_news_consumer_no_unprocessed_news():
     """Test news consumer when there are no unprocessed news items."""
-    with patch.object(crud_news, 'get_unprocessed_news', return_value=[]):
+    with patch.object(crud_news, 'claim_unprocessed_news', return_value=[]):
         with patch.object(news_task_crud, 'get_active_tasks', return_value=[]):
             with patch.object(
                 crud_prompt,
@@ -196,7 +335,7 @@ async def test_news_consumer_with_relevant_news(
     active_tasks = [sample_news_task]
 
     with patch.object(
-        crud_news, 'get_unprocessed_news', return_value=unprocessed_news
+        crud_news, 'claim_unprocessed_news', return_value=unprocessed_news
     ):
         with patch.object(
             news_task_crud, 'get_active_tasks', return_value=active_tasks
@@ -236,7 +375,7 @@ async def test_news_consumer_with_not_relevant_news(
     active_tasks = [sample_news_task]
 
     with patch.object(
-        crud_news, 'get_unprocessed_news', return_value=unprocessed_news
+        crud_news, 'claim_unprocessed_news', return_value=unprocessed_news
     ):
         with patch.object(
             news_task_crud, 'get_active_tasks', return_value=active_tasks
@@ -1,17 +1,22 @@
+import uuid
 from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocketException
+from fastapi_users.db import SQLAlchemyUserDatabase
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ai_news_bot.ai.records import NewsItem
 from ai_news_bot.db.crud.news_task import news_task_crud
-from ai_news_bot.db.models.users import User
+from ai_news_bot.db.models.users import User, UserManager, websocket_user
+from ai_news_bot.settings import settings
 from ai_news_bot.web.api.news_task.schema import (
     NewsTaskCreateSchema,
     NewsTaskUpdateSchema,
-    RSSItemSchema,
 )
 
 
@@ -92,7 +97,7 @@ async def test_news_crud(dbsession: AsyncSession, test_user: str) -> None:
     )
     assert edited_task.title == "Updated Task Title"
     # Test adding and retrieveing a false positive
-    false_positive = RSSItemSchema(
+    false_positive = NewsItem(
         title="False Positive",
         link="http://example.com/false-positive",
         description="This is a false positive news item.",
@@ -218,3 +223,107 @@ async def test_add_sources_to_news_task(
     )
     assert retrieved_task.rss_urls == rss_sources
     assert retrieved_task.tg_urls == tg_sources
+
+
+@pytest.mark.anyio
+async def test_news_task_load_profiles(
+    dbsession: AsyncSession,
+    test_user: str,
+) -> None:
+    """Test that light load profiles skip the heavy JSON columns."""
+    user = await dbsession.get(User, test_user)
+    created_task = await news_task_crud.create(
+        session=dbsession,
+        obj_in=NewsTaskCreateSchema(
+            title="Profiles Test Task",
+            description="This is a test task for load profiles",
+            end_date=(datetime.now() + timedelta(days=7)),
+        ),
+        user=user,
+    )
+    created_task.rss_urls = {"TechCrunch": "https://techcrunch.com/feed/"}
+    await dbsession.commit()
+    # Drop the fully loaded instance so the profiles hit the database.
+    dbsession.expunge_all()
+
+    tasks = await news_task_crud.get_all_objects(
+        session=dbsession,
+        load_profile="summary",
+    )
+    task = next(task for task in tasks if task.id == created_task.id)
+    assert task.title == "Profiles Test Task"
+    with pytest.raises(InvalidRequestError):
+        task.positives
+    with pytest.raises(InvalidRequestError):
+        task.rss_urls
+    dbsession.expunge_all()
+
+    task = await news_task_crud.get_object_by_id(
+        session=dbsession,
+        obj_id=created_task.id,
+        load_profile="sources",
+    )
+    assert task.rss_urls == {"TechCrunch": "https://techcrunch.com/feed/"}
+    with pytest.raises(InvalidRequestError):
+        task.false_positives
+
+    rows = await news_task_crud.get_field_values(dbsession, "id", "rss_urls")
+    assert (created_task.id, created_task.rss_urls) in [
+        tuple(row) for row in rows
+    ]
+
+    with pytest.raises(ValueError):
+        await news_task_crud.get_all_objects(
+            session=dbsession,
+            load_profile="unknown",
+        )
+
+
+@pytest.mark.anyio
+async def test_websocket_user_requires_valid_token(
+    dbsession: AsyncSession,
+    auth_headers: dict,
+) -> None:
+    """Test that WebSocket connections authenticate with the JWT."""
+    user_manager = UserManager(SQLAlchemyUserDatabase(dbsession, User))
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+
+    user = await websocket_user(
+        sec_websocket_protocol=f"bearer, {token}",
+        user_manager=user_manager,
+    )
+    assert user.email == settings.admin_email
+    for invalid in (None, token, "bearer, not-a-token", f"other, {token}"):
+        with pytest.raises(WebSocketException):
+            await websocket_user(
+                sec_websocket_protocol=invalid,
+                user_manager=user_manager,
+            )
+
+
+@pytest.mark.anyio
+async def test_get_task_ids_of_user(
+    dbsession: AsyncSession,
+    auth_headers: dict,
+) -> None:
+    """Test that only the user's own task IDs are returned."""
+    user = (
+        await dbsession.execute(
+            select(User).where(User.email == settings.admin_email),
+        )
+    ).scalar_one()
+    payload = NewsTaskCreateSchema(
+        title="Own Task",
+        description="Task of the user",
+        end_date=datetime.now() + timedelta(days=7),
+    )
+    task = await news_task_crud.create(dbsession, payload, user=user)
+
+    task_ids = await news_task_crud.get_task_ids(dbsession, user_id=user.id)
+    other_ids = await news_task_crud.get_task_ids(
+        dbsession,
+        user_id=uuid.uuid4(),
+    )
+
+    assert task.id in task_ids
+    assert other_ids == set()
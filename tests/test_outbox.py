@@ -0,0 +1,186 @@
+import asyncio
+import contextlib
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from ai_news_bot.db.crud.outbox import crud_outbox
+from ai_news_bot.db.models.outbox import OutboxMessage
+from ai_news_bot.db.writer import DatabaseWriter
+from ai_news_bot.telegram import outbox as outbox_module
+from ai_news_bot.telegram.delivery import DeliveryEngine
+from ai_news_bot.telegram.outbox import Outbox
+
+
+@pytest.fixture
+async def session_factory(_engine: AsyncEngine):
+    """Session factory committing like get_standalone_session does."""
+    maker = async_sessionmaker(_engine, expire_on_commit=False)
+
+    @contextlib.asynccontextmanager
+    async def factory():
+        async with maker() as session:
+            yield session
+            await session.commit()
+
+    writer = DatabaseWriter(session_factory=maker)
+    writer.start()
+    with patch.object(outbox_module, "db_writer", writer):
+        yield factory
+    await writer.stop()
+    async with factory() as session:
+        await session.execute(delete(OutboxMessage))
+
+
+async def _wait_for(condition, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for outbox"
+        await asyncio.sleep(0.01)
+
+
+def _start_engine(outbox: Outbox) -> DeliveryEngine:
+    engine = DeliveryEngine(
+        send=outbox.deliver,
+        on_drop=outbox.fail,
+        chat_rate=1000.0,
+    )
+    engine.start()
+    return engine
+
+
+@pytest.mark.anyio
+async def test_outbox_survives_restart(session_factory):
+    """Test that messages put before a restart are delivered after it."""
+    first = Outbox(send=None, session_factory=session_factory)
+    await first.put(chat_id=1, payload={"text": "one"})
+    await first.put(chat_id=1, payload={"text": "two"})
+    assert first.depth == 2
+
+    sent: list[str] = []
+
+    async def send(message: dict) -> None:
+        sent.append(message["text"])
+
+    restarted = Outbox(
+        send=send,
+        poll_interval=0.05,
+        session_factory=session_factory,
+    )
+    engine = _start_engine(restarted)
+    await restarted.start(engine)
+    try:
+        await _wait_for(lambda: len(sent) == 2 and restarted.depth == 0)
+    finally:
+        await restarted.stop()
+        await engine.stop()
+
+    assert sent == ["one", "two"]
+    async with session_factory() as session:
+        assert await crud_outbox.count_pending(session) == 0
+
+
+@pytest.mark.anyio
+async def test_outbox_retries_then_dead_letters(session_factory):
+    """Test that failing messages are retried and then dead-lettered."""
+    attempts: list[str] = []
+
+    async def send(message: dict) -> None:
+        attempts.append(message["text"])
+        raise RuntimeError("chat not found")
+
+    outbox = Outbox(
+        send=send,
+        max_attempts=3,
+        retry_backoff=0.01,
+        poll_interval=0.05,
+        session_factory=session_factory,
+    )
+    engine = _start_engine(outbox)
+    await outbox.start(engine)
+    try:
+        await outbox.put(chat_id=1, payload={"text": "doomed"})
+        await _wait_for(lambda: outbox.depth == 0)
+    finally:
+        await outbox.stop()
+        await engine.stop()
+
+    assert attempts == ["doomed"] * 3
+    async with session_factory() as session:
+        dead = await crud_outbox.get_dead_letters(session)
+    assert [message.payload["text"] for message in dead] == ["doomed"]
+    assert dead[0].attempts == 3
+    assert dead[0].last_error == "chat not found"
+
+
+@pytest.mark.anyio
+async def test_outbox_keeps_order_across_retries(session_factory):
+    """Test that a chat's next message waits for a failed one's retry."""
+    sent: list[str] = []
+    failed: list[str] = []
+
+    async def send(message: dict) -> None:
+        if message["text"] == "one" and not failed:
+            failed.append(message["text"])
+            raise RuntimeError("temporary failure")
+        sent.append(message["text"])
+
+    outbox = Outbox(
+        send=send,
+        retry_backoff=0.2,
+        poll_interval=0.05,
+        session_factory=session_factory,
+    )
+    await outbox.put(chat_id=1, payload={"text": "one"})
+    await outbox.put(chat_id=1, payload={"text": "two"})
+    await outbox.put(chat_id=2, payload={"text": "other"})
+    engine = _start_engine(outbox)
+    await outbox.start(engine)
+    try:
+        await _wait_for(lambda: outbox.depth == 0)
+    finally:
+        await outbox.stop()
+        await engine.stop()
+
+    assert failed == ["one"]
+    assert [text for text in sent if text != "other"] == ["one", "two"]
+    # Other chats aren't held up by the retry.
+    assert sent[0] == "other"
+
+
+@pytest.mark.anyio
+async def test_outbox_backpressure(session_factory):
+    """Test that a full outbox makes producers wait."""
+    sent: list[str] = []
+
+    async def send(message: dict) -> None:
+        sent.append(message["text"])
+
+    outbox = Outbox(send=send, max_depth=1, session_factory=session_factory)
+    await outbox.put(chat_id=1, payload={"text": "one"})
+    assert outbox.is_full
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            outbox.put(chat_id=1, payload={"text": "two"}),
+            timeout=0.1,
+        )
+
+    async with session_factory() as session:
+        (message,) = await crud_outbox.get_due(
+            session=session,
+            limit=1,
+            exclude_ids=set(),
+        )
+    await outbox.deliver(
+        {**message.payload, "chat_id": 1, "outbox_id": message.id},
+    )
+    assert sent == ["one"]
+    assert not outbox.is_full
+    await asyncio.wait_for(
+        outbox.put(chat_id=1, payload={"text": "two"}),
+        timeout=1.0,
+    )
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ai_news_bot.db.crud.news import crud_news
+from ai_news_bot.db.crud.news_stage import crud_news_stage
+from ai_news_bot.db.crud.news_task import news_task_crud
+from ai_news_bot.db.crud.telegram import telegram_user_crud
+
+# Plan line of SQLite reading a whole table without an index.
+FULL_SCAN_RE = re.compile(r"^SCAN (TABLE )?\w+$")
+
+HOT_QUERIES = {
+    "claim_unprocessed_news": lambda session: (
+        crud_news.claim_unprocessed_news(session)
+    ),
+    "count_unprocessed": lambda session: (
+        crud_news.count_unprocessed(session)
+    ),
+    "get_first_times": lambda session: crud_news_stage.get_first_times(
+        session,
+        [1, 2],
+        stage="inserted",
+    ),
+    "get_existing_links": lambda session: crud_news.get_existing_links(
+        session,
+        ["https://example.com/news"],
+    ),
+    "get_all_chat_ids": lambda session: telegram_user_crud.get_all_chat_ids(
+        session,
+        task_id=1,
+    ),
+    "get_active_tasks": lambda session: news_task_crud.get_active_tasks(
+        session,
+        load_profile="sources",
+    ),
+}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("query", HOT_QUERIES)
+async def test_hot_query_uses_index(
+    query: str,
+    _engine: AsyncEngine,
+    dbsession: AsyncSession,
+) -> None:
+    """Test that a hot query doesn't fall back to a full table scan."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        await HOT_QUERIES[query](dbsession)
+    finally:
+        event.remove(_engine.sync_engine, "before_cursor_execute", record)
+
+    assert statements
+    connection = await dbsession.connection()
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}",
+            parameters,
+        )
+        plan = [row[-1] for row in result.all()]
+        scans = [line for line in plan if FULL_SCAN_RE.match(line)]
+        assert not scans, f"{query} scans a table: {plan}"
@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.web.api.news_task.schema import RSSItemSchema
+
+
+def test_news_item_json_round_trip() -> None:
+    """Test that items survive the outbox and read older payloads."""
+    item = NewsItem(
+        title="Title",
+        link="https://example.com/1",
+        description="Description",
+        pub_date=datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc),
+        source_name="Source",
+        language="en",
+    )
+
+    assert NewsItem.from_json(item.as_json()) == item
+    # Stored by RSSItemSchema before the items were introduced.
+    schema = RSSItemSchema(**item.as_dict())
+    assert NewsItem.from_json(schema.model_dump(mode="json")) == item
+    assert RSSItemSchema(**item.as_json()) == schema
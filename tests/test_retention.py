@@ -0,0 +1,142 @@
+import gzip
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from ai_news_bot.db.archive import archive_path, write_archive
+from ai_news_bot.db.models.article_cache import ArticleCache
+from ai_news_bot.db.models.news import News
+from ai_news_bot.db.models.news_task import NewsTask
+from ai_news_bot.db.retention import NewsRetention
+from ai_news_bot.db.writer import DatabaseWriter
+
+
+@pytest.fixture
+async def session_factory(_engine: AsyncEngine):
+    """Session factory on the test database, cleaning up after."""
+    maker = async_sessionmaker(_engine, expire_on_commit=False)
+    yield maker
+    async with maker() as session:
+        await session.execute(delete(ArticleCache))
+        await session.execute(delete(News))
+        await session.execute(delete(NewsTask))
+        await session.commit()
+
+
+def _news(n: int, pub_date: datetime) -> News:
+    return News(
+        title=f"News {n}",
+        link=f"https://example.com/retention/{n}",
+        description="<p>Description</p>",
+        pub_date=pub_date,
+        source_name="Source",
+    )
+
+
+@pytest.mark.anyio
+async def test_old_news_is_archived_and_deleted(session_factory, tmp_path):
+    """Test that old news moves to daily archives, except positives."""
+    now = datetime.now()
+    old_day = now - timedelta(days=40)
+    older_day = now - timedelta(days=41)
+    async with session_factory() as session:
+        session.add_all(
+            [
+                _news(1, old_day),
+                _news(2, old_day),
+                _news(3, older_day),
+                _news(4, old_day),
+                _news(5, now),
+            ],
+        )
+        session.add(
+            NewsTask(
+                title="Task",
+                description="Task",
+                user_id=uuid.uuid4(),
+                positives=[{"link": "https://example.com/retention/4"}],
+                rss_urls={},
+                tg_urls={},
+            ),
+        )
+        await session.commit()
+
+    retention = NewsRetention(
+        retention_days=30,
+        archive_dir=tmp_path,
+        batch_size=2,
+        pause=0,
+        session_factory=session_factory,
+        writer=DatabaseWriter(session_factory=session_factory),
+    )
+    deleted = await retention.run()
+
+    assert deleted == 3
+    async with session_factory() as session:
+        result = await session.execute(select(News.title).order_by(News.id))
+        assert result.scalars().all() == ["News 4", "News 5"]
+
+    with gzip.open(archive_path(tmp_path, old_day.date()), "rt") as file:
+        archived = [json.loads(line) for line in file]
+    assert [row["title"] for row in archived] == ["News 1", "News 2"]
+    assert archived[0]["description"] == "<p>Description</p>"
+    assert archived[0]["pub_date"] == old_day.isoformat()
+    with gzip.open(archive_path(tmp_path, older_day.date()), "rt") as file:
+        assert [json.loads(line)["title"] for line in file] == ["News 3"]
+
+
+@pytest.mark.anyio
+async def test_cached_articles_are_pruned(session_factory, tmp_path):
+    """Test that cached articles go with their news or once old."""
+    now = datetime.now()
+    old_day = now - timedelta(days=40)
+    async with session_factory() as session:
+        session.add_all([_news(1, old_day), _news(2, now)])
+        session.add_all(
+            [
+                # Cached recently for news that is deleted now.
+                ArticleCache(
+                    link="https://example.com/retention/1",
+                    content=b"1",
+                ),
+                ArticleCache(
+                    link="https://example.com/retention/2",
+                    content=b"2",
+                ),
+                # Cached long ago, its news is gone already.
+                ArticleCache(
+                    link="https://example.com/retention/3",
+                    content=b"3",
+                    created_at=old_day,
+                ),
+            ],
+        )
+        await session.commit()
+
+    retention = NewsRetention(
+        retention_days=30,
+        archive_dir=tmp_path,
+        pause=0,
+        session_factory=session_factory,
+        writer=DatabaseWriter(session_factory=session_factory),
+    )
+    assert await retention.run() == 1
+
+    async with session_factory() as session:
+        result = await session.execute(select(ArticleCache.link))
+        assert result.scalars().all() == ["https://example.com/retention/2"]
+
+
+@pytest.mark.anyio
+async def test_archives_are_appended(tmp_path):
+    """Test that a second run adds to the archive of the same day."""
+    day = datetime(2026, 1, 1, 12)
+    write_archive(tmp_path, [{"id": 1, "pub_date": day}])
+    write_archive(tmp_path, [{"id": 2, "pub_date": day}])
+
+    with gzip.open(archive_path(tmp_path, day.date()), "rt") as file:
+        assert [json.loads(line)["id"] for line in file] == [1, 2]
@@ -1,10 +1,13 @@
+import time
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ai_news_bot.db.crud.telegram import telegram_user_crud
+from ai_news_bot.db.crud.telegram import TelegramUserCRUD, telegram_user_crud
+from ai_news_bot.db.models.telegram import TelegramUser as TelegramUserModel
 from ai_news_bot.db.crud.news_task import news_task_crud
 from ai_news_bot.telegram.schemas import TelegramUser
 from ai_news_bot.db.models.users import User
@@ -49,6 +52,7 @@ async def test_telegram_user_crud(
         tg_chat_id=new_user.tg_chat_id,
         task=created_task,
     )
+    await dbsession.commit()
     assert created_task in updated_user.tasks
 
     chat_ids = await telegram_user_crud.get_all_chat_ids(
@@ -57,6 +61,13 @@ async def test_telegram_user_crud(
     )
     assert new_user.tg_chat_id in chat_ids
 
+    # The cached fan-out map follows subscribe/unsubscribe
+    await telegram_user_crud.warm_subscribers(dbsession)
+    assert await telegram_user_crud.get_subscribed_chat_ids(
+        session=dbsession,
+        task_id=created_task.id,
+    ) == [new_user.tg_chat_id]
+
     # Test removing a task from a user
     updated_user = await telegram_user_crud.remove_task_from_user(
         session=dbsession,
@@ -64,7 +75,62 @@ async def test_telegram_user_crud(
         tg_chat_id=new_user.tg_chat_id,
         task=created_task,
     )
+    # The map only changes once the write is committed
+    assert await telegram_user_crud.get_subscribed_chat_ids(
+        session=dbsession,
+        task_id=created_task.id,
+    ) == [new_user.tg_chat_id]
+    await dbsession.commit()
     assert created_task not in updated_user.tasks
+    assert await telegram_user_crud.get_subscribed_chat_ids(
+        session=dbsession,
+        task_id=created_task.id,
+    ) == []
+
+    # Resubscribing updates the map without another warm-up
+    await telegram_user_crud.add_task_to_user(
+        session=dbsession,
+        tg_id=new_user.tg_id,
+        tg_chat_id=new_user.tg_chat_id,
+        task=created_task,
+    )
+    await dbsession.commit()
+    assert await telegram_user_crud.get_subscribed_chat_ids(
+        session=dbsession,
+        task_id=created_task.id,
+    ) == [new_user.tg_chat_id]
+
+    # Deleting the session drops its subscriptions
+    assert await telegram_user_crud.delete_session(
+        session=dbsession,
+        tg_id=new_user.tg_id,
+        tg_chat_id=new_user.tg_chat_id,
+    )
+    await dbsession.commit()
+    assert await telegram_user_crud.get_subscribed_chat_ids(
+        session=dbsession,
+        task_id=created_task.id,
+    ) == []
+
+
+@pytest.mark.anyio
+async def test_subscriber_map_expires(dbsession: AsyncSession) -> None:
+    """Tests that the subscriber map is reloaded once it is too old."""
+    crud = TelegramUserCRUD(TelegramUserModel, subscribers_ttl=60.0)
+    warm_ups = 0
+
+    async def warm_subscribers(session: AsyncSession) -> None:
+        nonlocal warm_ups
+        warm_ups += 1
+        crud._subscribers = {1: {warm_ups}}
+        crud._warmed_at = time.monotonic()
+
+    with patch.object(crud, "warm_subscribers", warm_subscribers):
+        assert await crud.get_subscribed_chat_ids(dbsession, 1) == [1]
+        assert await crud.get_subscribed_chat_ids(dbsession, 1) == [1]
+        # Another process may have changed subscriptions since.
+        crud._warmed_at -= 60.0
+        assert await crud.get_subscribed_chat_ids(dbsession, 1) == [2]
 
 
 @pytest.mark.anyio
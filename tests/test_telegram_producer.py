@@ -2,12 +2,12 @@ import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 
+from ai_news_bot.ai.records import NewsItem
 from ai_news_bot.ai.telegram_producer import (
     get_messages_from_telegram_channel,
     get_tg_client,
     telegram_producer,
 )
-from ai_news_bot.web.api.news_task.schema import RSSItemSchema
 
 
 def create_mock_client_with_messages(messages):
@@ -77,7 +77,7 @@ async def test_get_messages_from_telegram_channel_success():
         )
 
         assert len(result) == 2
-        assert all(isinstance(item, RSSItemSchema) for item in result)
+        assert all(isinstance(item, NewsItem) for item in result)
         assert result[0].title == "Test message 1"
         assert result[0].link == "https://t.me/test_channel/1"
         assert result[1].title == "Test message 2"
@@ -137,7 +137,7 @@ async def test_get_messages_from_telegram_channel_no_text():
 async def test_telegram_producer_success():
     """Test the main telegram_producer function."""
     mock_news_items = [
-        RSSItemSchema(
+        NewsItem(
             title="Test News",
             description="Test description",
             link="https://t.me/channel/1",
@@ -204,7 +204,7 @@ async def test_telegram_producer_no_channels():
 async def test_telegram_producer_with_exception():
     """Test telegram_producer handles exceptions gracefully."""
     mock_news_items = [
-        RSSItemSchema(
+        NewsItem(
             title="Test News",
             description="Test description",
             link="https://t.me/channel/1",
@@ -0,0 +1,156 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ai_news_bot.ai.records import NewsItem
+from ai_news_bot.db.crud.news_stage import crud_news_stage
+from ai_news_bot.db.models.news import News
+from ai_news_bot.db.models.news_stage import NewsStage
+from ai_news_bot.services.timeline import (
+    Stage,
+    explain,
+    seconds_between,
+    stage_row,
+)
+from ai_news_bot.telegram import bot
+
+PUBLISHED = datetime(2026, 1, 1, 12, 0)
+
+
+def _stages(news_id: int = 1) -> list[NewsStage]:
+    offsets = [
+        (Stage.FETCHED, None, 300),
+        (Stage.INSERTED, None, 301),
+        (Stage.CLASSIFIED, 1, 320),
+        (Stage.CLASSIFIED, 2, 330),
+        (Stage.QUEUED, 1, 321),
+        (Stage.DELIVERED, 1, 400),
+        (Stage.DELIVERED, 1, 500),
+    ]
+    return [
+        NewsStage(
+            **stage_row(
+                news_id,
+                stage,
+                PUBLISHED + timedelta(seconds=offset),
+                task_id,
+            ),
+        )
+        for stage, task_id, offset in offsets
+    ]
+
+
+def test_explain_breaks_latency_down_per_task() -> None:
+    """Test that every task gets its steps from publication on."""
+    first, second = explain(PUBLISHED, _stages())
+
+    assert first["task_id"] == 1
+    assert [
+        (step["stage"], step["seconds"]) for step in first["steps"]
+    ] == [
+        ("fetched", 300),
+        ("inserted", 1),
+        ("classified", 19),
+        ("queued", 1),
+        ("delivered", 79),
+    ]
+    assert first["total_seconds"] == 400
+    assert first["slowest"] == "fetched"
+    assert second["task_id"] == 2
+    assert [step["stage"] for step in second["steps"]] == [
+        "fetched",
+        "inserted",
+        "classified",
+    ]
+    assert second["total_seconds"] == 330
+
+
+def test_seconds_between_mixed_time_zones() -> None:
+    """Test that aware publication dates compare to local timestamps."""
+    published = datetime.now(timezone.utc) - timedelta(minutes=5)
+    seconds = seconds_between(published, datetime.now())
+    assert 299 < seconds < 301
+    assert seconds_between(datetime.now(), published) == 0
+
+
+@pytest.mark.anyio
+async def test_news_timeline_endpoint(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    auth_headers: dict,
+) -> None:
+    """Test that superusers get the timeline of a news item."""
+    news = News(
+        title="Timeline",
+        description="",
+        link="https://example.com/timeline",
+        pub_date=PUBLISHED,
+        source_name="Source",
+    )
+    dbsession.add(news)
+    await dbsession.flush()
+    await crud_news_stage.add_many(
+        dbsession,
+        [
+            {
+                "news_id": news.id,
+                "task_id": stage.task_id,
+                "stage": stage.stage,
+                "at": stage.at,
+            }
+            for stage in _stages(news.id)
+        ],
+    )
+    url = fastapi_app.url_path_for("get_news_timeline", news_id=news.id)
+
+    response = await client.get(url, headers=auth_headers)
+    missing = await client.get(
+        fastapi_app.url_path_for("get_news_timeline", news_id=news.id + 1),
+        headers=auth_headers,
+    )
+    anonymous = await client.get(url)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["stages"]) == 7
+    assert [task["slowest"] for task in body["tasks"]] == [
+        "fetched",
+        "fetched",
+    ]
+    assert missing.status_code == 404
+    assert anonymous.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_delivery_record_cant_fail_the_send() -> None:
+    """Test that a message is sent once if recording its delivery fails."""
+    news = NewsItem("Title", "https://example.com/1", "Text", PUBLISHED)
+    # Queued before queued_at was added to payloads.
+    message = {
+        "chat_id": 1,
+        "text": "Text",
+        "task_id": "1",
+        "news": news.as_json(),
+        "translatable": False,
+        "news_id": 1,
+    }
+    with (
+        patch.object(
+            bot,
+            "send_task_message",
+            AsyncMock(return_value=10),
+        ) as send,
+        patch.object(bot.logger, "error") as error,
+    ):
+        await bot.deliver_message(message)
+        await asyncio.gather(*bot.delivery_records)
+
+    send.assert_awaited_once()
+    error.assert_called_once()
+    assert not bot.delivery_records
@@ -0,0 +1,151 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ai_news_bot.ai import translation
+from ai_news_bot.ai.article_cache import CachedArticle
+from ai_news_bot.ai.translation import (
+    translate_article,
+    translate_news,
+    translation_key,
+)
+from ai_news_bot.ai.utils import TranslateResponseSchema
+from ai_news_bot.db.models.news import News
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_caches():
+    """Start every test with empty translation caches."""
+    translation.news_translations.clear()
+    translation.article_translations.clear()
+    yield
+    translation.news_translations.clear()
+    translation.article_translations.clear()
+
+
+async def run_intent(intent):
+    """Stand-in for the database writer, running the intent at once."""
+    return await intent(MagicMock())
+
+
+@pytest.fixture
+def sample_news():
+    """Create a sample news item for testing."""
+    return News(
+        id=1,
+        title="Test News Title",
+        link="https://example.com/news/1",
+        description="This is a test news description",
+        pub_date=datetime.now(timezone.utc),
+        processed=False,
+        source_name="Test Source",
+    )
+
+
+def test_translation_key_tracks_content(sample_news):
+    """Test that the key changes when the news content changes."""
+    key = translation_key(sample_news)
+    assert key == translation_key(sample_news)
+    sample_news.description = "Updated description"
+    assert key != translation_key(sample_news)
+
+
+@pytest.mark.anyio
+async def test_translate_news_is_memoized(sample_news):
+    """Test that a news item is sent to the AI only once."""
+    response = TranslateResponseSchema(
+        title="Заголовок",
+        description="Описание",
+    )
+    with patch.object(
+        translation.translation_batcher,
+        "translate",
+        AsyncMock(return_value=response),
+    ) as mock_request, patch.object(
+        translation.crud_news, "save_translation", AsyncMock()
+    ) as mock_save, patch.object(
+        translation.db_writer, "submit", run_intent
+    ):
+        first = await translate_news(sample_news)
+        second = await translate_news(sample_news)
+
+    assert first == second
+    assert "Заголовок" in first
+    mock_request.assert_called_once()
+    mock_save.assert_called_once()
+    assert mock_save.call_args[1]["translation_key"] == (
+        translation_key(sample_news)
+    )
+
+
+@pytest.mark.anyio
+async def test_translate_news_uses_stored_translation(sample_news):
+    """Test that a translation stored with the row is reused."""
+    sample_news.translation = "Сохранённый перевод"
+    sample_news.translation_key = translation_key(sample_news)
+    with patch.object(
+        translation.translation_batcher, "translate", AsyncMock()
+    ) as mock_request:
+        result = await translate_news(sample_news)
+
+    assert result == "Сохранённый перевод"
+    mock_request.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_translate_news_failure_not_memoized(sample_news):
+    """Test that failed translations are retried next time."""
+    with patch.object(
+        translation.translation_batcher,
+        "translate",
+        AsyncMock(return_value=None),
+    ) as mock_request:
+        assert await translate_news(sample_news) is None
+        assert await translate_news(sample_news) is None
+
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_translate_article_served_from_cache():
+    """Test that the translate button doesn't refetch a cached article."""
+    article = CachedArticle(
+        url="https://example.com/news/1",
+        title="Title",
+        text="Full text",
+    )
+    response = TranslateResponseSchema(title="Заголовок", description="Текст")
+    with patch.object(
+        translation, "get_article", AsyncMock(return_value=article)
+    ) as mock_fetch, patch.object(
+        translation, "get_stored_translation", AsyncMock(return_value=None)
+    ), patch.object(
+        translation, "save_translation", AsyncMock()
+    ) as mock_save, patch.object(
+        translation, "get_ai_api_key", AsyncMock(return_value="key")
+    ), patch.object(
+        translation, "request_translation", AsyncMock(return_value=response)
+    ):
+        first = await translate_article("https://example.com/news/1")
+        second = await translate_article("https://example.com/news/1/")
+
+    assert first == second
+    mock_fetch.assert_called_once()
+    mock_save.assert_called_once_with("https://example.com/news/1", first)
+
+
+@pytest.mark.anyio
+async def test_translate_article_uses_stored_translation():
+    """Test that a prefetched translation skips extraction and the AI."""
+    with patch.object(
+        translation,
+        "get_stored_translation",
+        AsyncMock(return_value="Готовый перевод"),
+    ), patch.object(
+        translation, "get_article", AsyncMock()
+    ) as mock_fetch:
+        result = await translate_article("https://example.com/news/1")
+
+    assert result == "Готовый перевод"
+    mock_fetch.assert_not_called()
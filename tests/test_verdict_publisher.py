@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from redis.asyncio import ConnectionPool, Redis
+
+from ai_news_bot.db.models.news import News
+from ai_news_bot.db.models.news_task import NewsTask
+from ai_news_bot.services.redis.publisher import VerdictPublisher
+from ai_news_bot.services.redis.schema import RedisNewsMessageSchema
+
+
+def _news(n: int) -> News:
+    return News(
+        id=n,
+        title=f"Новость {n}",
+        link=f"https://example.com/{n}",
+        description="<p>Long description</p>" * 100,
+        pub_date=datetime(2026, 1, 1, 12, n),
+        source_name="Source",
+    )
+
+
+async def _read(pubsub, count: int, timeout: float = 0.5) -> list[str]:
+    messages = []
+    deadline = asyncio.get_running_loop().time() + timeout
+    while (
+        len(messages) < count
+        and asyncio.get_running_loop().time() < deadline
+    ):
+        message = await pubsub.get_message(
+            ignore_subscribe_messages=True,
+            timeout=0.05,
+        )
+        if message is not None:
+            messages.append(message["data"].decode())
+    return messages
+
+
+@pytest.mark.anyio
+async def test_verdicts_are_published_compactly(
+    fake_redis_pool: ConnectionPool,
+) -> None:
+    """Test that verdicts are published compactly to the task channel."""
+    publisher = VerdictPublisher(channel="test_verdicts")
+    publisher.start(fake_redis_pool)
+    task = NewsTask(id=7, title="Task")
+    async with Redis(connection_pool=fake_redis_pool) as redis:
+        async with redis.pubsub() as pubsub:
+            await pubsub.subscribe("test_verdicts:task:7")
+            for n in range(3):
+                publisher.add(_news(n), task, result=n % 2 == 0)
+            await publisher.flush()
+            messages = await _read(pubsub, 3)
+
+    parsed = [
+        RedisNewsMessageSchema.model_validate_json(message)
+        for message in messages
+    ]
+    assert [message.news.id for message in parsed] == [0, 1, 2]
+    assert [message.task.result for message in parsed] == [True, False, True]
+    assert parsed[0].news.title == "Новость 0"
+    assert parsed[0].task.id == 7
+    assert "description" not in messages[0]
+
+
+@pytest.mark.anyio
+async def test_flush_waits_until_due(fake_redis_pool: ConnectionPool) -> None:
+    """Test that an unforced flush keeps a small, fresh buffer."""
+    publisher = VerdictPublisher(
+        channel="test_verdicts",
+        max_events=2,
+        max_delay=60,
+    )
+    publisher.start(fake_redis_pool)
+    task = NewsTask(id=1, title="Task")
+    async with Redis(connection_pool=fake_redis_pool) as redis:
+        async with redis.pubsub() as pubsub:
+            await pubsub.subscribe("test_verdicts:task:1")
+            publisher.add(_news(1), task, result=True)
+            await publisher.flush(force=False)
+            assert await _read(pubsub, 1) == []
+            publisher.add(_news(2), task, result=True)
+            await publisher.flush(force=False)
+            assert len(await _read(pubsub, 2)) == 2
+
+
+@pytest.mark.anyio
+async def test_verdicts_are_dropped_until_started() -> None:
+    """Test that nothing is buffered without Redis."""
+    publisher = VerdictPublisher()
+    publisher.add(_news(1), NewsTask(id=1, title="Task"), result=True)
+    await asyncio.wait_for(publisher.flush(), 1)
+    assert publisher._events == []